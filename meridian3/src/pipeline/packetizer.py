@@ -97,6 +97,12 @@ import json
 import time
 
 
+# Nominal footer allowance added to packet_size. The footer is a JSON dict,
+# not fixed-width fields, so this is not its serialized length: it stands
+# for a binary frame's 16-byte checksum + 8-byte transmission time.
+FOOTER_SIZE = 24
+
+
 class Packetizer:
     """
     Encodes telemetry frames into transmission packets.
@@ -144,7 +150,9 @@ class Packetizer:
                 Expected keys: timestamp, frame_id, sensor readings, etc.
 
         Returns:
-            Encoded packet with header, payload, and footer
+            Encoded packet with header, payload, and footer. The header's
+            packet_size is the serialized header+payload length plus the
+            nominal FOOTER_SIZE allowance (it used to exclude the footer).
 
         Teaching Note:
             The packet structure mirrors real spacecraft telemetry protocols
@@ -194,12 +202,18 @@ class Packetizer:
         payload = self._encode_payload(frame)
 
         # ═══════════════════════════════════════════════════════════════
-        # STEP 4: Calculate packet size
+        # STEP 4: Serialize header and payload once
         # ═══════════════════════════════════════════════════════════════
-        # In real systems, size affects transmission time and power cost.
-        # We estimate size via JSON serialization (not exact, but representative).
+        # The same canonical bytes are used for both the size estimate and
+        # the checksum. packet_size is deliberately NOT part of these bytes:
+        # it is derived from them, so including it would force a second
+        # serialization after the size is known.
+
+        wire_core = self._serialize_core(header, payload)
 
-        packet_size = self._estimate_size(header, payload)
+        # In real systems, size affects transmission time and power cost.
+        # JSON length is not exact, but representative.
+        packet_size = len(wire_core) + FOOTER_SIZE
         header['packet_size'] = packet_size
 
         # ═══════════════════════════════════════════════════════════════
@@ -208,7 +222,7 @@ class Packetizer:
         # Checksums help receivers detect if packet was corrupted during
         # transmission. Real systems use CRC or stronger algorithms.
 
-        checksum = self._calculate_checksum(header, payload)
+        checksum = self._calculate_checksum(wire_core)
 
         # ═══════════════════════════════════════════════════════════════
         # STEP 6: Build footer with validation data
@@ -327,39 +341,37 @@ class Packetizer:
         else:
             raise ValueError(f"Unknown encoding: {self.encoding}")
 
-    def _estimate_size(self, header: dict, payload: dict) -> int:
+    def _serialize_core(self, header: dict, payload: dict) -> bytes:
         """
-        Estimate packet size in bytes.
+        Serialize header and payload into canonical bytes.
 
         Args:
-            header: Packet header dictionary
+            header: Packet header (packet_size is ignored if present)
             payload: Packet payload dictionary
 
         Returns:
-            Estimated size in bytes
+            UTF-8 encoded JSON with sorted keys
 
         Teaching Note:
-            Size estimation helps simulate bandwidth constraints.
-            We use JSON serialization as a proxy for actual packet size.
-            Real protocols (CCSDS, binary formats) are more compact but
-            harder to debug. JSON is human-readable and good for teaching.
+            These bytes are the "checksummed region" of the packet. Sorting
+            keys makes the encoding deterministic, so sender and receiver
+            produce identical bytes from identical content. The packet_size
+            field is excluded because it is computed FROM these bytes - a
+            corrupted size is caught by the length check in verify_checksum().
         """
-        # Serialize to JSON and measure length
-        # This is an approximation - real binary encoding would be smaller
+        header_core = {k: v for k, v in header.items() if k != 'packet_size'}
         combined = {
-            'header': header,
+            'header': header_core,
             'payload': payload,
         }
-        json_string = json.dumps(combined)
-        return len(json_string.encode('utf-8'))
+        return json.dumps(combined, sort_keys=True).encode('utf-8')
 
-    def _calculate_checksum(self, header: dict, payload: dict) -> str:
+    def _calculate_checksum(self, wire_core: bytes) -> str:
         """
         Calculate checksum for error detection.
 
         Args:
-            header: Packet header
-            payload: Packet payload
+            wire_core: Canonical header+payload bytes from _serialize_core()
 
         Returns:
             Hex string checksum
@@ -373,17 +385,8 @@ class Packetizer:
             We use SHA256 for simplicity and good error detection.
             In production, CRC-16 or CRC-32 would be more appropriate.
         """
-        # Combine header and payload into canonical string
-        combined = {
-            'header': header,
-            'payload': payload,
-        }
-
-        # Serialize to JSON (sorted keys for consistency)
-        canonical_string = json.dumps(combined, sort_keys=True)
-
         # Calculate SHA256 hash
-        hash_object = hashlib.sha256(canonical_string.encode('utf-8'))
+        hash_object = hashlib.sha256(wire_core)
         checksum = hash_object.hexdigest()[:16]  # Use first 16 chars (64 bits)
 
         return checksum
@@ -412,8 +415,16 @@ class Packetizer:
             >>> packet['payload']['telemetry']['battery_soc'] = 999  # Corrupt data
             >>> assert not packetizer.verify_checksum(packet)  # Now invalid
         """
+        wire_core = self._serialize_core(packet['header'], packet['payload'])
+
+        # Length sanity check: packet_size lives outside the checksummed
+        # region, so a corrupted size shows up as a length mismatch
+        packet_size = packet['header'].get('packet_size')
+        if packet_size is not None and packet_size != len(wire_core) + FOOTER_SIZE:
+            return False
+
         # Recalculate checksum from header and payload
-        calculated = self._calculate_checksum(packet['header'], packet['payload'])
+        calculated = self._calculate_checksum(wire_core)
 
         # Compare with stored checksum
         stored = packet['footer']['checksum']
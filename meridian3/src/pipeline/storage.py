@@ -22,7 +22,8 @@ THEORY:
         3. Schema Design: Structure for time-series telemetry
             - Normalized: Separate tables for different data types
             - Denormalized: Single table with all fields (simpler)
-            - We use denormalized for teaching simplicity
+            - We use denormalized for teaching simplicity: the full frame
+              is kept as a BLOB, with hot fields copied into typed columns
 
         4. Data Integrity: Ensure data correctness
             - Foreign keys: Maintain relationships
@@ -87,6 +88,7 @@ STORAGE ARCHITECTURE DIAGRAM:
     ║  │  • get_latest(n)                               │         ║
     ║  │  • get_anomalies(severity)                     │         ║
     ║  │  • export_mission(format)                      │         ║
+    ║  │  • backup(dest_path)                           │         ║
     ║  └────────────────────────────────────────────────┘         ║
     ║                                                              ║
     ╚══════════════════════════════════════════════════════════════╝
@@ -136,17 +138,122 @@ FUTURE EXTENSIONS:
     4. Implement incremental backups
     5. Add data retention and cleanup policies
     6. Support multiple concurrent missions
-    7. Add full-text search on anomaly descriptions
 """
 
 import sqlite3
 import json
 import os
-from typing import Dict, Any, List, Optional
-from collections import deque
+import queue
+import re
+import threading
+import zlib
+from typing import Dict, Any, Iterator, List, Optional
+from collections import OrderedDict, deque
+from itertools import islice
 from pathlib import Path
 import time
 
+try:
+    # Optional: orjson parses JSON several times faster than the stdlib
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+# Rows pulled per fetchmany() call when decoding query results
+FETCH_BATCH_SIZE = 1000
+
+
+# frame_data BLOB layout: one format-version byte followed by the body.
+# The version byte lets future codecs coexist with rows already on disk.
+FRAME_FORMAT_JSON = 1       # UTF-8 JSON
+FRAME_FORMAT_JSON_ZLIB = 2  # zlib-compressed UTF-8 JSON
+
+
+def _encode_frame_data(frame: dict, compression_level: int = 0) -> bytes:
+    """
+    Serialize a frame into the versioned frame_data BLOB.
+
+    Args:
+        frame: Telemetry frame to serialize
+        compression_level: zlib level 1-9, or 0 for no compression
+
+    Returns:
+        Format-version byte followed by the encoded frame
+    """
+    body = json.dumps(frame).encode('utf-8')
+    if compression_level:
+        return bytes((FRAME_FORMAT_JSON_ZLIB,)) + zlib.compress(body, compression_level)
+    return bytes((FRAME_FORMAT_JSON,)) + body
+
+
+def _frame_json_bytes(frame_data) -> bytes:
+    """
+    Return the JSON document inside a frame_data value, without parsing it.
+
+    Args:
+        frame_data: BLOB from the telemetry table (or TEXT from databases
+            created before frame_data was versioned)
+
+    Returns:
+        UTF-8 encoded JSON text of the frame
+    """
+    if isinstance(frame_data, str):
+        # Legacy row: plain JSON text
+        return frame_data.encode('utf-8')
+
+    version = frame_data[0]
+    if version == FRAME_FORMAT_JSON:
+        return frame_data[1:]
+    if version == FRAME_FORMAT_JSON_ZLIB:
+        return zlib.decompress(frame_data[1:])
+
+    raise ValueError(f"Unknown frame_data format version: {version}")
+
+
+def _decode_frame_data(frame_data) -> dict:
+    """
+    Deserialize a frame_data value written by _encode_frame_data().
+
+    Args:
+        frame_data: BLOB from the telemetry table (or TEXT from databases
+            created before frame_data was versioned)
+
+    Returns:
+        Telemetry frame dictionary
+    """
+    return _json_loads(_frame_json_bytes(frame_data))
+
+
+# Telemetry fields stored as typed REAL columns alongside the frame BLOB.
+# These are the fields dashboards and trend analysis query directly, so
+# reading them never requires deserializing the whole frame.
+TELEMETRY_COLUMNS = (
+    'battery_soc',
+    'battery_voltage',
+    'battery_current',
+    'battery_temp',
+    'solar_voltage',
+    'solar_current',
+    'cpu_temp',
+    'motor_temp',
+    'chassis_temp',
+    'roll',
+    'pitch',
+    'heading',
+    'x',
+    'y',
+    'z',
+    'velocity',
+)
+
+
+def _column_value(value) -> Optional[float]:
+    """Return value if it can be bound to a REAL column, else None."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return None
+
 
 class MissionStorage:
     """
@@ -156,7 +263,48 @@ class MissionStorage:
     for performance.
     """
 
-    def __init__(self, db_path: str, cache_size: int = 100):
+    _INSERT_TELEMETRY_SQL = f"""
+        INSERT INTO telemetry
+        (id, mission_id, timestamp, frame_id, frame_data, quality, has_anomalies, created_at,
+         {', '.join(TELEMETRY_COLUMNS)})
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?{', ?' * len(TELEMETRY_COLUMNS)})
+    """
+
+    _INSERT_ANOMALY_SQL = """
+        INSERT INTO anomalies
+        (telemetry_id, timestamp, field, anomaly_type, severity, description)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+
+    _SELECT_ANOMALIES_SQL = """
+        SELECT a.*, t.timestamp, t.frame_id
+        FROM anomalies a
+        JOIN telemetry t ON a.telemetry_id = t.id
+        WHERE t.mission_id = ? AND (? IS NULL OR a.severity = ?)
+        ORDER BY a.timestamp DESC
+        LIMIT ?
+    """
+
+    # Background writer limits: queued store calls before store_frame()
+    # blocks, and rows written per transaction
+    _WRITE_QUEUE_SIZE = 10000
+    _WRITE_BATCH_ROWS = 500
+    _WRITE_BATCH_SECONDS = 0.05
+
+    def __init__(
+        self,
+        db_path: str,
+        cache_size: int = 100,
+        flush_interval: int = 100,
+        flush_seconds: float = 1.0,
+        busy_timeout_ms: int = 30000,
+        page_cache_kib: int = 65536,
+        mmap_size: int = 268435456,
+        wal_autocheckpoint: int = 1000,
+        optimize_interval: float = 900.0,
+        frame_compression: int = 0,
+        background_writes: bool = False
+    ):
         """
         Initialize storage with database connection.
 
@@ -170,6 +318,44 @@ class MissionStorage:
                 - Smaller: Less memory usage
                 - Default: 100 frames
 
+            flush_interval: Commit after this many store_frame() calls
+                - 1: Commit every frame (maximum durability, slowest)
+                - Larger: Fewer fsyncs, more frames at risk on a crash
+                - Default: 100 frames
+                Uncommitted frames hold the database write lock, so other
+                connections writing to the same file wait (up to
+                busy_timeout_ms) until this one flushes. Use 1, or call
+                flush() when idle, if several writers share a file.
+
+            flush_seconds: Also commit when this much wall-clock time has
+                passed since the last commit, so a slow trickle of frames
+                is still made durable promptly (default 1.0 s)
+
+            busy_timeout_ms: How long to wait for a lock held by another
+                connection before raising "database is locked" (default 30 s)
+
+            page_cache_kib: SQLite page cache size in KiB (default 64 MiB)
+
+            mmap_size: Bytes of the database file to memory-map for reads
+                (default 256 MiB, 0 disables memory-mapped I/O)
+
+            wal_autocheckpoint: WAL pages before SQLite checkpoints the log
+                back into the main database file (default 1000)
+
+            optimize_interval: Seconds between PRAGMA optimize runs, which
+                refresh query planner statistics (default 15 minutes)
+
+            frame_compression: zlib level (1-9) applied to stored frames
+                - 0: No compression, fastest writes and reads (default)
+                - 1: Cheap compression, noticeably smaller WAL traffic
+                - Higher: Smaller files, more CPU per frame
+
+            background_writes: Insert and commit on a dedicated writer
+                thread (default False)
+                - False: store_frame() writes on the caller's thread
+                - True: store_frame() only queues rows, so the pipeline
+                  never waits on disk; queries wait for queued rows first
+
         Teaching Note:
             SQLite is embedded - no separate server needed. The database
             is just a file. This simplifies deployment but means only
@@ -178,16 +364,53 @@ class MissionStorage:
         """
         self.db_path = db_path
         self.cache_size = cache_size
+        self.flush_interval = max(1, flush_interval)
+        self.flush_seconds = flush_seconds
+        self.busy_timeout_ms = busy_timeout_ms
+        self.page_cache_kib = page_cache_kib
+        self.mmap_size = mmap_size
+        self.wal_autocheckpoint = wal_autocheckpoint
+        self.optimize_interval = optimize_interval
+        self.frame_compression = frame_compression
 
         # In-memory cache for recent frames
         self.frame_cache = deque(maxlen=cache_size)
 
+        # Recent frames of one mission keyed by timestamp, oldest first.
+        # Holds every stored row between its first and last key, so
+        # query_frames() can answer ranges inside it without SQL.
+        self._ts_cache = OrderedDict()
+        self._ts_cache_mission = None
+
+        # Anomaly records from the same frames, oldest first. Covers every
+        # anomaly the mission has since the timestamp cache last started.
+        self._anomaly_cache = deque(maxlen=cache_size * 4)
+
         # Ensure parent directory exists
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
         # Initialize database connection
         self._init_database()
 
+        # Deferred-commit bookkeeping (see flush())
+        self._pending_frames = 0
+        self._last_commit = time.monotonic()
+        self._last_optimize = self._last_commit
+
+        # Next telemetry row id for the open write transaction on self.conn
+        # (see _insert_rows())
+        self._next_telemetry_id = None
+
+        # Optional writer thread (see _writer_loop())
+        self._write_queue = None
+        self._writer_error = None
+        if background_writes:
+            self._write_queue = queue.Queue(maxsize=self._WRITE_QUEUE_SIZE)
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop, name='mission-storage-writer', daemon=True
+            )
+            self._writer_thread.start()
+
         # Statistics tracking
         self.stats = {
             'frames_stored': 0,
@@ -210,46 +433,70 @@ class MissionStorage:
             existing tables.
         """
         # Connect to database
-        self.conn = sqlite3.connect(self.db_path)
+        # Teaching: isolation_level='IMMEDIATE' makes the implicit BEGIN take
+        # the write lock up front, so a batch never fails halfway through
+        # because another writer grabbed the lock first.
+        # cached_statements: sqlite3 keeps compiled statements keyed by SQL
+        # text, so the INSERT/SELECT strings below are parsed only once.
+        self.conn = sqlite3.connect(
+            self.db_path,
+            isolation_level='IMMEDIATE',
+            cached_statements=256
+        )
         self.conn.row_factory = sqlite3.Row  # Access columns by name
 
-        # Configure for performance and durability
-        cursor = self.conn.cursor()
+        # One long-lived cursor for all short statements - avoids allocating
+        # a new cursor object for every frame stored or query executed
+        self._cursor = self.conn.cursor()
+        self._cursor.arraysize = FETCH_BATCH_SIZE
 
-        # Enable Write-Ahead Logging for concurrent readers
-        # Teaching: WAL allows reads while writing, critical for live display
-        cursor.execute("PRAGMA journal_mode=WAL")
-
-        # Synchronous=NORMAL: Balance between speed and safety
-        # Teaching: FULL is slower but safer, OFF is faster but risky
-        cursor.execute("PRAGMA synchronous=NORMAL")
+        # Configure for performance and durability
+        self._configure_connection(self.conn)
+        cursor = self._cursor
 
         # Create telemetry table
-        cursor.execute("""
+        # Teaching: The frame BLOB keeps the complete record; the typed
+        # columns duplicate the hot fields so queries and aggregates
+        # (AVG, MIN, MAX) run in SQL without parsing any frames.
+        cursor.execute(f"""
             CREATE TABLE IF NOT EXISTS telemetry (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 mission_id TEXT,
                 timestamp REAL NOT NULL,
                 frame_id INTEGER,
-                frame_data TEXT NOT NULL,  -- JSON serialized frame
+                frame_data BLOB NOT NULL,  -- Versioned serialized frame
                 quality TEXT,
                 has_anomalies INTEGER,
-                created_at REAL NOT NULL
+                created_at REAL NOT NULL,
+                {', '.join(f'{column} REAL' for column in TELEMETRY_COLUMNS)}
             )
         """)
 
-        # Create index on timestamp for fast time-range queries
-        # Teaching: Indexes speed up WHERE clauses but slow down INSERT
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_telemetry_timestamp
-            ON telemetry(timestamp)
+        # Databases created before the typed columns existed get them added
+        existing = {row['name'] for row in cursor.execute("PRAGMA table_info(telemetry)")}
+        for column in TELEMETRY_COLUMNS:
+            if column not in existing:
+                cursor.execute(f"ALTER TABLE telemetry ADD COLUMN {column} REAL")
+
+        # Composite index for per-mission time-range and latest-N queries
+        # Teaching: Indexes speed up WHERE clauses but slow down INSERT.
+        # Declaring timestamp DESC matches get_latest()'s ORDER BY, so the
+        # newest rows are the first entries in the index. Range queries
+        # (ORDER BY timestamp ASC) use the same index scanned in reverse.
+        # The typed columns ride along in the index ("covering index"), so
+        # query_fields() and get_latest_fields() never visit the table.
+        # frame_data is deliberately left out - it would double the
+        # database size for the one query that needs it.
+        cursor.execute(f"""
+            CREATE INDEX IF NOT EXISTS idx_telemetry_latest_cover
+            ON telemetry(mission_id, timestamp DESC, {', '.join(TELEMETRY_COLUMNS)})
         """)
 
-        # Create index on mission_id for multi-mission support
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_telemetry_mission
-            ON telemetry(mission_id, timestamp)
-        """)
+        # Superseded by idx_telemetry_latest_cover - every query filters
+        # on mission_id, so these only added write cost
+        cursor.execute("DROP INDEX IF EXISTS idx_telemetry_timestamp")
+        cursor.execute("DROP INDEX IF EXISTS idx_telemetry_mission")
+        cursor.execute("DROP INDEX IF EXISTS idx_telemetry_mission_ts_desc")
 
         # Create anomalies table for quick anomaly queries
         cursor.execute("""
@@ -265,10 +512,16 @@ class MissionStorage:
             )
         """)
 
+        # Newest-first anomaly index: get_anomalies() walks it from the
+        # top, checks severity per row, and stops once LIMIT rows match
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_anomalies_severity
-            ON anomalies(severity, timestamp)
+            CREATE INDEX IF NOT EXISTS idx_anomalies_ts_desc
+            ON anomalies(timestamp DESC)
         """)
+        cursor.execute("DROP INDEX IF EXISTS idx_anomalies_severity")
+        cursor.execute("DROP INDEX IF EXISTS idx_anomalies_severity_ts_desc")
+
+        self._init_anomaly_search(cursor)
 
         # Create missions metadata table
         cursor.execute("""
@@ -283,6 +536,112 @@ class MissionStorage:
 
         self.conn.commit()
 
+    def _init_anomaly_search(self, cursor: sqlite3.Cursor):
+        """
+        Create the full-text index over anomaly descriptions.
+
+        Args:
+            cursor: Cursor on the connection being initialized
+
+        Teaching Note:
+            FTS5 keeps an inverted index (word -> rows), so a search looks
+            up the word instead of running LIKE '%word%' over every row.
+            It is an "external content" table: the text lives only in
+            anomalies, and triggers keep the index in step with it.
+            Some SQLite builds omit FTS5; search_anomalies() then falls
+            back to LIKE.
+        """
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'anomalies_fts'"
+        ).fetchone() is not None
+
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS anomalies_fts
+                USING fts5(description, content='anomalies', content_rowid='id')
+            """)
+        except sqlite3.OperationalError:
+            self._anomaly_fts = False
+            return
+        self._anomaly_fts = True
+
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS anomalies_fts_insert
+            AFTER INSERT ON anomalies BEGIN
+                INSERT INTO anomalies_fts(rowid, description)
+                VALUES (new.id, new.description);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS anomalies_fts_delete
+            AFTER DELETE ON anomalies BEGIN
+                INSERT INTO anomalies_fts(anomalies_fts, rowid, description)
+                VALUES ('delete', old.id, old.description);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS anomalies_fts_update
+            AFTER UPDATE ON anomalies BEGIN
+                INSERT INTO anomalies_fts(anomalies_fts, rowid, description)
+                VALUES ('delete', old.id, old.description);
+                INSERT INTO anomalies_fts(rowid, description)
+                VALUES (new.id, new.description);
+            END
+        """)
+
+        if not exists:
+            # Index anomalies stored before the search table existed
+            cursor.execute("INSERT INTO anomalies_fts(anomalies_fts) VALUES ('rebuild')")
+
+    def _configure_connection(self, conn: sqlite3.Connection):
+        """
+        Apply the PRAGMA tuning set to a connection.
+
+        Args:
+            conn: SQLite connection to configure
+
+        Teaching Note:
+            PRAGMAs are per-connection settings (except journal_mode, which
+            is stored in the database file). Every connection that touches
+            the database should get the same configuration.
+        """
+        # Enable Write-Ahead Logging for concurrent readers
+        # Teaching: WAL allows reads while writing, critical for live display
+        conn.execute("PRAGMA journal_mode=WAL")
+
+        # Synchronous=NORMAL: Balance between speed and safety
+        # Teaching: FULL is slower but safer, OFF is faster but risky
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+        # Wait for locks instead of failing immediately with "database is locked"
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+
+        # Negative cache_size is in KiB rather than pages
+        conn.execute(f"PRAGMA cache_size={-int(self.page_cache_kib)}")
+
+        # Keep temporary tables and sort buffers in RAM
+        conn.execute("PRAGMA temp_store=MEMORY")
+
+        # Memory-mapped reads skip a copy through the page cache
+        conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+
+        conn.execute(f"PRAGMA wal_autocheckpoint={int(self.wal_autocheckpoint)}")
+
+    def _maybe_optimize(self):
+        """
+        Run PRAGMA optimize if optimize_interval has elapsed.
+
+        Teaching Note:
+            PRAGMA optimize re-analyzes only the tables whose statistics are
+            stale, so it is cheap to run periodically on a long-lived
+            connection and keeps the query planner picking good indexes as
+            the archive grows.
+        """
+        now = time.monotonic()
+        if now - self._last_optimize >= self.optimize_interval:
+            self.conn.execute("PRAGMA optimize")
+            self._last_optimize = now
+
     def store_frame(self, frame: dict, mission_id: str = "default"):
         """
         Store a telemetry frame to database.
@@ -298,74 +657,50 @@ class MissionStorage:
             tables. Trade-off: JSON is flexible but harder to query specific
             fields efficiently.
 
+            The transaction is NOT committed on every call. Committing forces
+            an fsync, which dominates the cost of a single-row insert. Instead
+            we commit every `flush_interval` frames or `flush_seconds` of wall
+            time, whichever comes first. Call flush() to force a commit.
+
         Example:
             >>> storage = MissionStorage("data/mission.db")
             >>> frame = detector.analyze_frame(clean_frame)
             >>> storage.store_frame(frame, mission_id="mars_2025")
         """
         # ═══════════════════════════════════════════════════════════════
-        # STEP 1: Extract metadata
-        # ═══════════════════════════════════════════════════════════════
-        timestamp = frame.get('timestamp', 0.0)
-        frame_id = frame.get('frame_id', -1)
-        quality = frame.get('metadata', {}).get('quality', 'unknown')
-        anomalies = frame.get('metadata', {}).get('anomalies', [])
-        has_anomalies = 1 if anomalies else 0
-
-        # ═══════════════════════════════════════════════════════════════
-        # STEP 2: Serialize frame to JSON
+        # STEP 1-2: Extract metadata and serialize frame to JSON
         # ═══════════════════════════════════════════════════════════════
-        # Teaching: JSON is human-readable and flexible, but larger than
-        # binary formats. For teaching purposes, readability wins.
-        frame_json = json.dumps(frame)
-        frame_bytes = len(frame_json.encode('utf-8'))
+        telemetry_row, anomaly_rows, frame_bytes = self._build_rows(frame, mission_id)
+        self._cache_by_timestamp(frame, mission_id)
 
         # ═══════════════════════════════════════════════════════════════
         # STEP 3: Insert into database
         # ═══════════════════════════════════════════════════════════════
-        cursor = self.conn.cursor()
-
-        cursor.execute("""
-            INSERT INTO telemetry
-            (mission_id, timestamp, frame_id, frame_data, quality, has_anomalies, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
-            mission_id,
-            timestamp,
-            frame_id,
-            frame_json,
-            quality,
-            has_anomalies,
-            time.time()
-        ))
-
-        telemetry_id = cursor.lastrowid
-
-        # ═══════════════════════════════════════════════════════════════
-        # STEP 4: Store anomalies in separate table
-        # ═══════════════════════════════════════════════════════════════
-        # Teaching: Separate table allows efficient anomaly queries without
-        # parsing JSON. Normalization trade-off: more tables, faster queries.
-        for anomaly in anomalies:
-            cursor.execute("""
-                INSERT INTO anomalies
-                (telemetry_id, timestamp, field, anomaly_type, severity, description)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                telemetry_id,
-                timestamp,
-                anomaly.get('field', ''),
-                anomaly.get('type', ''),
-                anomaly.get('severity', ''),
-                anomaly.get('description', '')
-            ))
+        if self._write_queue is not None:
+            # Background mode: the writer thread inserts and commits these
+            # rows on its own connection (blocks only if the queue is full)
+            self._queue_write([(telemetry_row, anomaly_rows)])
+        else:
+            # ═══════════════════════════════════════════════════════════
+            # STEP 4: Store anomalies in separate table
+            # ═══════════════════════════════════════════════════════════
+            # Teaching: Separate table allows efficient anomaly queries without
+            # parsing JSON. Normalization trade-off: more tables, faster queries.
+            # _insert_rows() writes both, linking anomalies to the frame's id.
+            self._next_telemetry_id = self._insert_rows(
+                self._cursor, [(telemetry_row, anomaly_rows)], self._next_telemetry_id
+            )
 
-        # ═══════════════════════════════════════════════════════════════
-        # STEP 5: Commit transaction
-        # ═══════════════════════════════════════════════════════════════
-        # Teaching: Commit ensures data is durable (survives crashes).
-        # Without commit, data stays in memory and could be lost.
-        self.conn.commit()
+            # ═══════════════════════════════════════════════════════════
+            # STEP 5: Commit transaction (deferred)
+            # ═══════════════════════════════════════════════════════════
+            # Teaching: Commit ensures data is durable (survives crashes).
+            # Batching commits trades a small durability window for far
+            # fewer fsyncs.
+            self._pending_frames += 1
+            if (self._pending_frames >= self.flush_interval or
+                    time.monotonic() - self._last_commit >= self.flush_seconds):
+                self.flush()
 
         # ═══════════════════════════════════════════════════════════════
         # STEP 6: Update cache
@@ -378,6 +713,323 @@ class MissionStorage:
         self.stats['frames_stored'] += 1
         self.stats['total_bytes_written'] += frame_bytes
 
+    def store_frames(self, frames: List[dict], mission_id: str = "default"):
+        """
+        Store many telemetry frames in a single transaction.
+
+        Args:
+            frames: Telemetry frames to archive (same structure as store_frame)
+            mission_id: Identifier for this mission
+
+        Teaching Note:
+            This is the bulk-load path. All rows are bound up front and
+            handed to executemany(), so SQLite parses each INSERT once and
+            the whole batch costs a single commit. For replaying a recorded
+            mission this is orders of magnitude faster than one commit per
+            frame.
+
+        Example:
+            >>> storage.store_frames(labeled_frames, mission_id="mars_2025")
+        """
+        rows = []
+        total_bytes = 0
+
+        for frame in frames:
+            telemetry_row, anomaly_rows, frame_bytes = self._build_rows(frame, mission_id)
+            self._cache_by_timestamp(frame, mission_id)
+            rows.append((telemetry_row, anomaly_rows))
+            total_bytes += frame_bytes
+
+        if not rows:
+            return
+
+        if self._write_queue is not None:
+            self._queue_write(rows)
+        else:
+            self._next_telemetry_id = self._insert_rows(
+                self._cursor, rows, self._next_telemetry_id
+            )
+            self.flush()
+
+        self.frame_cache.extend(frames)
+
+        self.stats['frames_stored'] += len(rows)
+        self.stats['total_bytes_written'] += total_bytes
+
+    def _cache_by_timestamp(self, frame: dict, mission_id: str):
+        """
+        Add a frame to the timestamp cache, which must be called before the
+        frame's row is inserted.
+
+        Args:
+            frame: Telemetry frame being stored
+            mission_id: Identifier for this mission
+
+        Teaching Note:
+            The cache is only useful if it is gap-free: a range it covers
+            must contain every matching row in the database. Frames arrive
+            in timestamp order, so appending keeps it sorted and evicting
+            from the front keeps it contiguous. Anything else (a new
+            mission, a timestamp that goes backwards, a database that
+            already has later rows) restarts it.
+        """
+        timestamp = frame.get('timestamp', 0.0)
+        cache = self._ts_cache
+
+        if (mission_id != self._ts_cache_mission or
+                (cache and timestamp <= next(reversed(cache)))):
+            cache.clear()
+            self._anomaly_cache.clear()
+            self._ts_cache_mission = None
+
+            self._wait_for_writer()
+            self._cursor.execute(
+                "SELECT 1 FROM telemetry WHERE mission_id = ? AND timestamp >= ? LIMIT 1",
+                (mission_id, timestamp)
+            )
+            if self._cursor.fetchone() is not None:
+                # Rows at or after this timestamp aren't cached; try again
+                # with the next frame
+                return
+            self._ts_cache_mission = mission_id
+
+        cache[timestamp] = frame
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
+        for anomaly in frame.get('metadata', {}).get('anomalies', []):
+            self._anomaly_cache.append({
+                'timestamp': timestamp,
+                'frame_id': frame.get('frame_id', -1),
+                'field': anomaly.get('field', ''),
+                'type': anomaly.get('type', ''),
+                'severity': anomaly.get('severity', ''),
+                'description': anomaly.get('description', ''),
+            })
+
+    def _build_rows(self, frame: dict, mission_id: str):
+        """
+        Convert a frame into bound parameter tuples for the INSERT statements.
+
+        Args:
+            frame: Telemetry frame to archive
+            mission_id: Identifier for this mission
+
+        Returns:
+            Tuple of (telemetry_row, anomaly_rows, frame_bytes). The row id
+            is left out of both: _insert_rows() prepends it.
+        """
+        metadata = frame.get('metadata', {})
+        timestamp = frame.get('timestamp', 0.0)
+        anomalies = metadata.get('anomalies', [])
+
+        # Teaching: JSON is human-readable and flexible, but larger than
+        # binary formats. Storing it as a BLOB with a version byte keeps it
+        # readable while leaving room for denser codecs later.
+        frame_data = _encode_frame_data(frame, self.frame_compression)
+        frame_bytes = len(frame_data)
+
+        data = frame.get('data', {})
+        telemetry_row = (
+            mission_id,
+            timestamp,
+            frame.get('frame_id', -1),
+            frame_data,
+            metadata.get('quality', 'unknown'),
+            1 if anomalies else 0,
+            time.time(),
+            *[_column_value(data.get(column)) for column in TELEMETRY_COLUMNS],
+        )
+
+        anomaly_rows = [
+            (
+                timestamp,
+                anomaly.get('field', ''),
+                anomaly.get('type', ''),
+                anomaly.get('severity', ''),
+                anomaly.get('description', ''),
+            )
+            for anomaly in anomalies
+        ]
+
+        return telemetry_row, anomaly_rows, frame_bytes
+
+    def _insert_rows(self, cursor: sqlite3.Cursor, rows: List[tuple],
+                     next_id: Optional[int] = None) -> int:
+        """
+        Insert _build_rows() output inside a write transaction.
+
+        Args:
+            cursor: Cursor on the connection to write with
+            rows: (telemetry_row, anomaly_rows) pairs, one per frame
+            next_id: Next free telemetry id, if this connection's write
+                transaction is already open and has inserted rows
+
+        Returns:
+            The next free telemetry id, to pass back in until commit
+
+        Teaching Note:
+            Telemetry ids are assigned here rather than read back from
+            cursor.lastrowid, so anomaly rows can reference their frame
+            without a round-trip (required for executemany batching).
+            The starting id is read from MAX(id) only after BEGIN
+            IMMEDIATE has taken the write lock: another connection may
+            have written to the file since our last commit, and nobody
+            else can insert until we commit.
+        """
+        if not cursor.connection.in_transaction:
+            cursor.execute("BEGIN IMMEDIATE")
+            next_id = None
+        if next_id is None:
+            next_id = cursor.execute(
+                "SELECT COALESCE(MAX(id), 0) FROM telemetry"
+            ).fetchone()[0] + 1
+
+        telemetry_rows = []
+        anomaly_rows = []
+        for telemetry_id, (telemetry_row, frame_anomaly_rows) in enumerate(rows, next_id):
+            telemetry_rows.append((telemetry_id, *telemetry_row))
+            anomaly_rows.extend((telemetry_id, *row) for row in frame_anomaly_rows)
+
+        cursor.executemany(self._INSERT_TELEMETRY_SQL, telemetry_rows)
+        if anomaly_rows:
+            cursor.executemany(self._INSERT_ANOMALY_SQL, anomaly_rows)
+        return next_id + len(telemetry_rows)
+
+    def flush(self):
+        """
+        Commit any frames written since the last commit.
+
+        Teaching Note:
+            Until flush() runs, stored frames are visible to this
+            connection's queries but not yet durable on disk. close()
+            always flushes, so a clean shutdown never loses data.
+
+            With background_writes, flush() instead blocks until the
+            writer thread has committed everything queued so far.
+        """
+        if self._write_queue is not None:
+            self._wait_for_writer()
+        else:
+            self.conn.commit()
+        self._pending_frames = 0
+        self._last_commit = time.monotonic()
+        self._maybe_optimize()
+
+    def _queue_write(self, item):
+        """
+        Hand a list of (telemetry_row, anomaly_rows) pairs to the writer thread.
+
+        Raises:
+            RuntimeError: If the writer thread has stopped, rather than
+                queueing rows that nothing will ever write
+        """
+        if not self._writer_thread.is_alive():
+            self._check_writer()
+        self._write_queue.put(item)
+
+    def _wait_for_writer(self):
+        """
+        Block until queued background writes are committed.
+
+        Raises:
+            sqlite3.Error: If the writer thread failed since the last call
+            RuntimeError: If the writer thread has stopped (the exception
+                that stopped it is chained as the cause)
+
+        Teaching Note:
+            A bare queue.join() would hang forever if the writer thread
+            died, since nothing would mark the queued rows done. So we
+            wait on the queue's own condition in short slices and check
+            that the writer is still alive between them.
+        """
+        write_queue = self._write_queue
+        if write_queue is None:
+            return
+
+        with write_queue.all_tasks_done:
+            while write_queue.unfinished_tasks and self._writer_thread.is_alive():
+                write_queue.all_tasks_done.wait(0.1)
+
+        self._check_writer()
+
+    def _check_writer(self):
+        """
+        Raise any error recorded by the writer thread.
+
+        Raises:
+            sqlite3.Error: If a batch failed since the last call
+            RuntimeError: If the writer thread has stopped
+        """
+        if not self._writer_thread.is_alive():
+            # The writer is gone for good, so keep reporting why
+            raise RuntimeError("background writer thread has stopped") from self._writer_error
+        if self._writer_error is not None:
+            error, self._writer_error = self._writer_error, None
+            raise error
+
+    def _writer_loop(self):
+        """
+        Drain the write queue on a dedicated connection.
+
+        Teaching Note:
+            sqlite3 connections belong to the thread that opened them, so
+            the writer opens its own. Rows are gathered until the batch
+            reaches _WRITE_BATCH_ROWS or _WRITE_BATCH_SECONDS pass, then
+            written with executemany() and one commit. WAL mode lets the
+            main connection keep reading while a batch is being written.
+        """
+        conn = None
+        try:
+            conn = sqlite3.connect(self.db_path, isolation_level='IMMEDIATE', cached_statements=256)
+            self._configure_connection(conn)
+            cursor = conn.cursor()
+            write_queue = self._write_queue
+            running = True
+
+            while running:
+                items = [write_queue.get()]
+                deadline = time.monotonic() + self._WRITE_BATCH_SECONDS
+                rows = 0 if items[0] is None else len(items[0])
+                while rows < self._WRITE_BATCH_ROWS and items[-1] is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = write_queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                    items.append(item)
+                    if item is not None:
+                        rows += len(item)
+
+                if items[-1] is None:
+                    # Sentinel from close(): write what we have, then stop
+                    running = False
+
+                batch = []
+                for item in items:
+                    if item is not None:
+                        batch.extend(item)
+
+                try:
+                    if batch:
+                        self._insert_rows(cursor, batch)
+                    conn.commit()
+                except sqlite3.Error as e:
+                    conn.rollback()
+                    self._writer_error = e
+                finally:
+                    for _ in items:
+                        write_queue.task_done()
+        except Exception as e:
+            # Anything else (including failing to open the connection)
+            # stops the writer; _check_writer() reports it from here on
+            self._writer_error = e
+        finally:
+            if conn is not None:
+                conn.close()
+
     def query_frames(
         self,
         start_time: float,
@@ -398,28 +1050,214 @@ class MissionStorage:
         Teaching Note:
             Time-range queries are common for telemetry. The timestamp
             index makes these queries fast (O(log n) seek + O(k) scan
-            where k is result size).
+            where k is result size). Ranges that fall inside the recent
+            frame cache are answered from memory instead.
 
         Example:
             >>> # Get all frames from first 10 minutes
             >>> frames = storage.query_frames(0.0, 600.0)
             >>> print(f"Found {len(frames)} frames")
         """
+        return list(self.query_frames_iter(start_time, end_time, mission_id))
+
+    def query_frames_iter(
+        self,
+        start_time: float,
+        end_time: float,
+        mission_id: str = "default"
+    ) -> Iterator[dict]:
+        """
+        Iterate over frames in a time range without building a list.
+
+        Args:
+            start_time: Start of time range (mission seconds)
+            end_time: End of time range (mission seconds)
+            mission_id: Mission identifier
+
+        Yields:
+            Telemetry frames in timestamp order
+
+        Teaching Note:
+            A generator only holds one fetch batch in memory, so scanning
+            a whole sol of telemetry costs the same memory as scanning a
+            minute. The query runs on its own cursor, so other storage
+            calls made while iterating don't disturb it.
+
+        Example:
+            >>> for frame in storage.query_frames_iter(0.0, 88775.0):
+            ...     plot(frame['timestamp'], frame['data']['battery_soc'])
+        """
         self.stats['queries_executed'] += 1
 
+        # Sliding-window queries over recent data never reach SQLite
+        cache = self._ts_cache
+        if (cache and mission_id == self._ts_cache_mission and
+                next(iter(cache)) <= start_time and end_time <= next(reversed(cache))):
+            self.stats['cache_hits'] += 1
+            # Snapshot first: the cache may change while the caller iterates
+            yield from [frame for timestamp, frame in cache.items()
+                        if start_time <= timestamp <= end_time]
+            return
+
+        self.stats['cache_misses'] += 1
+        self._wait_for_writer()
         cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT frame_data FROM telemetry
+        try:
+            cursor.execute("""
+                SELECT frame_data FROM telemetry
+                WHERE mission_id = ? AND timestamp >= ? AND timestamp <= ?
+                ORDER BY timestamp ASC
+            """, (mission_id, start_time, end_time))
+            yield from self._iter_frames(cursor)
+        finally:
+            cursor.close()
+
+    def _iter_frames(self, cursor: sqlite3.Cursor) -> Iterator[dict]:
+        """
+        Decode the frame_data column of an executed SELECT.
+
+        Args:
+            cursor: Cursor whose query selects frame_data first
+
+        Yields:
+            Telemetry frames, in row order
+
+        Teaching Note:
+            fetchmany() keeps at most one batch of raw rows alive while
+            they are decoded, instead of fetchall() holding every row
+            at once.
+        """
+        while True:
+            rows = cursor.fetchmany(FETCH_BATCH_SIZE)
+            if not rows:
+                return
+            for row in rows:
+                yield _decode_frame_data(row[0])
+
+    def query_fields(
+        self,
+        fields: List[str],
+        start_time: float,
+        end_time: float,
+        mission_id: str = "default"
+    ) -> List[dict]:
+        """
+        Retrieve selected telemetry fields in a time range.
+
+        Args:
+            fields: Names from TELEMETRY_COLUMNS (e.g. ['battery_soc'])
+            start_time: Start of time range (mission seconds)
+            end_time: End of time range (mission seconds)
+            mission_id: Mission identifier
+
+        Returns:
+            List of dicts with 'timestamp' plus each requested field
+
+        Teaching Note:
+            Unlike query_frames(), this reads typed columns directly - no
+            frame is deserialized. Plotting one field over a whole sol only
+            touches the bytes for that field.
+
+        Example:
+            >>> rows = storage.query_fields(['battery_soc'], 0.0, 3600.0)
+            >>> print(rows[0])  # {'timestamp': 0.0, 'battery_soc': 85.1}
+        """
+        columns = self._validate_fields(fields)
+        self.stats['queries_executed'] += 1
+
+        self._wait_for_writer()
+        cursor = self._cursor
+        cursor.execute(f"""
+            SELECT timestamp, {', '.join(columns)} FROM telemetry
             WHERE mission_id = ? AND timestamp >= ? AND timestamp <= ?
             ORDER BY timestamp ASC
         """, (mission_id, start_time, end_time))
 
-        frames = []
-        for row in cursor.fetchall():
-            frame = json.loads(row['frame_data'])
-            frames.append(frame)
+        return [dict(row) for row in cursor.fetchall()]
+
+    def get_latest_fields(
+        self,
+        fields: List[str],
+        n: int = 10,
+        mission_id: str = "default"
+    ) -> List[dict]:
+        """
+        Get selected fields from the N most recent frames.
+
+        Args:
+            fields: Names from TELEMETRY_COLUMNS (e.g. ['battery_soc'])
+            n: Number of frames to retrieve
+            mission_id: Mission identifier
+
+        Returns:
+            List of dicts with 'timestamp' plus each requested field
+            (newest first)
+
+        Teaching Note:
+            This is the dashboard version of get_latest(). Every column
+            it reads lives in idx_telemetry_latest_cover, so SQLite walks
+            N index entries and never reads a table page.
+        """
+        columns = self._validate_fields(fields)
+        self.stats['queries_executed'] += 1
+
+        self._wait_for_writer()
+        cursor = self._cursor
+        cursor.execute(f"""
+            SELECT timestamp, {', '.join(columns)} FROM telemetry
+            WHERE mission_id = ?
+            ORDER BY timestamp DESC
+            LIMIT ?
+        """, (mission_id, n))
+
+        return [dict(row) for row in cursor.fetchall()]
+
+    def get_field_average(
+        self,
+        field: str,
+        start_time: float,
+        end_time: float,
+        mission_id: str = "default"
+    ) -> Optional[float]:
+        """
+        Average a telemetry field over a time range using SQL.
+
+        Args:
+            field: Name from TELEMETRY_COLUMNS
+            start_time: Start of time range (mission seconds)
+            end_time: End of time range (mission seconds)
+            mission_id: Mission identifier
+
+        Returns:
+            Mean value, or None if no frames fall in the range
+
+        Example:
+            >>> storage.get_field_average('battery_temp', 0.0, 88775.0)
+            -12.4
+        """
+        column = self._validate_fields([field])[0]
+        self.stats['queries_executed'] += 1
+
+        self._wait_for_writer()
+        cursor = self._cursor
+        cursor.execute(f"""
+            SELECT AVG({column}) FROM telemetry
+            WHERE mission_id = ? AND timestamp >= ? AND timestamp <= ?
+        """, (mission_id, start_time, end_time))
+
+        return cursor.fetchone()[0]
 
-        return frames
+    def _validate_fields(self, fields: List[str]) -> List[str]:
+        """
+        Check field names against TELEMETRY_COLUMNS.
+
+        Column names cannot be bound as SQL parameters, so they are
+        whitelisted before being formatted into a query.
+        """
+        for field in fields:
+            if field not in TELEMETRY_COLUMNS:
+                raise ValueError(f"Unknown telemetry field: {field}")
+        return list(fields)
 
     def get_latest(self, n: int = 10, mission_id: str = "default") -> List[dict]:
         """
@@ -442,13 +1280,14 @@ class MissionStorage:
         # Try cache first if requesting all cached frames
         if n <= len(self.frame_cache):
             self.stats['cache_hits'] += 1
-            # Return last n frames from cache (newest first)
-            return list(self.frame_cache)[-n:][::-1]
+            # Walk the deque from the right end: O(n), not O(cache_size)
+            return list(islice(reversed(self.frame_cache), n))
 
         # Cache miss - query database
         self.stats['cache_misses'] += 1
 
-        cursor = self.conn.cursor()
+        self._wait_for_writer()
+        cursor = self._cursor
         cursor.execute("""
             SELECT frame_data FROM telemetry
             WHERE mission_id = ?
@@ -456,12 +1295,7 @@ class MissionStorage:
             LIMIT ?
         """, (mission_id, n))
 
-        frames = []
-        for row in cursor.fetchall():
-            frame = json.loads(row['frame_data'])
-            frames.append(frame)
-
-        return frames
+        return list(self._iter_frames(cursor))
 
     def get_anomalies(
         self,
@@ -484,42 +1318,115 @@ class MissionStorage:
             Separate anomalies table allows efficient queries without
             scanning all telemetry. This is a classic denormalization
             trade-off: duplicate data for faster queries.
+
+            Live dashboards poll this constantly. If the newest `limit`
+            matches are all in the anomaly cache, no SQL runs at all.
         """
         self.stats['queries_executed'] += 1
 
-        cursor = self.conn.cursor()
+        if mission_id == self._ts_cache_mission:
+            cached = [
+                dict(record) for record in islice(
+                    (record for record in reversed(self._anomaly_cache)
+                     if not severity or record['severity'] == severity),
+                    limit
+                )
+            ]
+            if len(cached) >= limit:
+                self.stats['cache_hits'] += 1
+                return cached
+
+        self.stats['cache_misses'] += 1
+        self._wait_for_writer()
+        cursor = self._cursor
+
+        # One statement for both cases: a NULL severity disables the filter,
+        # so only one prepared statement sits in the cache
+        severity = severity or None
+        cursor.execute(self._SELECT_ANOMALIES_SQL, (mission_id, severity, severity, limit))
+
+        return [self._anomaly_record(row) for row in cursor.fetchall()]
+
+    def search_anomalies(
+        self,
+        query: str,
+        limit: int = 100,
+        mission_id: str = "default"
+    ) -> List[dict]:
+        """
+        Find anomalies whose description matches a full-text query.
+
+        Args:
+            query: Plain words, e.g. 'battery' or 'motor overheat'. Every
+                word must appear in the description (case-insensitive).
+                Punctuation and quotes only separate words, and FTS5
+                operators such as AND/OR are searched as ordinary words.
+            limit: Maximum number of anomalies to return
+            mission_id: Mission identifier
+
+        Returns:
+            List of anomaly records (same shape as get_anomalies()),
+            newest first
+
+        Teaching Note:
+            The query is never handed to MATCH as-is: FTS5 has its own
+            query language, so user text like 'battery-low' would be
+            parsed as a column filter and raise. Each word is quoted as
+            an FTS5 string instead. Without FTS5 the same words become
+            LIKE patterns, which also match inside longer words.
+
+        Example:
+            >>> storage.search_anomalies('voltage')
+            [{'timestamp': 812.0, 'description': 'Battery voltage low', ...}]
+        """
+        self.stats['queries_executed'] += 1
+
+        words = re.findall(r'\w+', query)
+        if not words:
+            return []
 
-        if severity:
+        self._wait_for_writer()
+        cursor = self._cursor
+
+        if self._anomaly_fts:
+            # '"battery" "low"': every word, none read as FTS5 syntax
+            match = ' '.join(f'"{word}"' for word in words)
             cursor.execute("""
                 SELECT a.*, t.timestamp, t.frame_id
-                FROM anomalies a
+                FROM anomalies_fts f
+                JOIN anomalies a ON a.id = f.rowid
                 JOIN telemetry t ON a.telemetry_id = t.id
-                WHERE t.mission_id = ? AND a.severity = ?
+                WHERE anomalies_fts MATCH ? AND t.mission_id = ?
                 ORDER BY a.timestamp DESC
                 LIMIT ?
-            """, (mission_id, severity, limit))
+            """, (match, mission_id, limit))
         else:
-            cursor.execute("""
+            # No FTS5 in this SQLite build: substring scan, one LIKE per
+            # word ('_' is a LIKE wildcard and \w matches it, so escape it)
+            conditions = ' AND '.join(["a.description LIKE ? ESCAPE '\\'"] * len(words))
+            patterns = ['%' + word.replace('_', '\\_') + '%' for word in words]
+            cursor.execute(f"""
                 SELECT a.*, t.timestamp, t.frame_id
                 FROM anomalies a
                 JOIN telemetry t ON a.telemetry_id = t.id
-                WHERE t.mission_id = ?
+                WHERE {conditions} AND t.mission_id = ?
                 ORDER BY a.timestamp DESC
                 LIMIT ?
-            """, (mission_id, limit))
-
-        anomalies = []
-        for row in cursor.fetchall():
-            anomalies.append({
-                'timestamp': row['timestamp'],
-                'frame_id': row['frame_id'],
-                'field': row['field'],
-                'type': row['anomaly_type'],
-                'severity': row['severity'],
-                'description': row['description'],
-            })
+            """, (*patterns, mission_id, limit))
 
-        return anomalies
+        return [self._anomaly_record(row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def _anomaly_record(row: sqlite3.Row) -> dict:
+        """Convert an anomalies/telemetry join row to an anomaly record."""
+        return {
+            'timestamp': row['timestamp'],
+            'frame_id': row['frame_id'],
+            'field': row['field'],
+            'type': row['anomaly_type'],
+            'severity': row['severity'],
+            'description': row['description'],
+        }
 
     def export_mission(
         self,
@@ -541,29 +1448,75 @@ class MissionStorage:
                 - Platform-independent format
                 - Easy import to other tools
             Trade-off: Larger files than binary formats.
+
+            The file is written incrementally rather than built with
+            json.dump(), so exporting a multi-million-frame archive does
+            not need the whole mission in memory. For disaster recovery
+            prefer backup(), which copies database pages without
+            touching the JSON at all.
         """
         if format != "json":
             raise ValueError(f"Unsupported format: {format}")
 
-        cursor = self.conn.cursor()
-        cursor.execute("""
+        self._wait_for_writer()
+        cursor = self._cursor
+        cursor.execute(
+            "SELECT COUNT(*) FROM telemetry WHERE mission_id = ?", (mission_id,)
+        )
+        frame_count = cursor.fetchone()[0]
+
+        # Stream rows straight to disk. frame_data already holds the JSON
+        # text of each frame, so export is concatenation - no decode or
+        # re-encode, and memory stays bounded to one fetch batch.
+        rows = self.conn.cursor()
+        rows.arraysize = FETCH_BATCH_SIZE
+        rows.execute("""
             SELECT frame_data FROM telemetry
             WHERE mission_id = ?
             ORDER BY timestamp ASC
         """, (mission_id,))
 
-        frames = []
-        for row in cursor.fetchall():
-            frame = json.loads(row['frame_data'])
-            frames.append(frame)
+        with open(output_path, 'wb') as f:
+            header = json.dumps({'mission_id': mission_id, 'frame_count': frame_count})
+            f.write(header[:-1].encode('utf-8') + b', "frames": [')
+
+            separator = b''
+            for (frame_data,) in rows:
+                f.write(separator)
+                f.write(_frame_json_bytes(frame_data))
+                separator = b', '
+
+            f.write(b']}')
+
+        rows.close()
+
+    def backup(self, dest_path: str, pages: int = 1024):
+        """
+        Write a consistent snapshot of the whole database to another file.
+
+        Args:
+            dest_path: Path of the snapshot database (overwritten if present)
+            pages: Pages copied per step; between steps other connections
+                may use the source database
+
+        Teaching Note:
+            SQLite's online backup API copies B-tree pages as-is, so a
+            snapshot runs at disk speed instead of re-serializing every
+            frame. Pending frames are flushed first so the snapshot
+            includes everything stored so far. The result is an ordinary
+            database that MissionStorage can open directly.
+
+        Example:
+            >>> storage.backup("backups/mission_sol_42.db")
+        """
+        self.flush()
 
-        # Write to file
-        with open(output_path, 'w') as f:
-            json.dump({
-                'mission_id': mission_id,
-                'frame_count': len(frames),
-                'frames': frames
-            }, f, indent=2)
+        Path(dest_path).parent.mkdir(parents=True, exist_ok=True)
+        dest = sqlite3.connect(dest_path)
+        try:
+            self.conn.backup(dest, pages=pages)
+        finally:
+            dest.close()
 
     def get_statistics(self) -> dict:
         """
@@ -606,7 +1559,13 @@ class MissionStorage:
             Always close connections when done. SQLite handles crashes
             gracefully, but explicit close is cleaner and releases locks.
         """
-        self.conn.close()
+        try:
+            self.flush()
+        finally:
+            if self._write_queue is not None and self._writer_thread.is_alive():
+                self._write_queue.put(None)
+                self._writer_thread.join()
+            self.conn.close()
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -0,0 +1,369 @@
+"""
+Simulation Kernels - Compiled Inner-Loop Arithmetic
+
+PURPOSE:
+    Holds the per-tick numeric work of the environment as small, flat
+    functions over scalars. When numba is installed these are compiled to
+    machine code; otherwise they are ordinary Python functions with the
+    same results.
+
+THEORY:
+    In a long simulation the tick loop is dominated by interpreter
+    overhead - attribute lookups, dict builds, boxed floats - rather than
+    by the arithmetic itself. A JIT compiler removes that overhead, but
+    only for code it can see: plain numbers in, plain numbers out, no
+    objects. So the kernels take every input as an argument and return
+    tuples, and the object-oriented layer (Environment, HazardSystem)
+    unpacks the results.
+
+    Hazard checks report which hazards fired as a bit mask rather than
+    a list of event dicts, so the check itself allocates nothing:
+
+        HAZARD_DUST_DEVIL   = 0b001
+        HAZARD_RADIATION    = 0b010
+        HAZARD_SLIP         = 0b100
+
+ARCHITECTURE ROLE:
+    Environment.update()
+        │
+        ├── STEP 3: OrbitalMechanics lookup tables (same with or without numba)
+        │
+        └── STEPS 4-6: power_thermal_tick() (compiled when numba is)
+
+    SimulationGenerator (STEPS 2-3: commands, motion)
+        │
+        └── motion_tick() (compiled when numba is)
+
+    Environment.update_batch_cuda()
+        │
+        ├── cupy available  → gpu_batch_tick() (one fused CUDA kernel)
+        └── otherwise       → Environment.update_batch() (numpy)
+
+    Environment, HazardSystem, SensorBase
+        │
+        └── NoisePool (buffered Gaussian draws)
+
+TEACHING GOALS:
+    - Separating hot numeric code from object-oriented glue
+    - Optional acceleration with a pure-Python fallback
+    - Bit masks as allocation-free return values
+
+DEBUGGING NOTES:
+    - Set NUMBA_DISABLE_JIT=1 to step through kernels in a debugger
+    - HAVE_NUMBA tells you whether the kernels here are compiled
+    - HAVE_CUPY tells you whether update_batch_cuda() really uses the GPU
+"""
+
+import math
+import random
+from enum import IntEnum
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    from numba import njit, vectorize
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - depends on environment
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit: return the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+try:
+    import cupy
+    HAVE_CUPY = True
+except ImportError:  # pragma: no cover - depends on environment
+    cupy = None
+    HAVE_CUPY = False
+
+
+class Surface(IntEnum):
+    """Surface type codes (index into SURFACE_MULTIPLIERS and SURFACE_NAMES)."""
+    FIRM = 0
+    LOOSE = 1
+    DUSTY = 2
+    ROCKY = 3
+    ICY = 4
+
+
+SURFACE_FIRM = Surface.FIRM
+SURFACE_LOOSE = Surface.LOOSE
+SURFACE_DUSTY = Surface.DUSTY
+SURFACE_ROCKY = Surface.ROCKY
+SURFACE_ICY = Surface.ICY
+
+SURFACE_CODES = {
+    'firm': SURFACE_FIRM,
+    'loose': SURFACE_LOOSE,
+    'dusty': SURFACE_DUSTY,
+    'rocky': SURFACE_ROCKY,
+    'icy': SURFACE_ICY,
+}
+
+# Surface type name per code
+SURFACE_NAMES = ('firm', 'loose', 'dusty', 'rocky', 'icy')
+
+# Drive power multiplier per surface code
+SURFACE_MULTIPLIERS = (
+    1.0,  # firm
+    1.3,  # loose
+    1.2,  # dusty
+    1.4,  # rocky
+    0.9,  # icy: slippery but less resistance
+)
+_SURFACE_MULT_ARRAY = np.array(SURFACE_MULTIPLIERS)
+
+# Degrees to radians, as one multiply (math.radians is a call per use)
+DEG2RAD = math.pi / 180.0
+
+# Extra drive power per degree of slope: 10° slope = 50% more power
+SLOPE_POWER_GAIN = 0.05
+
+# Hazard mask bits
+HAZARD_DUST_DEVIL = 1
+HAZARD_RADIATION = 2
+HAZARD_SLIP = 4
+
+# Random draws generated per numpy call (see NoisePool and
+# environment._uniform_blocks)
+RNG_CHUNK_SIZE = 65536
+
+
+class NoisePool:
+    """
+    Gaussian noise source backed by bulk standard-normal draws from numpy.
+
+    The Gaussian counterpart of environment._uniform_blocks: draws come
+    from a list refilled RNG_CHUNK_SIZE at a time, so gauss() is a list
+    read and a multiply instead of a trip through random.gauss's
+    Box-Muller code. Seeded from the random module on first use, like
+    _uniform_blocks. Shared by Environment and the sensors.
+    """
+
+    __slots__ = ('_chunk_size', '_rng', '_buffer', '_index')
+
+    def __init__(self, chunk_size: int = RNG_CHUNK_SIZE):
+        self._chunk_size = chunk_size
+        self._rng = None
+        self._buffer = []
+        self._index = 0
+
+    def gauss(self, sigma: float) -> float:
+        """Draw from a normal distribution with mean 0 and the given sigma."""
+        i = self._index
+        if i == len(self._buffer):
+            self._refill()
+            i = 0
+        self._index = i + 1
+        return self._buffer[i] * sigma
+
+    def _refill(self):
+        if self._rng is None:
+            self._rng = np.random.default_rng(random.getrandbits(64))
+        self._buffer = self._rng.standard_normal(self._chunk_size).tolist()
+        self._index = 0
+
+
+if HAVE_NUMBA:
+    @vectorize(['float64(float64, int64)', 'float64(float64, int8)',
+                'float64(float64, uint8)'], target='parallel')
+    def power_multiplier(slope, code):
+        """Drive power multiplier for a slope (degrees) and surface code."""
+        return (1.0 + abs(slope) * SLOPE_POWER_GAIN) * _SURFACE_MULT_ARRAY[code]
+else:
+    def power_multiplier(slope, code):
+        """
+        Drive power multiplier for slopes (degrees) and surface codes.
+
+        Broadcasts like a ufunc, so a whole terrain grid is one call.
+        """
+        slope = np.asarray(slope, dtype=np.float64)
+        return (1.0 + np.abs(slope) * SLOPE_POWER_GAIN) * _SURFACE_MULT_ARRAY[code]
+
+
+@njit(cache=True, fastmath=True)
+def power_thermal_tick(alpha, soc_per_watt, available_solar, slope, surface_code,
+                       ambient_temp, is_moving, heater_active, science_active,
+                       battery_soc, battery_voltage,
+                       cpu_temp, battery_temp, motor_temp, chassis_temp):
+    """
+    Power budget, battery and thermal update for one tick.
+
+    Args:
+        alpha: Thermal smoothing factor, 1 - exp(-dt / THERMAL_TIME_CONSTANT)
+        soc_per_watt: SoC percent gained per watt of net power this tick
+        available_solar: Solar panel output in watts
+        slope: Terrain slope in degrees
+        surface_code: Surface code (index into SURFACE_MULTIPLIERS)
+        ambient_temp: Ambient temperature in Celsius
+        is_moving, heater_active, science_active: Rover flags
+        battery_soc, battery_voltage: Battery state before the tick
+        cpu_temp, battery_temp, motor_temp, chassis_temp: Temperatures
+            before the tick
+
+    Returns:
+        Tuple of (total_power, net_power, battery_current, battery_soc,
+        battery_voltage, cpu_temp, battery_temp, motor_temp, chassis_temp,
+        heater_active)
+    """
+    # Power consumption: base 15W, 40W driving scaled by terrain,
+    # 20W heater, 25W science instruments
+    movement_power = 0.0
+    if is_moving:
+        slope_mult = 1.0 + abs(slope) * SLOPE_POWER_GAIN
+        movement_power = 40.0 * (slope_mult * SURFACE_MULTIPLIERS[surface_code])
+    total_power = (
+        15.0 + movement_power
+        + (20.0 if heater_active else 0.0)
+        + (25.0 if science_active else 0.0)
+    )
+
+    # Battery: positive current = charging; voltage follows SoC, 28-36V
+    net_power = available_solar - total_power
+    battery_current = net_power / battery_voltage
+    battery_soc += net_power * soc_per_watt
+    battery_soc = 0.0 if battery_soc < 0.0 else (100.0 if battery_soc > 100.0 else battery_soc)
+    battery_voltage = 28.0 + (battery_soc / 100.0) * 8.0
+
+    # Thermal: each part relaxes toward ambient plus its own heat
+    cpu_temp += alpha * (ambient_temp + 15.0 - cpu_temp)
+    battery_temp += alpha * (ambient_temp - battery_temp)
+    motor_temp += alpha * (ambient_temp + (10.0 if is_moving else 0.0) - motor_temp)
+    chassis_temp += alpha * (ambient_temp - chassis_temp)
+
+    # Heater hysteresis: on below -10°C, off above 0°C
+    if battery_temp < -10.0:
+        heater_active = True
+    elif battery_temp > 0.0:
+        heater_active = False
+
+    return (total_power, net_power, battery_current, battery_soc, battery_voltage,
+            cpu_temp, battery_temp, motor_temp, chassis_temp, heater_active)
+
+
+@njit(cache=True, fastmath=True)
+def motion_tick(dt, solar_angle, x, y, heading, velocity, battery_soc, is_moving):
+    """
+    Automatic commands and motion model for one tick.
+
+    Args:
+        dt: Time step in seconds
+        solar_angle: Sun elevation in degrees
+        x, y: Position in meters
+        heading: Heading in degrees
+        velocity: Speed in m/s
+        battery_soc: Battery state of charge (%)
+        is_moving: Whether the rover is driving
+
+    Returns:
+        Tuple of (x, y, velocity, is_moving, science_active)
+    """
+    # Drive only with enough battery; run science in daylight when parked
+    is_moving = is_moving and battery_soc >= 20.0
+    science_active = solar_angle > 30.0 and not is_moving
+
+    # Drive along the heading; friction takes 2% of speed per tick
+    if is_moving:
+        angle = heading * DEG2RAD
+        x += velocity * math.cos(angle) * dt
+        y += velocity * math.sin(angle) * dt
+        velocity *= 0.98
+        if velocity < 0.001:
+            velocity = 0.0
+            is_moving = False
+
+    return x, y, velocity, is_moving, science_active
+
+
+# Element-wise body of gpu_batch_tick(): STEPS 1-6 of Environment.step()
+# for one rover, in CUDA C++. Unnamed literals match the Python code.
+_GPU_TICK_OPERATION = """
+clock_us += dt_us;
+sol = clock_us / sol_us;
+local_time = (clock_us - sol * sol_us) / 1e6;
+mission_time = clock_us / 1e6;
+
+if (is_moving && slope > 5.0) {
+    double sigma = slope * 0.3 * 0.1;
+    roll = min(30.0, max(-30.0, roll + roll_noise * sigma));
+    pitch = min(30.0, max(-30.0, pitch + pitch_noise * sigma));
+}
+
+double angle = sin(local_time / sol_length * 2.0 * 3.141592653589793) * 90.0;
+if (angle < 0.0) angle = 0.0;
+solar_angle = angle;
+available_solar = 100.0 * sin(angle * 3.141592653589793 / 180.0) * (1.0 - dust * 0.5);
+solar_panel_voltage = available_solar * (34.0 / 100.0);
+solar_panel_current = available_solar * (1.0 / 30.0);
+
+double movement_power = 0.0;
+if (is_moving) {
+    movement_power = 40.0 * (1.0 + fabs(slope) * SLOPE_POWER_GAIN) * surface_multiplier(code);
+}
+total_power = 15.0 + movement_power
+    + (heater_active ? 20.0 : 0.0) + (science_active ? 25.0 : 0.0);
+
+net_power = available_solar - total_power;
+battery_current = net_power / battery_voltage;
+is_charging = net_power > 0.0;
+battery_soc = min(100.0, max(0.0, battery_soc + net_power * soc_per_watt));
+battery_voltage = 28.0 + (battery_soc / 100.0) * 8.0;
+
+ambient_temp = angle > 0.0
+    ? -80.0 + 100.0 * (angle / 90.0) + ambient_noise * 3.0
+    : -80.0 + ambient_noise * 5.0;
+cpu_temp += alpha * (ambient_temp + 15.0 - cpu_temp);
+battery_temp += alpha * (ambient_temp - battery_temp);
+motor_temp += alpha * (ambient_temp + (is_moving ? 10.0 : 0.0) - motor_temp);
+chassis_temp += alpha * (ambient_temp - chassis_temp);
+if (battery_temp < -10.0) heater_active = true;
+else if (battery_temp > 0.0) heater_active = false;
+"""
+
+
+@lru_cache(maxsize=None)
+def gpu_batch_tick():
+    """
+    Build (once) the fused CUDA kernel behind Environment.update_batch_cuda().
+
+    Returns:
+        cupy.ElementwiseKernel advancing every rover one tick in place
+
+    Teaching Note:
+        The numpy batch path runs each line as a separate pass over
+        memory. Here the whole tick is one kernel: each GPU thread loads
+        one rover's fields, does all the arithmetic in registers and
+        writes the results back, so a tick costs one launch however many
+        rovers there are.
+    """
+    if not HAVE_CUPY:
+        raise ImportError("gpu_batch_tick requires cupy")
+
+    multipliers = ', '.join(repr(m) for m in SURFACE_MULTIPLIERS)
+    preamble = (
+        f"#define SLOPE_POWER_GAIN {SLOPE_POWER_GAIN!r}\n"
+        "__device__ double surface_multiplier(int code) {\n"
+        f"    const double table[{len(SURFACE_MULTIPLIERS)}] = {{{multipliers}}};\n"
+        "    return table[code];\n"
+        "}\n"
+    )
+    return cupy.ElementwiseKernel(
+        'int64 dt_us, int64 sol_us, float64 sol_length, float64 alpha, '
+        'float64 soc_per_watt, float64 slope, uint8 code, float64 dust, '
+        'float64 roll_noise, float64 pitch_noise, float64 ambient_noise, '
+        'bool is_moving, bool science_active',
+        'int64 clock_us, int64 sol, float64 local_time, float64 mission_time, '
+        'float64 roll, float64 pitch, float64 solar_panel_voltage, '
+        'float64 solar_panel_current, float64 battery_current, bool is_charging, '
+        'float64 battery_soc, float64 battery_voltage, float64 cpu_temp, '
+        'float64 battery_temp, float64 motor_temp, float64 chassis_temp, '
+        'bool heater_active, float64 solar_angle, float64 available_solar, '
+        'float64 total_power, float64 net_power, float64 ambient_temp',
+        _GPU_TICK_OPERATION,
+        'rover_batch_tick',
+        preamble=preamble,
+    )
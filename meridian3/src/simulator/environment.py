@@ -68,7 +68,424 @@ FUTURE EXTENSIONS:
 
 import random
 import math
-from typing import Dict, Optional, Tuple
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from ._kernels import (
+    DEG2RAD, HAVE_CUPY, HAZARD_DUST_DEVIL, HAZARD_RADIATION, HAZARD_SLIP, RNG_CHUNK_SIZE,
+    SLOPE_POWER_GAIN, SURFACE_CODES, SURFACE_FIRM, SURFACE_MULTIPLIERS, SURFACE_NAMES,
+    NoisePool, Surface, cupy, gpu_batch_tick, power_multiplier,
+    power_thermal_tick as _power_thermal_tick,
+)
+
+
+
+# Severity and duration ranges per hazard type, used when sampling events
+HAZARD_RANGES = {
+    'dust_devil': ((0.3, 1.0), (60.0, 300.0)),      # 1-5 minutes
+    'radiation_spike': ((0.5, 1.0), (10.0, 60.0)),  # 10-60 seconds
+    'slip': ((0.2, 0.8), (1.0, 1.0)),               # Instantaneous
+}
+
+# Samples per sol in the solar-angle lookup table
+SOLAR_TABLE_SIZE = 8192
+
+# Solar angle is held constant within buckets of this many seconds
+SOLAR_ANGLE_RESOLUTION = 10.0
+
+# Samples across 0-90 degrees in the panel-efficiency lookup table
+SIN_TABLE_SIZE = 1024
+
+# The lookup tables themselves, built once at import and shared by every
+# OrbitalMechanics. One extra sample at the end so interpolation never
+# has to wrap. Plain lists: indexing a list is much cheaper than indexing
+# a numpy array from scalar Python code.
+_SOLAR_ANGLE_TABLE = np.maximum(
+    0.0, np.sin(np.linspace(0.0, 2 * np.pi, SOLAR_TABLE_SIZE + 1)) * 90.0
+).tolist()
+_SIN_TABLE = np.sin(np.radians(np.linspace(0.0, 90.0, SIN_TABLE_SIZE + 1))).tolist()
+
+# Hazard type names; an active hazard's 'type' field indexes this tuple
+HAZARD_TYPES = ('dust_devil', 'radiation_spike', 'slip')
+
+# Row layout of HazardSystem's active-hazard ring buffer
+ACTIVE_HAZARD_DTYPE = np.dtype([
+    ('type', 'u1'),
+    ('severity', 'f4'),
+    ('duration', 'f4'),
+    ('remaining', 'f4'),
+])
+
+# Thermal time constant: seconds for temperatures to ~equilibrate (5 minutes)
+THERMAL_TIME_CONSTANT = 300.0
+
+# Usable battery capacity in watt-hours
+BATTERY_CAPACITY_WH = 1000.0
+
+# Solar panel electrical output per watt generated: 34V at the 100W
+# peak, and current from P=VI at a nominal 30V
+PANEL_VOLTS_PER_WATT = 34.0 / 100.0
+PANEL_AMPS_PER_WATT = 1.0 / 30.0
+
+# Initial capacity of the active-hazard buffer (doubles if exceeded)
+ACTIVE_HAZARD_CAPACITY = 64
+
+# Row layout of the hazard table returned by Environment.simulate()
+HAZARD_EVENT_DTYPE = np.dtype([
+    ('time', 'f8'),
+    ('type', 'U16'),
+    ('severity', 'f8'),
+    ('duration', 'f8'),
+])
+
+
+class HazardEvent(NamedTuple):
+    """
+    A hazard that started this tick.
+
+    A NamedTuple rather than a dict: smaller, immutable, and fields are
+    read by position instead of by hashing a key. to_env_info() turns
+    them into dicts for telemetry frames.
+    """
+    type: str          # 'dust_devil', 'radiation_spike' or 'slip'
+    severity: float    # 0.0 to 1.0 intensity
+    duration: float    # Seconds
+
+
+class EnvTick(NamedTuple):
+    """
+    Result of one Environment.step(): everything telemetry needs to know
+    about the environment this tick, as a flat immutable record.
+    """
+    slope_angle: float
+    surface_type: str
+    surface_code: int
+    roughness: float
+    dust_level: float
+    solar_angle: float
+    available_solar: float
+    power_consumption: float
+    net_power: float
+    ambient_temp: float
+    new_hazards: List[HazardEvent]
+
+    def to_env_info(self, out: Optional[Dict] = None) -> Dict:
+        """
+        Convert to the nested env_info dict carried in telemetry frames.
+
+        Args:
+            out: Optional env_info dict from an earlier call, refilled in
+                 place (terrain sub-dict included) instead of allocating
+                 new dicts. Only for callers that read the result and
+                 let go of it - anything that keeps env_info, such as a
+                 telemetry frame, needs a fresh dict per tick.
+
+        Returns:
+            The env_info dict (out itself, when given)
+        """
+        if out is not None:
+            terrain = out.get('terrain')
+            if terrain is None:
+                out['terrain'] = terrain = {}
+            terrain['slope_angle'] = self.slope_angle
+            terrain['surface_type'] = self.surface_type
+            terrain['surface_code'] = self.surface_code
+            terrain['roughness'] = self.roughness
+            terrain['dust_level'] = self.dust_level
+            out['solar_angle'] = self.solar_angle
+            out['available_solar'] = self.available_solar
+            out['power_consumption'] = self.power_consumption
+            out['net_power'] = self.net_power
+            out['ambient_temp'] = self.ambient_temp
+            out['new_hazards'] = [hazard._asdict() for hazard in self.new_hazards]
+            return out
+
+        return {
+            'terrain': {
+                'slope_angle': self.slope_angle,
+                'surface_type': self.surface_type,
+                'surface_code': self.surface_code,
+                'roughness': self.roughness,
+                'dust_level': self.dust_level,
+            },
+            'solar_angle': self.solar_angle,
+            'available_solar': self.available_solar,
+            'power_consumption': self.power_consumption,
+            'net_power': self.net_power,
+            'ambient_temp': self.ambient_temp,
+            'new_hazards': [hazard._asdict() for hazard in self.new_hazards],
+        }
+
+
+# Source template for Environment.compile_for(). Mirrors Environment.step()
+# line for line, with every dt-derived value substituted as a literal and
+# attribute chains hoisted into closure variables. Keep the two in sync;
+# tests compare them tick by tick.
+_FIXED_STEP_TEMPLATE = """
+def make_step(env):
+    terrain = env.terrain
+    orbit = env.orbit
+    hazards = env.hazards
+    sample = terrain.sample
+    ambient = env._calculate_ambient_temperature
+    hazard_update = hazards.update
+    apply_hazard = hazards.apply_hazard_effects
+    gauss = env._noise.gauss
+
+    def step(rover_state):
+        rover_state.clock_us = clock_us = rover_state.clock_us + {dt_us}
+        sol, local_us = divmod(clock_us, {sol_us})
+        rover_state.sol = sol
+        rover_state.local_time = local_time = local_us / 1_000_000
+        rover_state.mission_time = clock_us / 1_000_000
+
+        slope_angle, surface_code, roughness, dust_level = sample(rover_state.x, rover_state.y)
+        is_moving = rover_state.is_moving
+        if is_moving and slope_angle > 5.0:
+            tilt_effect = slope_angle * 0.3
+            roll = rover_state.roll + gauss(tilt_effect * 0.1)
+            pitch = rover_state.pitch + gauss(tilt_effect * 0.1)
+            rover_state.roll = -30.0 if roll < -30.0 else (30.0 if roll > 30.0 else roll)
+            rover_state.pitch = -30.0 if pitch < -30.0 else (30.0 if pitch > 30.0 else pitch)
+
+        solar_angle = orbit.get_solar_angle(local_time)
+        available_solar = (
+            100.0 * orbit.get_sin_solar_elevation(local_time) * (1.0 - dust_level * 0.5)
+        )
+        rover_state.solar_panel_voltage = available_solar * {volts_per_watt!r}
+        rover_state.solar_panel_current = available_solar * {amps_per_watt!r}
+
+        ambient_temp = ambient(solar_angle)
+        (total_power_consumption, net_power, rover_state.battery_current,
+         rover_state.battery_soc, rover_state.battery_voltage,
+         rover_state.cpu_temp, rover_state.battery_temp, rover_state.motor_temp,
+         rover_state.chassis_temp, rover_state.heater_active) = _power_thermal_tick(
+            {alpha!r}, {soc_per_watt!r}, available_solar,
+            slope_angle, surface_code, ambient_temp,
+            is_moving, rover_state.heater_active, rover_state.science_active,
+            rover_state.battery_soc, rover_state.battery_voltage,
+            rover_state.cpu_temp, rover_state.battery_temp,
+            rover_state.motor_temp, rover_state.chassis_temp,
+        )
+        rover_state.is_charging = (net_power > 0)
+
+        new_hazards = hazard_update({dt!r}, rover_state)
+        for hazard in new_hazards:
+            apply_hazard(hazard, rover_state)
+
+        return EnvTick(
+            slope_angle, SURFACE_NAMES[surface_code], surface_code, roughness, dust_level,
+            solar_angle, available_solar, total_power_consumption, net_power,
+            ambient_temp, new_hazards,
+        )
+
+    return step
+"""
+
+
+def _uniform_blocks(chunk_size: int = RNG_CHUNK_SIZE) -> Iterator[list]:
+    """
+    Endless source of uniform [0, 1) draws, generated in bulk by numpy.
+
+    Args:
+        chunk_size: Number of draws per block
+
+    Yields:
+        Lists of chunk_size floats
+
+    Teaching Note:
+        Asking numpy for one random number at a time is slower than the
+        stdlib, because every call crosses from Python into C. Asking for
+        65536 at once makes that crossing rare; the caller then reads the
+        block with plain list indexing, which is cheaper than even
+        random.random().
+
+        The numpy generator is seeded from the stdlib random module when
+        the first block is requested, not at construction, so random.seed()
+        still makes a simulation reproducible even if it is called after
+        the Environment was built (as SimulationGenerator does).
+    """
+    rng = np.random.default_rng(random.getrandbits(64))
+    block = np.empty(chunk_size)
+    while True:
+        rng.random(out=block)  # refill in place, no new array
+        yield block.tolist()
+
+
+class TerrainGrid:
+    """
+    Spatially varying terrain stored as a Struct-of-Arrays heightmap.
+
+    Each property lives in its own 2D array (row = y, column = x) rather
+    than one array of per-cell records:
+
+        slope         float32  degrees
+        roughness     float32  0.0 to 1.0
+        dust          float32  0.0 to 1.0
+        surface_code  uint8    index into SURFACE_NAMES
+
+    Teaching Note:
+        A batched query that only needs slopes touches only the slope
+        array, contiguously. With an array of records (or a dict per
+        cell) it would drag every other field through the cache too.
+    """
+
+    def __init__(self, shape: Tuple[int, int], cell_size: float = 1.0,
+                 origin: Tuple[float, float] = (0.0, 0.0)):
+        """
+        Create a flat, firm grid.
+
+        Args:
+            shape: Grid size as (rows, columns)
+            cell_size: Cell edge length in meters
+            origin: World (x, y) of the corner of cell (0, 0)
+        """
+        self.shape = shape
+        self.cell_size = cell_size
+        self.origin = origin
+
+        self.slope = np.zeros(shape, dtype=np.float32)
+        self.roughness = np.zeros(shape, dtype=np.float32)
+        self.dust = np.zeros(shape, dtype=np.float32)
+        self.surface_code = np.zeros(shape, dtype=np.uint8)
+
+    def cell_at(self, x: float, y: float) -> Tuple[int, int]:
+        """
+        Convert a world position to a (row, column) cell index.
+
+        Positions outside the grid are clamped to the nearest edge cell.
+        """
+        rows, cols = self.shape
+        i = int((y - self.origin[1]) // self.cell_size)
+        j = int((x - self.origin[0]) // self.cell_size)
+        return min(max(i, 0), rows - 1), min(max(j, 0), cols - 1)
+
+    def sample(self, x: float, y: float) -> Tuple[float, int, float, float]:
+        """
+        Terrain at one position.
+
+        Returns:
+            Tuple of (slope_angle, surface_code, roughness, dust_level)
+            as plain Python numbers
+        """
+        i, j = self.cell_at(x, y)
+        return (
+            float(self.slope[i, j]),
+            int(self.surface_code[i, j]),
+            float(self.roughness[i, j]),
+            float(self.dust[i, j]),
+        )
+
+    def sample_many(self, xs: np.ndarray, ys: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """
+        Terrain at many positions in one vectorized lookup.
+
+        Args:
+            xs: Array of East-West positions (meters)
+            ys: Array of North-South positions (meters), same shape as xs
+
+        Returns:
+            Tuple of (slopes, surface_codes, roughness, dust_levels) arrays
+        """
+        rows, cols = self.shape
+        i = np.clip(((np.asarray(ys) - self.origin[1]) // self.cell_size).astype(np.intp), 0, rows - 1)
+        j = np.clip(((np.asarray(xs) - self.origin[0]) // self.cell_size).astype(np.intp), 0, cols - 1)
+        flat = i * cols + j
+
+        return (
+            np.take(self.slope, flat),
+            np.take(self.surface_code, flat),
+            np.take(self.roughness, flat),
+            np.take(self.dust, flat),
+        )
+
+
+class TerrainTileCache:
+    """
+    Terrain streamed in fixed-size tiles through an LRU cache.
+
+    A full-mission heightmap can be far larger than memory, so it is cut
+    into tile_size x tile_size tiles (each a TerrainGrid) that a loader
+    produces on demand - from disk, a procedural generator, etc. The most
+    recently used tiles stay resident; the rest are evicted.
+
+    Offers the same sample()/sample_many() interface as TerrainGrid, so
+    either can be attached as TerrainModel.grid.
+
+    Teaching Note:
+        A rover moves slowly, so consecutive lookups almost always land
+        in the same tile. Resolving a position to its tile is integer
+        division plus one dict lookup in the LRU - O(1) regardless of how
+        many tiles the map has - and medium tile sizes (64 cells) keep
+        each tile's arrays small enough to stay in cache.
+    """
+
+    def __init__(self, load_tile: Callable[[int, int], TerrainGrid],
+                 tile_size: int = 64, cell_size: float = 1.0, max_tiles: int = 256):
+        """
+        Args:
+            load_tile: Function (tile_x, tile_y) -> TerrainGrid of shape
+                       (tile_size, tile_size)
+            tile_size: Cells per tile edge
+            cell_size: Cell edge length in meters
+            max_tiles: Number of tiles kept in memory
+        """
+        self.tile_size = tile_size
+        self.cell_size = cell_size
+        # Per-instance cache so tiles are released with the instance
+        self._tile = lru_cache(maxsize=max_tiles)(load_tile)
+
+    def cache_info(self):
+        """Hit/miss statistics of the tile cache."""
+        return self._tile.cache_info()
+
+    def sample(self, x: float, y: float) -> Tuple[float, int, float, float]:
+        """
+        Terrain at one position.
+
+        Returns:
+            Tuple of (slope_angle, surface_code, roughness, dust_level)
+        """
+        tx, j = divmod(int(x // self.cell_size), self.tile_size)
+        ty, i = divmod(int(y // self.cell_size), self.tile_size)
+        tile = self._tile(tx, ty)
+        return (
+            float(tile.slope[i, j]),
+            int(tile.surface_code[i, j]),
+            float(tile.roughness[i, j]),
+            float(tile.dust[i, j]),
+        )
+
+    def sample_many(self, xs: np.ndarray, ys: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """
+        Terrain at many positions, loading each touched tile once.
+
+        Returns:
+            Tuple of (slopes, surface_codes, roughness, dust_levels) arrays
+        """
+        xs = np.asarray(xs)
+        tx, j = np.divmod((xs // self.cell_size).astype(np.intp), self.tile_size)
+        ty, i = np.divmod((np.asarray(ys) // self.cell_size).astype(np.intp), self.tile_size)
+
+        slopes = np.empty(xs.shape, dtype=np.float32)
+        codes = np.empty(xs.shape, dtype=np.uint8)
+        roughness = np.empty(xs.shape, dtype=np.float32)
+        dust = np.empty(xs.shape, dtype=np.float32)
+
+        # Visit each distinct tile once and gather all its samples
+        for tile_x, tile_y in set(zip(tx.ravel().tolist(), ty.ravel().tolist())):
+            mask = (tx == tile_x) & (ty == tile_y)
+            tile = self._tile(tile_x, tile_y)
+            ii, jj = i[mask], j[mask]
+            slopes[mask] = tile.slope[ii, jj]
+            codes[mask] = tile.surface_code[ii, jj]
+            roughness[mask] = tile.roughness[ii, jj]
+            dust[mask] = tile.dust[ii, jj]
+
+        return slopes, codes, roughness, dust
 
 
 class TerrainModel:
@@ -84,10 +501,37 @@ class TerrainModel:
 
     def __init__(self):
         """Initialize terrain model with default flat, firm surface."""
-        self.slope_angle = 0.0       # Degrees (0-30 typical, >20 is risky)
-        self.surface_type = "firm"   # firm, loose, dusty, rocky, icy
-        self.roughness = 0.0         # 0.0 (smooth) to 1.0 (very rough)
-        self.dust_level = 0.0        # 0.0 (clean) to 1.0 (heavy dust)
+        self.slope_angle: float = 0.0   # Degrees (0-30 typical, >20 is risky)
+        self.surface_type = "firm"      # firm, loose, dusty, rocky, icy
+        self.roughness: float = 0.0     # 0.0 (smooth) to 1.0 (very rough)
+        self.dust_level: float = 0.0    # 0.0 (clean) to 1.0 (heavy dust)
+
+        # Optional spatial terrain (TerrainGrid or TerrainTileCache);
+        # None means the uniform values above
+        self.grid: Optional[Union[TerrainGrid, TerrainTileCache]] = None
+
+    # Attributes that make up the uniform-terrain tuple returned by sample()
+    _VIEW_FIELDS = frozenset(('slope_angle', 'surface_type', 'roughness', 'dust_level'))
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        # Terrain changed: rebuild the cached sample() tuple on next use
+        if name in self._VIEW_FIELDS:
+            object.__setattr__(self, '_view', None)
+
+    @property
+    def surface_type(self) -> str:
+        """Surface type name, for display and telemetry."""
+        return self._surface_type
+
+    @surface_type.setter
+    def surface_type(self, value: Union[str, Surface]):
+        # Resolve the code and multiplier once here rather than on every tick
+        if isinstance(value, int):
+            value = SURFACE_NAMES[Surface(value)]
+        self._surface_type = value
+        self.surface_code = SURFACE_CODES.get(value, SURFACE_FIRM)
+        self.surface_multiplier = SURFACE_MULTIPLIERS[self.surface_code]
 
     def get_terrain_at(self, x: float, y: float) -> Dict[str, float]:
         """
@@ -103,41 +547,121 @@ class TerrainModel:
         Returns:
             Dictionary of terrain properties at that location
         """
-        # Placeholder: uniform terrain everywhere
-        # TODO Phase 2: Add Perlin noise for realistic terrain variation
+        slope_angle, surface_code, roughness, dust_level = self.sample(x, y)
         return {
-            'slope_angle': self.slope_angle,
-            'surface_type': self.surface_type,
-            'roughness': self.roughness,
-            'dust_level': self.dust_level,
+            'slope_angle': slope_angle,
+            'surface_type': SURFACE_NAMES[surface_code],
+            'surface_code': surface_code,
+            'roughness': roughness,
+            'dust_level': dust_level,
         }
 
-    def calculate_power_multiplier(self, slope: float, surface: str) -> float:
+    def sample(self, x: float, y: float) -> Tuple[float, int, float, float]:
+        """
+        Terrain at a position as a plain tuple (no dict allocation).
+
+        Returns:
+            Tuple of (slope_angle, surface_code, roughness, dust_level)
+        """
+        if self.grid is None:
+            # Uniform terrain everywhere: the same tuple every tick, rebuilt
+            # only when one of its attributes is assigned
+            # TODO Phase 2: Add Perlin noise for realistic terrain variation
+            view = self._view
+            if view is None:
+                view = self._view = (
+                    self.slope_angle, self.surface_code, self.roughness, self.dust_level
+                )
+            return view
+        return self.grid.sample(x, y)
+
+    def sample_many(self, xs: np.ndarray, ys: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """
+        Terrain at many positions at once.
+
+        Args:
+            xs: Array of East-West positions (meters)
+            ys: Array of North-South positions (meters)
+
+        Returns:
+            Tuple of (slopes, surface_codes, roughness, dust_levels) arrays
+        """
+        if self.grid is None:
+            shape = np.shape(xs)
+            return (
+                np.full(shape, self.slope_angle, dtype=np.float32),
+                np.full(shape, self.surface_code, dtype=np.uint8),
+                np.full(shape, self.roughness, dtype=np.float32),
+                np.full(shape, self.dust_level, dtype=np.float32),
+            )
+        return self.grid.sample_many(xs, ys)
+
+    def calculate_power_multiplier(self, slope: float,
+                                   surface: Optional[Union[int, str]] = None) -> float:
         """
         Calculate how terrain affects power consumption.
 
         Args:
             slope: Terrain slope in degrees
-            surface: Surface type string
+            surface: Surface code (see Surface) or surface type
+                     string; omit to use this model's own surface_type
 
         Returns:
             Power multiplier (1.0 = normal, >1.0 = more power needed)
         """
-        # Base multiplier from slope
-        slope_mult = 1.0 + (abs(slope) / 10.0) * 0.5  # 10° slope = 50% more power
+        # Base multiplier from slope (10° slope = 50% more power)
+        slope_mult = 1.0 + abs(slope) * SLOPE_POWER_GAIN
 
-        # Surface type multiplier
-        surface_multipliers = {
-            'firm': 1.0,
-            'loose': 1.3,
-            'dusty': 1.2,
-            'rocky': 1.4,
-            'icy': 0.9,  # Slippery but less resistance
-        }
-        surface_mult = surface_multipliers.get(surface, 1.0)
+        # Surface type multiplier (unknown surfaces behave like firm ground)
+        if surface is None:
+            surface_mult = self.surface_multiplier
+        else:
+            if surface.__class__ is str:
+                surface = SURFACE_CODES.get(surface, SURFACE_FIRM)
+            surface_mult = SURFACE_MULTIPLIERS[surface]
 
         return slope_mult * surface_mult
 
+    @staticmethod
+    def power_multiplier_batch(slopes: np.ndarray, surface_codes: np.ndarray) -> np.ndarray:
+        """
+        Power multipliers for many terrain cells at once.
+
+        Args:
+            slopes: Array of slopes in degrees
+            surface_codes: Integer array of surface codes (see SURFACE_CODES),
+                           broadcastable against slopes
+
+        Returns:
+            Array of power multipliers
+
+        Teaching Note:
+            A heightmap holds thousands of cells. Surface types are stored
+            as small integers so the multiplier becomes an array lookup
+            instead of a string-keyed dict access per cell, and the whole
+            grid is evaluated in one ufunc call (a compiled, parallel
+            ufunc when numba is installed).
+        """
+        return power_multiplier(slopes, surface_codes)
+
+    def power_multiplier_grid(self) -> np.ndarray:
+        """
+        Drive power multiplier for every cell of the attached TerrainGrid.
+
+        Returns:
+            Array shaped like the grid (row = y, column = x)
+
+        Raises:
+            ValueError: If no TerrainGrid is attached
+
+        Example:
+            >>> costs = terrain.power_multiplier_grid()
+            >>> print(f"Cheapest cell: {costs.min():.2f}x, worst: {costs.max():.2f}x")
+        """
+        if not isinstance(self.grid, TerrainGrid):
+            raise ValueError("power_multiplier_grid requires an attached TerrainGrid")
+        return power_multiplier(self.grid.slope, self.grid.surface_code)
+
 
 class HazardSystem:
     """
@@ -154,12 +678,44 @@ class HazardSystem:
 
     def __init__(self):
         """Initialize hazard system with default probabilities."""
-        self.active_hazards = []  # List of currently active hazards
+        # Currently active hazards: a preallocated buffer whose first
+        # _n_active rows are live (see the active_hazards property)
+        self._active = np.zeros(ACTIVE_HAZARD_CAPACITY, dtype=ACTIVE_HAZARD_DTYPE)
+        self._n_active: int = 0
+
+        # Bulk-generated uniform draws, consumed by index
+        self._uniform_source = _uniform_blocks()
+        self._draws: List[float] = []
+        self._draw_index: int = 0
+        self._noise = NoisePool()
+
+        # Effect handler per hazard type, looked up by apply_hazard_effects
+        self._effects = {
+            'dust_devil': self._apply_dust_devil,
+            'radiation_spike': self._apply_radiation_spike,
+            'slip': self._apply_slip,
+        }
+
+        # Hazard clocks (seconds). Slip can only happen while driving, so
+        # its clock only runs while the rover is moving.
+        self._clock: float = 0.0
+        self._moving_clock: float = 0.0
+
+        # Clock reading at which each hazard next fires; drawn on the
+        # first update() so that random.seed() after construction applies
+        self._next_dust_devil: float = 0.0
+        self._next_radiation_spike: float = 0.0
+        self._next_slip: float = 0.0
+        self._scheduled: bool = False
+
+        # Earlier of the two clock-driven next times (dust devil, radiation
+        # spike); -inf until the first schedule is drawn
+        self._next_clock_event: float = -math.inf
 
         # Mean time between events (seconds)
-        self.dust_devil_mtbe = 3600 * 24  # Once per day on average
-        self.radiation_spike_mtbe = 3600 * 72  # Once per 3 sols
-        self.slip_event_mtbe = 3600 * 12  # Twice per sol when moving
+        self.dust_devil_mtbe: float = 3600.0 * 24  # Once per day on average
+        self.radiation_spike_mtbe: float = 3600.0 * 72  # Once per 3 sols
+        self.slip_event_mtbe: float = 3600.0 * 12  # Twice per sol when moving
 
     def update(self, dt: float, rover_state) -> list:
         """
@@ -171,114 +727,261 @@ class HazardSystem:
 
         Returns:
             List of new hazard events that occurred this timestep
+
+        Teaching Note:
+            In a Poisson process the waiting time until the next event is
+            exponentially distributed with mean mtbe. Rather than rolling
+            a dt/mtbe chance every tick (and drawing a random number each
+            time for an event that almost never happens), we draw the
+            next event time once and simply compare the clock against it.
+            Randomness is only consumed when an event actually fires.
+
+            The clock-driven hazards share one guard, _next_clock_event:
+            the earliest of their next times, like the head of a priority
+            queue. A quiet tick is a single comparison no matter how many
+            hazard types there are.
         """
-        new_events = []
+        if self._n_active:
+            self._age_active(dt)
+
+        clock = self._clock + dt
+
+        mask = 0
+        if clock >= self._next_clock_event:
+            if not self._scheduled:
+                self.reschedule()
+            if clock >= self._next_dust_devil:
+                mask = HAZARD_DUST_DEVIL
+            if clock >= self._next_radiation_spike:
+                mask |= HAZARD_RADIATION
+        self._clock = clock
+
+        # Slip events only happen when moving
+        if rover_state.is_moving:
+            self._moving_clock = moving_clock = self._moving_clock + dt
+            if moving_clock >= self._next_slip:
+                mask |= HAZARD_SLIP
+
+        if not mask:
+            return []
+        return self.spawn_events(mask)
+
+    @property
+    def active_hazards(self) -> np.ndarray:
+        """
+        Hazards still in effect, as a structured array (ACTIVE_HAZARD_DTYPE).
+
+        'type' indexes HAZARD_TYPES; 'remaining' is seconds left.
+        """
+        return self._active[:self._n_active].copy()
+
+    def _add_active(self, type_code: int, severity: float, duration: float):
+        """Append a hazard to the active buffer, growing it if full."""
+        n = self._n_active
+        if n == len(self._active):
+            self._active = np.concatenate([self._active, np.zeros_like(self._active)])
+        self._active[n] = (type_code, severity, duration, duration)
+        self._n_active = n + 1
+
+    def _age_active(self, dt: float):
+        """
+        Count down active hazards and drop the expired ones.
+
+        Teaching Note:
+            Removal is swap-with-last: the expired row is overwritten by
+            the final live row and the count shrinks by one. Order isn't
+            preserved, but nothing is shifted or reallocated, so the
+            buffer never churns memory however often hazards come and go.
+        """
+        active = self._active
+        n = self._n_active
+        remaining = active['remaining'][:n]
+        remaining -= dt
+
+        expired = np.flatnonzero(remaining <= 0.0)
+        # Highest index first, so every row swapped in is still live
+        for k in expired[::-1]:
+            n -= 1
+            active[k] = active[n]
+        self._n_active = n
+
+    def reschedule(self):
+        """
+        Draw fresh next-event times for every hazard from the current mtbe values.
+
+        Called automatically before the first update(). Call it again after
+        changing an mtbe mid-mission so the new rate applies immediately
+        instead of after the next event.
+        """
+        draws, i = self._reserve_draws()
+        self._next_dust_devil = self._clock - math.log(1.0 - draws[i]) * self.dust_devil_mtbe
+        self._next_radiation_spike = (
+            self._clock - math.log(1.0 - draws[i + 1]) * self.radiation_spike_mtbe
+        )
+        self._next_slip = self._moving_clock - math.log(1.0 - draws[i + 2]) * self.slip_event_mtbe
+        self._next_clock_event = min(self._next_dust_devil, self._next_radiation_spike)
+        self._draw_index = i + 3
+        self._scheduled = True
+
+    def _reserve_draws(self) -> Tuple[list, int]:
+        """
+        Make sure enough uniform draws remain for one tick.
 
-        # Check for dust devil (Poisson process)
-        if random.random() < dt / self.dust_devil_mtbe:
-            new_events.append({
-                'type': 'dust_devil',
-                'severity': random.uniform(0.3, 1.0),
-                'duration': random.uniform(60, 300),  # 1-5 minutes
-            })
-
-        # Check for radiation spike
-        if random.random() < dt / self.radiation_spike_mtbe:
-            new_events.append({
-                'type': 'radiation_spike',
-                'severity': random.uniform(0.5, 1.0),
-                'duration': random.uniform(10, 60),  # 10-60 seconds
-            })
-
-        # Check for slip event (only when moving)
-        if rover_state.is_moving and random.random() < dt / self.slip_event_mtbe:
-            new_events.append({
-                'type': 'slip',
-                'severity': random.uniform(0.2, 0.8),
-                'duration': 1.0,  # Instantaneous
-            })
+        Returns:
+            Tuple of (draw list, index of the first unused draw)
+        """
+        # One tick uses at most 8 draws; start a fresh block if fewer remain
+        i = self._draw_index
+        if i > len(self._draws) - 8:
+            self._draws = next(self._uniform_source)
+            i = 0
+        return self._draws, i
+
+    def spawn_events(self, mask: int) -> list:
+        """
+        Build HazardEvents for the hazards flagged in a mask and schedule
+        each one's next occurrence.
+
+        Args:
+            mask: Bit mask of HAZARD_* flags (see _kernels)
 
+        Returns:
+            List of new hazard events
+        """
+        draws, i = self._reserve_draws()
+        new_events = []
+
+        # Next event = this one + exponential waiting time (1 - u avoids log(0))
+        if mask & HAZARD_DUST_DEVIL:
+            event = HazardEvent(
+                'dust_devil',
+                0.3 + 0.7 * draws[i],
+                60.0 + 240.0 * draws[i + 1],  # 1-5 minutes
+            )
+            new_events.append(event)
+            self._add_active(0, event.severity, event.duration)
+            self._next_dust_devil -= math.log(1.0 - draws[i + 2]) * self.dust_devil_mtbe
+            i += 3
+
+        if mask & HAZARD_RADIATION:
+            event = HazardEvent(
+                'radiation_spike',
+                0.5 + 0.5 * draws[i],
+                10.0 + 50.0 * draws[i + 1],  # 10-60 seconds
+            )
+            new_events.append(event)
+            self._add_active(1, event.severity, event.duration)
+            self._next_radiation_spike -= math.log(1.0 - draws[i + 2]) * self.radiation_spike_mtbe
+            i += 3
+
+        if mask & HAZARD_SLIP:
+            event = HazardEvent('slip', 0.2 + 0.6 * draws[i], 1.0)  # Instantaneous
+            new_events.append(event)
+            self._add_active(2, event.severity, 1.0)
+            self._next_slip -= math.log(1.0 - draws[i + 1]) * self.slip_event_mtbe
+            i += 2
+
+        self._next_clock_event = min(self._next_dust_devil, self._next_radiation_spike)
+        self._draw_index = i
         return new_events
 
-    def apply_hazard_effects(self, hazard: dict, rover_state):
+    def apply_hazard_effects(self, hazard: Union[HazardEvent, Mapping], rover_state):
         """
         Modify rover state based on active hazard.
 
         Args:
-            hazard: Hazard event dictionary with keys:
-                    - 'type': hazard type (dust_devil, radiation_spike, slip)
-                    - 'severity': 0.0 to 1.0 intensity
-                    - 'duration': seconds
+            hazard: HazardEvent (or a dict with the same keys) with fields:
+                    - type: hazard type (dust_devil, radiation_spike, slip)
+                    - severity: 0.0 to 1.0 intensity
+                    - duration: seconds
             rover_state: RoverState to modify
 
         Teaching Note:
             Hazards are discrete events that temporarily affect rover state.
             Effects can be immediate (slip) or sustained (dust storm).
             We apply effects probabilistically and proportional to severity.
+
+            Each hazard type's effect is its own method, found through a
+            table built once in __init__: one dict lookup per event rather
+            than a chain of string comparisons, and adding a hazard type
+            means adding a method and a table entry.
         """
-        hazard_type = hazard['type']
-        severity = hazard['severity']
-
-        if hazard_type == 'dust_devil':
-            # Dust devil effects:
-            # 1. Reduces solar panel efficiency (dust coating)
-            # 2. Adds noise to IMU sensors (vibration)
-            # 3. Slight temperature perturbation
-
-            # Reduce solar efficiency temporarily
-            # This is a simplification - real dust accumulates over time
-            # Here we just add a transient effect
-            # (The Environment.update() will recalculate solar power each tick)
-
-            # Add IMU disturbance (affects orientation readings indirectly)
-            # We don't modify state directly, sensors will add extra noise
-            # But we can add some actual physical rotation
-            rover_state.heading += random.gauss(0, severity * 2.0)  # Up to ±2° heading change
-
-            # Slight temperature perturbation from wind
-            temp_change = random.gauss(0, severity * 5.0)  # Up to ±5°C
-            rover_state.chassis_temp += temp_change * 0.1  # Small instant change
-
-        elif hazard_type == 'radiation_spike':
-            # Radiation spike effects:
-            # 1. Can cause CPU errors / resets (simulated as temp spike)
-            # 2. Causes sensor glitches (handled by sensors layer)
-            # 3. Drains battery slightly (radiation hardening circuits activate)
-
-            # Simulate CPU stress from radiation
-            rover_state.cpu_temp += severity * 10.0  # Up to +10°C spike
-
-            # Small battery drain from SEU (Single Event Upset) recovery
-            soc_loss = severity * 0.1  # Up to 0.1% SoC loss
-            rover_state.battery_soc -= soc_loss
-            rover_state.battery_soc = max(0.0, rover_state.battery_soc)
-
-        elif hazard_type == 'slip':
-            # Slip event effects:
-            # 1. Sudden position change (rover slides)
-            # 2. Orientation change (tilt from uneven surface)
-            # 3. Possible damage (simulated as increased current draw)
-
-            # Position slip (rover slides downhill/sideways)
-            slip_distance = severity * 2.0  # Up to 2 meters
-            slip_angle = random.uniform(0, 360)  # Random direction
-            rover_state.x += slip_distance * math.cos(math.radians(slip_angle))
-            rover_state.y += slip_distance * math.sin(math.radians(slip_angle))
-
-            # Orientation change from slip
-            rover_state.roll += random.gauss(0, severity * 10.0)  # Up to ±10°
-            rover_state.pitch += random.gauss(0, severity * 10.0)
-
-            # Clamp to safe limits
-            rover_state.roll = max(-30, min(30, rover_state.roll))
-            rover_state.pitch = max(-30, min(30, rover_state.pitch))
-
-            # Motor strain from slip recovery
-            rover_state.motor_temp += severity * 5.0  # Motors work harder
+        if isinstance(hazard, Mapping):
+            # The original dict form; unpacking it directly would yield its keys
+            hazard = HazardEvent(hazard['type'], hazard['severity'], hazard['duration'])
+        hazard_type, severity, _ = hazard
+
+        # Dispatch through the per-type effect table; unknown types are ignored
+        effect = self._effects.get(hazard_type)
+        if effect is not None:
+            effect(severity, rover_state)
 
         # Log hazard for debugging (would normally go to mission log)
         # print(f"Hazard: {hazard_type} (severity={severity:.2f})")
-        pass
+
+    def _apply_dust_devil(self, severity: float, rover_state):
+        """Dust devil: heading jolt and a small chassis temperature kick."""
+        # Dust devil effects:
+        # 1. Reduces solar panel efficiency (dust coating)
+        # 2. Adds noise to IMU sensors (vibration)
+        # 3. Slight temperature perturbation
+
+        # Reduce solar efficiency temporarily
+        # This is a simplification - real dust accumulates over time
+        # Here we just add a transient effect
+        # (The Environment.update() will recalculate solar power each tick)
+
+        # Add IMU disturbance (affects orientation readings indirectly)
+        # We don't modify state directly, sensors will add extra noise
+        # But we can add some actual physical rotation
+        gauss = self._noise.gauss
+        rover_state.heading += gauss(severity * 2.0)  # Up to ±2° heading change
+
+        # Slight temperature perturbation from wind
+        temp_change = gauss(severity * 5.0)  # Up to ±5°C
+        rover_state.chassis_temp += temp_change * 0.1  # Small instant change
+
+    def _apply_radiation_spike(self, severity: float, rover_state):
+        """Radiation spike: CPU heating and a small battery drain."""
+        # Radiation spike effects:
+        # 1. Can cause CPU errors / resets (simulated as temp spike)
+        # 2. Causes sensor glitches (handled by sensors layer)
+        # 3. Drains battery slightly (radiation hardening circuits activate)
+
+        # Simulate CPU stress from radiation
+        rover_state.cpu_temp += severity * 10.0  # Up to +10°C spike
+
+        # Small battery drain from SEU (Single Event Upset) recovery
+        soc_loss = severity * 0.1  # Up to 0.1% SoC loss
+        soc = rover_state.battery_soc - soc_loss
+        rover_state.battery_soc = soc if soc > 0.0 else 0.0
+
+    def _apply_slip(self, severity: float, rover_state):
+        """Slip: sideways slide, tilt disturbance and motor strain."""
+        # Slip event effects:
+        # 1. Sudden position change (rover slides)
+        # 2. Orientation change (tilt from uneven surface)
+        # 3. Possible damage (simulated as increased current draw)
+
+        # Position slip (rover slides downhill/sideways)
+        slip_distance = severity * 2.0  # Up to 2 meters
+        draws, i = self._reserve_draws()
+        slip_direction = 2.0 * math.pi * draws[i]  # Random direction, radians
+        self._draw_index = i + 1
+        rover_state.x += slip_distance * math.cos(slip_direction)
+        rover_state.y += slip_distance * math.sin(slip_direction)
+
+        # Orientation change from slip
+        gauss = self._noise.gauss
+        roll = rover_state.roll + gauss(severity * 10.0)  # Up to ±10°
+        pitch = rover_state.pitch + gauss(severity * 10.0)
+
+        # Clamp to safe limits
+        rover_state.roll = -30.0 if roll < -30.0 else (30.0 if roll > 30.0 else roll)
+        rover_state.pitch = -30.0 if pitch < -30.0 else (30.0 if pitch > 30.0 else pitch)
+
+        # Motor strain from slip recovery
+        rover_state.motor_temp += severity * 5.0  # Motors work harder
 
 
 class OrbitalMechanics:
@@ -294,9 +997,20 @@ class OrbitalMechanics:
 
     def __init__(self):
         """Initialize orbital model."""
-        self.mars_sol_length = 88775.0  # Martian sol in seconds (24h 39m 35s)
-        self.season = "summer"  # summer, winter (simplified)
-        self.latitude = -4.5  # Degrees (negative = south)
+        self.mars_sol_length: float = 88775.0  # Martian sol in seconds (24h 39m 35s)
+        self.season: str = "summer"  # summer, winter (simplified)
+        self.latitude: float = -4.5  # Degrees (negative = south)
+
+        # Shared lookup tables: the curves don't depend on the instance
+        # (time is normalized by mars_sol_length at lookup), so a fleet
+        # of environments costs no extra table building or memory
+        self._angle_table: List[float] = _SOLAR_ANGLE_TABLE
+        self._sin_table: List[float] = _SIN_TABLE
+
+        # Memo of the last solar angle bucket (see get_solar_angle)
+        self._last_bucket: int = -1
+        self._last_angle: float = 0.0
+        self._last_sin: float = 0.0
 
     def get_solar_angle(self, local_time: float) -> float:
         """
@@ -307,14 +1021,69 @@ class OrbitalMechanics:
 
         Returns:
             Solar elevation angle in degrees (0=horizon, 90=overhead)
+
+        Teaching Note:
+            The curve is smooth and repeats every sol, so it is sampled
+            once into a table and each call just interpolates between the
+            two nearest samples. With 8192 samples per sol the error is
+            below 1e-5 degrees - far smaller than the sensor noise.
+
+            The sun moves at most ~0.006 degrees per second, so the angle
+            is also held constant over SOLAR_ANGLE_RESOLUTION-second
+            buckets: consecutive ticks in the same bucket return the
+            memoized value. The angle is evaluated at the start of the
+            bucket, so the answer depends only on the time, not on which
+            tick happened to arrive first.
         """
+        bucket = int(local_time // SOLAR_ANGLE_RESOLUTION)
+        if bucket == self._last_bucket:
+            return self._last_angle
+
         # Simplified model: sinusoidal variation through the day
         # Peak at local noon (halfway through sol)
-        fraction_of_sol = local_time / self.mars_sol_length
-        angle = math.sin(fraction_of_sol * 2 * math.pi) * 90
+        bucket_time = bucket * SOLAR_ANGLE_RESOLUTION
+        position = (bucket_time / self.mars_sol_length) % 1.0 * SOLAR_TABLE_SIZE
+        i = int(position)
+        frac = position - i
+
+        # Table is already clamped to 0 (below horizon = night)
+        table = self._angle_table
+        lower = table[i]
+        angle = lower + (table[i + 1] - lower) * frac
+
+        self._last_bucket = bucket
+        self._last_angle = angle
+        self._last_sin = self._sin_elevation(angle)
+        return angle
+
+    def get_sin_solar_elevation(self, local_time: float) -> float:
+        """
+        Sine of the solar elevation - the panel's angle factor.
+
+        Args:
+            local_time: Time of sol in seconds
+
+        Returns:
+            sin(solar elevation), 0.0 at night
 
-        # Clamp to 0 (below horizon = night)
-        return max(0, angle)
+        Teaching Note:
+            Solar power only needs sin(elevation), not the angle itself.
+            It is worked out once per time bucket together with the angle
+            and memoized, so per tick this is a compare and a load - no
+            degree-to-radian conversion and no sin.
+        """
+        if int(local_time // SOLAR_ANGLE_RESOLUTION) != self._last_bucket:
+            self.get_solar_angle(local_time)
+        return self._last_sin
+
+    def _sin_elevation(self, solar_angle: float) -> float:
+        """sin(solar_angle in degrees), interpolated from the lookup table."""
+        if 0.0 <= solar_angle < 90.0:
+            position = solar_angle * (SIN_TABLE_SIZE / 90.0)
+            i = int(position)
+            lower = self._sin_table[i]
+            return lower + (self._sin_table[i + 1] - lower) * (position - i)
+        return math.sin(solar_angle * DEG2RAD)
 
     def calculate_solar_power(self, solar_angle: float, dust_level: float) -> float:
         """
@@ -329,13 +1098,54 @@ class OrbitalMechanics:
         """
         # Base power from sun angle (cosine law)
         max_power = 100.0  # Watts at optimal angle
-        angle_factor = math.sin(math.radians(solar_angle))
+        angle_factor = self._sin_elevation(solar_angle)
 
         # Dust reduces efficiency
         dust_factor = 1.0 - (dust_level * 0.5)  # Up to 50% reduction
 
         return max_power * angle_factor * dust_factor
 
+    def solar_angle_series(self, local_times: np.ndarray) -> np.ndarray:
+        """
+        Solar elevation for an array of times (see get_solar_angle).
+
+        Args:
+            local_times: Array of times of sol in seconds; values beyond
+                         one sol wrap naturally
+
+        Returns:
+            Array of solar elevation angles in degrees
+
+        Teaching Note:
+            Mission planning asks questions about whole trajectories -
+            "how much sun will we get along this route?" One numpy call
+            evaluates every sample at C speed instead of N Python calls.
+            The result is exact (no table, no time buckets).
+        """
+        phase = np.asarray(local_times, dtype=np.float64) / self.mars_sol_length * (2 * np.pi)
+        return np.maximum(0.0, np.sin(phase) * 90.0)
+
+    def calculate_solar_power_series(self, solar_angles: np.ndarray, dust_levels) -> np.ndarray:
+        """
+        Available solar power for arrays of angles (see calculate_solar_power).
+
+        Args:
+            solar_angles: Array of solar elevations in degrees
+            dust_levels: Dust level, scalar or array broadcastable
+                         against solar_angles
+
+        Returns:
+            Array of solar power in watts
+        """
+        dust_factor = 1.0 - np.asarray(dust_levels) * 0.5
+        return 100.0 * np.sin(np.radians(solar_angles)) * dust_factor
+
+    def daylight_mask(self, local_times: np.ndarray) -> np.ndarray:
+        """
+        Boolean array: True where the sun is above the horizon.
+        """
+        return self.solar_angle_series(local_times) > 0.0
+
 
 class Environment:
     """
@@ -351,16 +1161,164 @@ class Environment:
         self.hazards = HazardSystem()
         self.orbit = OrbitalMechanics()
 
-    def update(self, dt: float, rover_state):
+        # Gaussian noise for tilt and ambient temperature
+        self._noise = NoisePool()
+
+        # numpy Generator for update_batch(), seeded on first use from the
+        # random module so random.seed() governs batch runs too
+        self._batch_rng: Optional[np.random.Generator] = None
+        self._gpu_rng = None  # cupy counterpart, for update_batch_cuda()
+
+        # Per-timestep constants, recomputed only when dt changes
+        self._dt: Optional[float] = None
+        self._dt_us: int = 0
+        self._thermal_alpha: float = 0.0
+        self._soc_per_watt: float = 0.0
+
+        # Sol length on the integer microsecond clock, computed once (the
+        # orbit's sol length is fixed for the life of the environment)
+        self._sol_us: int = round(self.orbit.mars_sol_length * 1_000_000)
+
+    def _set_timestep(self, dt: float):
+        """
+        Precompute the constants that depend only on dt.
+
+        The generator steps with a fixed dt, so these divisions happen
+        once per run instead of once per tick.
+        """
+        self._dt = dt
+        self._dt_us = round(dt * 1_000_000)
+        # Exponential approach to target temperature, solved exactly over
+        # dt: T += alpha * (target - T) with alpha = 1 - exp(-dt/tau) is
+        # T(t + dt) = target + (T - target) * exp(-dt/tau). Unlike the
+        # Euler factor dt/tau it is exact for any dt (and can't overshoot
+        # once dt exceeds tau).
+        self._thermal_alpha = -math.expm1(-dt / THERMAL_TIME_CONSTANT)
+        # Percent of charge gained per watt of net power over one tick
+        self._soc_per_watt = 100.0 / BATTERY_CAPACITY_WH * (dt / 3600.0)
+
+    def simulate(
+        self,
+        duration: float,
+        dt: float,
+        start_time: float = 0.0,
+        is_moving: bool = False
+    ) -> Dict[str, np.ndarray]:
+        """
+        Evaluate solar conditions and hazard timing over a whole horizon.
+
+        Args:
+            duration: Length of the horizon in seconds
+            dt: Sample spacing in seconds
+            start_time: Local time of sol at the first sample
+            is_moving: Whether slip hazards can occur (rover driving)
+
+        Returns:
+            Dictionary with:
+                - 'time': sample times (seconds from start)
+                - 'solar_angle': solar elevation at each sample (degrees)
+                - 'available_solar': solar power at each sample (watts)
+                - 'hazards': structured array (HAZARD_EVENT_DTYPE) of
+                  events sorted by time
+
+        Teaching Note:
+            update() walks time one tick at a time, which is what a live
+            rover needs. Scenario planning only needs the answers, so here
+            the orbit is evaluated for every sample with one numpy call,
+            and hazards are sampled directly from their Poisson process:
+            the gaps between events are exponentially distributed with
+            mean mtbe, so cumulative sums of exponential draws ARE the
+            event times. No per-tick coin flips are needed.
+
+            The rover state is not modified.
+
+        Example:
+            >>> sol = env.simulate(88775.0, 1.0)
+            >>> print(f"{len(sol['hazards'])} hazards, "
+            ...       f"{sol['available_solar'].mean():.1f} W mean solar")
+        """
+        rng = np.random.default_rng(random.getrandbits(64))
+
+        n = int(duration / dt)
+        times = np.arange(n) * dt
+
+        # ═══════════════════════════════════════════════════════════
+        # Orbit: one vectorized pass over every sample
+        # ═══════════════════════════════════════════════════════════
+        solar_angle = self.orbit.solar_angle_series(start_time + times)
+        available_solar = self.orbit.calculate_solar_power_series(
+            solar_angle, self.terrain.dust_level
+        )
+
+        # ═══════════════════════════════════════════════════════════
+        # Hazards: exponential inter-arrival times per hazard type
+        # ═══════════════════════════════════════════════════════════
+        mtbes = {
+            'dust_devil': self.hazards.dust_devil_mtbe,
+            'radiation_spike': self.hazards.radiation_spike_mtbe,
+        }
+        if is_moving:
+            mtbes['slip'] = self.hazards.slip_event_mtbe
+
+        tables = []
+        for hazard_type, mtbe in mtbes.items():
+            arrivals = _poisson_arrivals(rng, mtbe, duration)
+            (sev_lo, sev_hi), (dur_lo, dur_hi) = HAZARD_RANGES[hazard_type]
+
+            table = np.empty(arrivals.size, dtype=HAZARD_EVENT_DTYPE)
+            table['time'] = arrivals
+            table['type'] = hazard_type
+            table['severity'] = rng.uniform(sev_lo, sev_hi, arrivals.size)
+            table['duration'] = rng.uniform(dur_lo, dur_hi, arrivals.size)
+            tables.append(table)
+
+        hazards = np.concatenate(tables)
+        hazards = hazards[np.argsort(hazards['time'], kind='stable')]
+
+        return {
+            'time': times,
+            'solar_angle': solar_angle,
+            'available_solar': available_solar,
+            'hazards': hazards,
+        }
+
+    def update(self, dt: float, rover_state, out: Optional[Dict] = None) -> Dict:
         """
         Update environment and apply effects to rover state.
 
         Args:
             dt: Time step in seconds
             rover_state: RoverState to modify based on environment
+            out: Optional env_info dict to refill in place rather than
+                 allocate (see EnvTick.to_env_info); don't pass one whose
+                 earlier contents you still hold on to
+
+        Returns:
+            env_info dictionary for the telemetry frame (see EnvTick)
+
+        Example:
+            >>> env_info = {}
+            >>> for _ in range(3600):
+            ...     env.update(1.0, rover, out=env_info)
+            ...     peak = max(peak, env_info['available_solar'])
+        """
+        return self.step(dt, rover_state).to_env_info(out)
+
+    def step(self, dt: float, rover_state) -> EnvTick:
+        """
+        Advance the environment one tick and apply effects to rover state.
+
+        Args:
+            dt: Time step in seconds
+            rover_state: RoverState to modify based on environment
+
+        Returns:
+            EnvTick record of this tick's environment figures
 
         This orchestrates all environmental updates each simulation tick.
         Applies terrain effects, solar power, thermal changes, and hazards.
+        Callers that don't need the nested env_info dict should use this
+        rather than update(): a NamedTuple is one small allocation.
 
         Teaching Note:
             This method demonstrates how multiple subsystems interact to
@@ -371,124 +1329,78 @@ class Environment:
         # ═══════════════════════════════════════════════════════════
         # STEP 1: Update time-of-day and mission time
         # ═══════════════════════════════════════════════════════════
-        rover_state.local_time += dt
-        if rover_state.local_time >= self.orbit.mars_sol_length:
-            rover_state.local_time -= self.orbit.mars_sol_length
-            rover_state.sol += 1
+        if dt != self._dt:
+            self._set_timestep(dt)
 
-        rover_state.mission_time += dt
+        # Integer microseconds: exact, so repeated float additions of dt
+        # can't accumulate rounding error over a long mission
+        rover_state.clock_us = clock_us = rover_state.clock_us + self._dt_us
+        sol, local_us = divmod(clock_us, self._sol_us)
+
+        rover_state.sol = sol
+        rover_state.local_time = local_us / 1_000_000
+        rover_state.mission_time = clock_us / 1_000_000
 
         # ═══════════════════════════════════════════════════════════
         # STEP 2: Get current terrain properties
         # ═══════════════════════════════════════════════════════════
-        terrain = self.terrain.get_terrain_at(rover_state.x, rover_state.y)
+        slope_angle, surface_code, roughness, dust_level = self.terrain.sample(
+            rover_state.x, rover_state.y
+        )
 
         # Apply terrain effects to rover orientation (tilt)
         # Slopes cause rover to tilt - affects roll and pitch
-        if rover_state.is_moving and terrain['slope_angle'] > 5.0:
+        if rover_state.is_moving and slope_angle > 5.0:
             # Significant slope: add some roll/pitch variation
             # This is simplified - real tilt depends on slope direction
-            tilt_effect = terrain['slope_angle'] * 0.3  # 10° slope → 3° tilt
-            rover_state.roll += random.gauss(0, tilt_effect * 0.1)
-            rover_state.pitch += random.gauss(0, tilt_effect * 0.1)
+            tilt_effect = slope_angle * 0.3  # 10° slope → 3° tilt
+            roll = rover_state.roll + self._noise.gauss(tilt_effect * 0.1)
+            pitch = rover_state.pitch + self._noise.gauss(tilt_effect * 0.1)
 
-            # Clamp to reasonable limits
-            rover_state.roll = max(-30, min(30, rover_state.roll))
-            rover_state.pitch = max(-30, min(30, rover_state.pitch))
+            # Clamp to reasonable limits (inline conditionals: no calls
+            # to min()/max(), and compiled code turns them into min/max
+            # instructions)
+            rover_state.roll = -30.0 if roll < -30.0 else (30.0 if roll > 30.0 else roll)
+            rover_state.pitch = -30.0 if pitch < -30.0 else (30.0 if pitch > 30.0 else pitch)
 
         # ═══════════════════════════════════════════════════════════
         # STEP 3: Calculate and apply solar power
         # ═══════════════════════════════════════════════════════════
+        # Same as orbit.calculate_solar_power(), with the memoized sin.
+        # This is the one solar model for step() whether or not numba is
+        # installed, so a given random_seed gives the same telemetry.
         solar_angle = self.orbit.get_solar_angle(rover_state.local_time)
-        available_solar = self.orbit.calculate_solar_power(solar_angle, terrain['dust_level'])
+        available_solar = (
+            100.0 * self.orbit.get_sin_solar_elevation(rover_state.local_time)
+            * (1.0 - dust_level * 0.5)
+        )
 
         # Update solar panel state
-        rover_state.solar_panel_voltage = 34.0 * (available_solar / 100.0)  # Scale to voltage
-        rover_state.solar_panel_current = available_solar / 30.0  # P=VI, nominal 30V
-
-        # ═══════════════════════════════════════════════════════════
-        # STEP 4: Calculate power consumption
-        # ═══════════════════════════════════════════════════════════
-        # Base power consumption (CPU, housekeeping)
-        base_power = 15.0  # Watts
-
-        # Power for movement (if moving)
-        movement_power = 0.0
-        if rover_state.is_moving:
-            # Terrain affects power consumption
-            power_mult = self.terrain.calculate_power_multiplier(
-                terrain['slope_angle'],
-                terrain['surface_type']
-            )
-            movement_power = 40.0 * power_mult  # Base 40W, scaled by terrain
-
-        # Heater power (if active)
-        heater_power = 20.0 if rover_state.heater_active else 0.0
-
-        # Science instruments (if active)
-        science_power = 25.0 if rover_state.science_active else 0.0
-
-        total_power_consumption = base_power + movement_power + heater_power + science_power
+        rover_state.solar_panel_voltage = available_solar * PANEL_VOLTS_PER_WATT
+        rover_state.solar_panel_current = available_solar * PANEL_AMPS_PER_WATT
 
         # ═══════════════════════════════════════════════════════════
-        # STEP 5: Update battery state
-        # ═══════════════════════════════════════════════════════════
-        # Net power = solar input - consumption
-        net_power = available_solar - total_power_consumption
-
-        # Update battery current (positive = charging, negative = discharging)
-        rover_state.battery_current = net_power / rover_state.battery_voltage
-        rover_state.is_charging = (net_power > 0)
-
-        # Update state of charge (simplified battery model)
-        # SoC change rate depends on current and battery capacity
-        battery_capacity_wh = 1000.0  # Watt-hours
-        soc_change_per_hour = (net_power / battery_capacity_wh) * 100.0  # Percent per hour
-        soc_change = soc_change_per_hour * (dt / 3600.0)  # Convert to timestep
-
-        rover_state.battery_soc += soc_change
-
-        # Clamp SoC to [0, 100]
-        rover_state.battery_soc = max(0.0, min(100.0, rover_state.battery_soc))
-
-        # Battery voltage varies with SoC (simplified)
-        # Nominal 32V, drops to 28V at low SoC, peaks at 36V when full
-        rover_state.battery_voltage = 28.0 + (rover_state.battery_soc / 100.0) * 8.0
-
-        # ═══════════════════════════════════════════════════════════
-        # STEP 6: Update thermal state
+        # STEPS 4-6: Power consumption, battery and thermal state
         # ═══════════════════════════════════════════════════════════
         # Ambient temperature varies with time of day
         # Mars: -80°C at night, up to +20°C at noon (equator)
         ambient_temp = self._calculate_ambient_temperature(solar_angle)
 
-        # CPU temperature depends on ambient and computational load
-        cpu_load_factor = 1.0  # Could vary based on activity
-        cpu_heat_above_ambient = 15.0 * cpu_load_factor  # CPU generates heat
-
-        # Thermal time constant (heat transfer is not instantaneous)
-        thermal_tc = 300.0  # seconds (5 minutes to equilibrate)
-        alpha = dt / thermal_tc  # Exponential approach to target
-
-        target_cpu_temp = ambient_temp + cpu_heat_above_ambient
-        rover_state.cpu_temp += alpha * (target_cpu_temp - rover_state.cpu_temp)
-
-        # Battery temperature tracks ambient (large thermal mass)
-        rover_state.battery_temp += alpha * (ambient_temp - rover_state.battery_temp)
-
-        # Motor temperature depends on movement
-        motor_heat = 10.0 if rover_state.is_moving else 0.0
-        target_motor_temp = ambient_temp + motor_heat
-        rover_state.motor_temp += alpha * (target_motor_temp - rover_state.motor_temp)
-
-        # Chassis tracks ambient closely
-        rover_state.chassis_temp += alpha * (ambient_temp - rover_state.chassis_temp)
-
-        # Heater logic: activate if battery too cold
-        if rover_state.battery_temp < -10.0:
-            rover_state.heater_active = True
-        elif rover_state.battery_temp > 0.0:
-            rover_state.heater_active = False
+        # The arithmetic is one flat kernel (see _kernels), compiled when
+        # numba is installed: the tick reads each rover field once and
+        # writes it once instead of walking rover_state line by line
+        (total_power_consumption, net_power, rover_state.battery_current,
+         rover_state.battery_soc, rover_state.battery_voltage,
+         rover_state.cpu_temp, rover_state.battery_temp, rover_state.motor_temp,
+         rover_state.chassis_temp, rover_state.heater_active) = _power_thermal_tick(
+            self._thermal_alpha, self._soc_per_watt, available_solar,
+            slope_angle, surface_code, ambient_temp,
+            rover_state.is_moving, rover_state.heater_active, rover_state.science_active,
+            rover_state.battery_soc, rover_state.battery_voltage,
+            rover_state.cpu_temp, rover_state.battery_temp,
+            rover_state.motor_temp, rover_state.chassis_temp,
+        )
+        rover_state.is_charging = (net_power > 0)
 
         # ═══════════════════════════════════════════════════════════
         # STEP 7: Apply hazard effects
@@ -501,16 +1413,219 @@ class Environment:
         # ═══════════════════════════════════════════════════════════
         # STEP 8: Return environment info for telemetry
         # ═══════════════════════════════════════════════════════════
+        return EnvTick(
+            slope_angle,
+            SURFACE_NAMES[surface_code],
+            surface_code,
+            roughness,
+            dust_level,
+            solar_angle,
+            available_solar,
+            total_power_consumption,
+            net_power,
+            ambient_temp,
+            new_hazards,
+        )
+
+    def update_batch(self, dt: float, states) -> Dict[str, np.ndarray]:
+        """
+        Advance many rovers one tick at once.
+
+        Args:
+            dt: Time step in seconds
+            states: RoverStateArrays, modified in place
+
+        Returns:
+            Dictionary of per-rover arrays: 'solar_angle', 'available_solar',
+            'power_consumption', 'net_power', 'ambient_temp'
+
+        Teaching Note:
+            This is STEPS 1-6 of step() rewritten over arrays: every
+            'if' becomes np.where, every clamp np.clip, and the random
+            noise for all rovers comes from one numpy call. Fleet studies
+            and Monte-Carlo runs with thousands of rovers then cost a few
+            dozen array operations per tick instead of thousands of
+            Python-level steps.
+
+            Hazards are not applied here - HazardSystem keeps a single
+            event schedule, which belongs to one rover. Solar angles are
+            evaluated exactly (no lookup table, no time buckets), so
+            results can differ from step() in the last decimal places.
+        """
+        if self._batch_rng is None:
+            self._batch_rng = np.random.default_rng(random.getrandbits(64))
+        rng = self._batch_rng
+        n = states.n
+
+        if dt != self._dt:
+            self._set_timestep(dt)
+
+        # STEP 1: time
+        states.clock_us += self._dt_us
+        states.sol, local_us = np.divmod(states.clock_us, self._sol_us)
+        states.local_time = local_us / 1_000_000
+        states.mission_time = states.clock_us / 1_000_000
+
+        # STEP 2: terrain and tilt on steep slopes while moving
+        slopes, codes, _, dust = self.terrain.sample_many(states.x, states.y)
+        moving = states.is_moving
+        tilting = moving & (slopes > 5.0)
+        tilt_sigma = np.where(tilting, slopes * 0.3 * 0.1, 0.0)
+        states.roll += rng.normal(0.0, 1.0, n) * tilt_sigma
+        states.pitch += rng.normal(0.0, 1.0, n) * tilt_sigma
+        np.clip(states.roll, -30.0, 30.0, out=states.roll)
+        np.clip(states.pitch, -30.0, 30.0, out=states.pitch)
+
+        # STEP 3: solar power
+        solar_angle = self.orbit.solar_angle_series(states.local_time)
+        available_solar = self.orbit.calculate_solar_power_series(solar_angle, dust)
+        states.solar_panel_voltage = available_solar * PANEL_VOLTS_PER_WATT
+        states.solar_panel_current = available_solar * PANEL_AMPS_PER_WATT
+
+        # STEP 4: power consumption
+        movement_power = np.where(moving, 40.0 * power_multiplier(slopes, codes), 0.0)
+        total_power = (
+            15.0 + movement_power
+            + np.where(states.heater_active, 20.0, 0.0)
+            + np.where(states.science_active, 25.0, 0.0)
+        )
+
+        # STEP 5: battery
+        net_power = available_solar - total_power
+        states.battery_current = net_power / states.battery_voltage
+        states.is_charging = net_power > 0
+        states.battery_soc += net_power * self._soc_per_watt
+        np.clip(states.battery_soc, 0.0, 100.0, out=states.battery_soc)
+        states.battery_voltage = 28.0 + (states.battery_soc / 100.0) * 8.0
+
+        # STEP 6: thermal (see _calculate_ambient_temperature)
+        day = solar_angle > 0
+        ambient_temp = (
+            -80.0 + np.where(day, 100.0 * (solar_angle / 90.0), 0.0)
+            + rng.normal(0.0, 1.0, n) * np.where(day, 3.0, 5.0)
+        )
+        # All four thermal masses relax toward ambient in one pass over the
+        # (4, n) temps block; the CPU's and moving motors' own heat is
+        # then added to their rows (T += a*(amb + h - T) split in two)
+        alpha = self._thermal_alpha
+        temps = states.temps
+        temps += alpha * (ambient_temp - temps)
+        temps[0] += alpha * 15.0
+        temps[2] += np.where(moving, alpha * 10.0, 0.0)
+
+        # Heater hysteresis: on below -10°C, off above 0°C, else unchanged
+        states.heater_active = np.where(
+            states.battery_temp < -10.0, True,
+            np.where(states.battery_temp > 0.0, False, states.heater_active)
+        )
+
         return {
-            'terrain': terrain,
             'solar_angle': solar_angle,
             'available_solar': available_solar,
-            'power_consumption': total_power_consumption,
+            'power_consumption': total_power,
             'net_power': net_power,
             'ambient_temp': ambient_temp,
-            'new_hazards': new_hazards,
         }
 
+    def update_batch_cuda(self, dt: float, states) -> Dict[str, np.ndarray]:
+        """
+        Advance many rovers one tick on the GPU.
+
+        Args:
+            dt: Time step in seconds
+            states: RoverStateArrays moved to the GPU with to_device()
+
+        Returns:
+            Same dictionary as update_batch(), holding cupy arrays
+
+        Teaching Note:
+            Same model as update_batch(), but STEPS 1-6 run as one fused
+            CUDA kernel (see _kernels.gpu_batch_tick) with the noise
+            drawn on the device, so large Monte-Carlo fleets cost one
+            kernel launch per tick. Terrain lookups still run on the host
+            (TerrainModel and its grids hold numpy arrays), so only the
+            rover positions and the sampled terrain cross the bus.
+
+            Without cupy, or with host-resident states, this simply calls
+            update_batch().
+        """
+        if not HAVE_CUPY or not isinstance(states.x, cupy.ndarray):
+            return self.update_batch(dt, states)
+
+        if self._gpu_rng is None:
+            self._gpu_rng = cupy.random.default_rng(random.getrandbits(64))
+        if dt != self._dt:
+            self._set_timestep(dt)
+
+        n = states.n
+        slopes, codes, _, dust = self.terrain.sample_many(
+            cupy.asnumpy(states.x), cupy.asnumpy(states.y)
+        )
+        noise = self._gpu_rng.standard_normal((3, n))
+        result = {
+            name: cupy.empty(n)
+            for name in ('solar_angle', 'available_solar', 'power_consumption',
+                         'net_power', 'ambient_temp')
+        }
+
+        gpu_batch_tick()(
+            self._dt_us, self._sol_us,
+            self.orbit.mars_sol_length, self._thermal_alpha, self._soc_per_watt,
+            cupy.asarray(slopes, dtype=cupy.float64), cupy.asarray(codes, dtype=cupy.uint8),
+            cupy.asarray(dust, dtype=cupy.float64), noise[0], noise[1], noise[2],
+            states.is_moving, states.science_active,
+            states.clock_us, states.sol, states.local_time, states.mission_time,
+            states.roll, states.pitch, states.solar_panel_voltage,
+            states.solar_panel_current, states.battery_current, states.is_charging,
+            states.battery_soc, states.battery_voltage, states.cpu_temp,
+            states.battery_temp, states.motor_temp, states.chassis_temp,
+            states.heater_active, result['solar_angle'], result['available_solar'],
+            result['power_consumption'], result['net_power'], result['ambient_temp'],
+        )
+        return result
+
+    def compile_for(self, dt: float) -> Callable:
+        """
+        Generate a step function specialized for a fixed timestep.
+
+        Args:
+            dt: The timestep every call will use
+
+        Returns:
+            Function step(rover_state) -> EnvTick, equivalent to
+            self.step(dt, rover_state)
+
+        Teaching Note:
+            A simulation almost always runs with one fixed dt, yet step()
+            re-reads its dt-derived constants and walks attribute chains
+            (self._sol_us, self.terrain.sample, ...) every tick. Here we
+            write the source of a specialized version with those values
+            baked in as literals, and exec() it once.
+
+        Example:
+            >>> step = env.compile_for(1.0)
+            >>> for _ in range(3600):
+            ...     tick = step(rover)
+        """
+        self._set_timestep(dt)
+        source = _FIXED_STEP_TEMPLATE.format(
+            dt=dt,
+            dt_us=self._dt_us,
+            sol_us=self._sol_us,
+            soc_per_watt=self._soc_per_watt,
+            alpha=self._thermal_alpha,
+            volts_per_watt=PANEL_VOLTS_PER_WATT,
+            amps_per_watt=PANEL_AMPS_PER_WATT,
+        )
+
+        namespace = {
+            'EnvTick': EnvTick,
+            'SURFACE_NAMES': SURFACE_NAMES,
+            '_power_thermal_tick': _power_thermal_tick,
+        }
+        exec(compile(source, f'<Environment.compile_for({dt!r})>', 'exec'), namespace)
+        return namespace['make_step'](self)
+
     def _calculate_ambient_temperature(self, solar_angle: float) -> float:
         """
         Calculate ambient temperature based on solar angle.
@@ -529,7 +1644,7 @@ class Environment:
         """
         if solar_angle <= 0:
             # Night time - very cold
-            return -80.0 + random.gauss(0, 5.0)  # -80°C ± some variation
+            return -80.0 + self._noise.gauss(5.0)  # -80°C ± some variation
 
         # Day time - temperature rises with sun angle
         # Maximum temp around +20°C at solar noon
@@ -541,11 +1656,34 @@ class Environment:
         temp = min_night_temp + temp_range * (solar_angle / 90.0)
 
         # Add some random variation
-        temp += random.gauss(0, 3.0)
+        temp += self._noise.gauss(3.0)
 
         return temp
 
 
+def _poisson_arrivals(rng: np.random.Generator, mtbe: float, duration: float) -> np.ndarray:
+    """
+    Sample event times of a Poisson process on [0, duration).
+
+    Args:
+        rng: numpy random Generator
+        mtbe: Mean time between events (seconds)
+        duration: Length of the window (seconds)
+
+    Returns:
+        Sorted array of event times
+    """
+    # Draw a few times the expected count up front; top up in the rare
+    # case the cumulative sum still falls short of the window
+    size = int(duration / mtbe * 4) + 16
+    arrivals = np.cumsum(rng.exponential(mtbe, size))
+    while arrivals[-1] < duration:
+        more = arrivals[-1] + np.cumsum(rng.exponential(mtbe, size))
+        arrivals = np.concatenate([arrivals, more])
+
+    return arrivals[:np.searchsorted(arrivals, duration)]
+
+
 # ═══════════════════════════════════════════════════════════════
 # FUTURE EXTENSION IDEAS
 # ═══════════════════════════════════════════════════════════════
@@ -170,10 +170,36 @@ FUTURE EXTENSIONS:
     - Support parallel simulation of multiple rovers
 """
 
-from typing import Generator, Dict, Any, Optional
+import random
+from operator import attrgetter
+from typing import Generator, Dict, Any, Optional, Union
+
+import numpy as np
+
 from .rover_state import RoverState
-from .sensors import SensorSuite
+from .sensors import SensorSuite, TelemetryFrame
 from .environment import Environment
+from ._kernels import motion_tick as _motion_tick
+
+
+# RoverState fields recorded per tick by generate_frames_batched()
+BATCH_STATE_FIELDS = (
+    'roll', 'pitch', 'heading',
+    'battery_voltage', 'battery_current', 'battery_soc',
+    'solar_panel_voltage', 'solar_panel_current',
+    'cpu_temp', 'battery_temp', 'motor_temp', 'chassis_temp',
+    'x', 'y', 'z', 'velocity', 'sol', 'local_time',
+)
+_read_batch_state = attrgetter(*BATCH_STATE_FIELDS)
+
+
+def _mission_dtype(dtype) -> np.dtype:
+    """Record layout of run_mission_arrays(): frame field order, env_info left out."""
+    exact = {'timestamp': np.float64, 'frame_id': np.int64, 'sol': np.int64}
+    return np.dtype([
+        (name, exact.get(name, dtype))
+        for name in TelemetryFrame._fields if name != 'env_info'
+    ])
 
 
 class SimulationGenerator:
@@ -184,6 +210,13 @@ class SimulationGenerator:
     storing entire mission history in memory.
     """
 
+    # Fixed attribute layout, per-tick counters first
+    __slots__ = (
+        'current_time', 'frame_count', 'timestep',
+        'rover', 'sensors', 'environment',
+        'max_duration', 'random_seed',
+    )
+
     def __init__(
         self,
         timestep: float = 1.0,
@@ -213,13 +246,21 @@ class SimulationGenerator:
 
         # Set random seed for reproducibility
         if random_seed is not None:
-            import random
             random.seed(random_seed)
 
-    def generate_frames(self) -> Generator[Dict[str, Any], None, None]:
+    def generate_frames(
+        self, records: bool = False
+    ) -> Generator[Union[Dict[str, Any], TelemetryFrame], None, None]:
         """
         Main simulation loop - generates telemetry frames.
 
+        Args:
+            records: Yield TelemetryFrame records instead of dicts. A record
+                     holds the same values in under half the memory, with
+                     env_info as the environment's EnvTick (read
+                     frame.env_info.solar_angle, etc.); call as_dict() on
+                     it where a dict is needed.
+
         Yields:
             Telemetry frame dictionary with all sensor readings and metadata
 
@@ -228,9 +269,21 @@ class SimulationGenerator:
             for frame in sim.generate_frames():
                 print(f"Time {frame['timestamp']}: Battery {frame['battery_soc']}%")
         """
+        # Environment step specialized for our fixed timestep
+        environment_step = self.environment.compile_for(self.timestep)
+
+        # Everything the loop touches, looked up once: the three stages
+        # below then share these locals instead of each walking
+        # self.rover / self.sensors again on every tick
+        rover = self.rover
+        advance_rover = self._advance_rover
+        read_frame = self.sensors.read_frame
+        timestep = self.timestep
+        max_duration = self.max_duration
+
         while True:
             # Check termination condition
-            if self.max_duration and self.current_time >= self.max_duration:
+            if max_duration and self.current_time >= max_duration:
                 break
 
             # ═══════════════════════════════════════════════════════
@@ -245,67 +298,143 @@ class SimulationGenerator:
             # - Battery charge/discharge
             # - Thermal dynamics
             # - Hazard events
-            env_info = self.environment.update(self.timestep, self.rover)
-
-            # STEP 2: Process commands (if any)
-            # In this phase, we implement basic automatic behaviors
-            # Future phases will add command queue for scripted missions
-
-            # Example automatic behavior: Stop moving if battery too low
-            if self.rover.battery_soc < 20.0:
-                self.rover.is_moving = False
-                # In a real rover, this would trigger a safe mode
-
-            # Example: Activate science during day when stationary
-            if env_info['solar_angle'] > 30.0 and not self.rover.is_moving:
-                self.rover.science_active = True
-            else:
-                self.rover.science_active = False
-
-            # STEP 3: Update rover physics (motion model)
-            # Environment.update() already handles power, thermal, and hazards
-            # Here we handle simple motion physics
-
-            if self.rover.is_moving:
-                # Simple motion model: rover moves forward at velocity
-                # Direction is determined by heading
-                import math
-                dx = self.rover.velocity * math.cos(math.radians(self.rover.heading)) * self.timestep
-                dy = self.rover.velocity * math.sin(math.radians(self.rover.heading)) * self.timestep
-
-                self.rover.x += dx
-                self.rover.y += dy
-
-                # Slowly reduce velocity due to friction (if not actively driving)
-                # This is a simplification - real rovers have explicit drive commands
-                self.rover.velocity *= 0.98  # 2% decay per timestep
-
-                if self.rover.velocity < 0.001:  # Effectively stopped
-                    self.rover.velocity = 0.0
-                    self.rover.is_moving = False
-
-            # Teaching Note:
-            # The separation between environment effects (Step 1) and rover
-            # dynamics (Step 3) demonstrates modular simulation design.
-            # Environment provides external forces/conditions, rover physics
-            # determines how the rover responds.
+            # Records keep the flat EnvTick; dicts get the nested env_info
+            tick = environment_step(rover)
+            env_info = tick if records else tick.to_env_info()
 
-            # STEP 4: Read all sensors
-            telemetry_frame = self.sensors.read_all(self.rover, self.current_time)
+            # STEPS 2-3: Process commands, then update rover physics
+            advance_rover(tick.solar_angle)
 
+            # STEP 4: Read all sensors
             # STEP 5: Add metadata and environment info
-            telemetry_frame['frame_id'] = self.frame_count
-            telemetry_frame['sol'] = self.rover.sol
-            telemetry_frame['local_time'] = self.rover.local_time
-            telemetry_frame['env_info'] = env_info
+            telemetry_frame = read_frame(
+                rover, self.current_time, self.frame_count,
+                rover.sol, rover.local_time, env_info,
+            )
 
             # STEP 6: Yield frame to consumer
-            yield telemetry_frame
+            yield telemetry_frame if records else telemetry_frame.as_dict()
 
             # STEP 7: Advance time
-            self.current_time += self.timestep
+            self.current_time += timestep
             self.frame_count += 1
 
+    def generate_frames_batched(
+        self, chunk: int = 4096, dtype=np.float32
+    ) -> Generator[Dict[str, np.ndarray], None, None]:
+        """
+        Run the same simulation as generate_frames(), yielding telemetry
+        in chunks of arrays instead of one dict per frame.
+
+        Args:
+            chunk: Maximum number of frames per yielded chunk
+            dtype: Precision of the telemetry arrays. float32 is plenty for
+                   readings with ~1% sensor noise and halves the memory
+                   traffic downstream; timestamps are always float64 so
+                   they stay exact over long missions.
+
+        Yields:
+            Dictionary mapping each telemetry field (same names as a
+            generate_frames() frame, plus 'frame_id', 'sol' and
+            'local_time') to an array with one element per frame.
+            The last chunk may be shorter. env_info is not included.
+
+        Example:
+            sim = SimulationGenerator(timestep=1.0, max_duration=86400)
+            for block in sim.generate_frames_batched():
+                print(block['battery_soc'].mean())
+
+        Teaching Note:
+            The rover's state at tick N depends on tick N-1, so the
+            physics still runs one tick at a time. What does not have to
+            be per-tick is everything around it: building a frame dict,
+            drawing sixteen sensor noise values, boxing each result as a
+            Python float. Here each tick records the true state as one
+            tuple, and at the end of a chunk the tuples become a 2-D
+            array whose columns go through SensorSuite.read_all_batch()
+            - a few dozen numpy calls per chunk instead of a few dozen
+            Python calls per frame.
+        """
+        environment_step = self.environment.compile_for(self.timestep)
+        rover = self.rover
+        advance_rover = self._advance_rover
+        sensors = self.sensors
+        timestep = self.timestep
+        max_duration = self.max_duration
+
+        while True:
+            first_frame = self.frame_count
+            rows = []
+            timestamps = []
+            record_state = rows.append
+            record_time = timestamps.append
+
+            # Mission clock kept in a local for the whole chunk; nothing
+            # outside this loop can observe it before the chunk is yielded
+            now = self.current_time
+            while len(rows) < chunk:
+                if max_duration and now >= max_duration:
+                    break
+
+                # STEPS 1-3: environment, commands, rover physics
+                tick = environment_step(rover)
+                advance_rover(tick.solar_angle)
+
+                # Record true state; sensors are read per chunk below
+                record_state(_read_batch_state(rover))
+                record_time(now)
+                now += timestep
+
+            self.current_time = now
+            self.frame_count += len(rows)
+
+            if not rows:
+                break
+
+            # Columns of one (n, fields) block, one array per field
+            columns = np.array(rows, dtype=np.float64).T
+            states = dict(zip(BATCH_STATE_FIELDS, columns))
+
+            frames = sensors.read_all_batch(states, np.array(timestamps), dtype)
+            frames['frame_id'] = np.arange(first_frame, self.frame_count)
+            frames['sol'] = states['sol'].astype(np.int64)
+            frames['local_time'] = states['local_time'].astype(dtype, copy=False)
+            yield frames
+
+            if len(rows) < chunk:
+                break
+
+    def _advance_rover(self, solar_angle: float):
+        """
+        Apply automatic commands and the motion model for one tick.
+
+        Args:
+            solar_angle: Sun elevation this tick (degrees), from the
+                         environment step
+        """
+        # STEP 2: Process commands (if any)
+        # In this phase, we implement basic automatic behaviors: stop
+        # moving if the battery is low (a real rover would enter safe
+        # mode), run science during the day when stationary.
+        # Future phases will add command queue for scripted missions
+        #
+        # STEP 3: Update rover physics (motion model)
+        # Environment.update() already handles power, thermal, and hazards.
+        # Here the rover moves forward along its heading and slowly
+        # loses speed to friction (real rovers have explicit drive commands)
+        rover = self.rover
+        (rover.x, rover.y, rover.velocity,
+         rover.is_moving, rover.science_active) = _motion_tick(
+            self.timestep, solar_angle, rover.x, rover.y, rover.heading,
+            rover.velocity, rover.battery_soc, rover.is_moving,
+        )
+
+        # Teaching Note:
+        # The separation between environment effects (Step 1) and rover
+        # dynamics (Step 3) demonstrates modular simulation design.
+        # Environment provides external forces/conditions, rover physics
+        # determines how the rover responds.
+
     def run_mission(self, duration: float) -> list:
         """
         Run a complete mission and return all frames.
@@ -330,6 +459,50 @@ class SimulationGenerator:
 
         return frames
 
+    def run_mission_arrays(self, duration: float, dtype=np.float32) -> np.recarray:
+        """
+        Run a complete mission and return all frames as one record array.
+
+        Args:
+            duration: Mission duration in seconds
+            dtype: Precision of the telemetry fields (see
+                   generate_frames_batched)
+
+        Returns:
+            Record array with one row per frame and one field per
+            telemetry value (timestamp, roll, ..., frame_id, sol,
+            local_time); env_info is not included
+
+        Example:
+            mission = sim.run_mission_arrays(duration=86400)
+            print(mission.battery_soc.min(), mission[100].cpu_temp)
+
+        Teaching Note:
+            run_mission() keeps a dict per frame - roughly half a
+            kilobyte each. Here a frame is one fixed-size row of a
+            single allocation (92 bytes in float32), filled chunk by
+            chunk from generate_frames_batched().
+        """
+        # Temporarily override max_duration
+        original_max = self.max_duration
+        self.max_duration = duration
+
+        chunks = list(self.generate_frames_batched(dtype=dtype))
+
+        # Restore original max_duration
+        self.max_duration = original_max
+
+        mission = np.recarray(sum(len(c['timestamp']) for c in chunks),
+                              dtype=_mission_dtype(dtype))
+        start = 0
+        for chunk in chunks:
+            stop = start + len(chunk['timestamp'])
+            for name in mission.dtype.names:
+                mission[name][start:stop] = chunk[name]
+            start = stop
+
+        return mission
+
     def reset(self):
         """
         Reset simulation to initial state.
@@ -343,7 +516,6 @@ class SimulationGenerator:
         self.frame_count = 0
 
         if self.random_seed is not None:
-            import random
             random.seed(self.random_seed)
 
 
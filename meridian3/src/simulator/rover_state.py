@@ -53,16 +53,37 @@ TEACHING GOALS:
 
 DEBUGGING NOTES:
     - To inspect state: print(rover_state) or use __repr__
-    - To save state: consider adding to_dict() / from_dict() methods
+    - To save state: to_dict() / from_dict(), or pickle (uses __getstate__)
     - To visualize: create plotting functions that read state fields
 
 FUTURE EXTENSIONS:
     - Add state history buffer for trajectory analysis
     - Implement state validation (e.g., power can't be negative)
-    - Add serialization for checkpoint/restore
     - Include command history for debugging maneuvers
 """
 
+from typing import List
+
+import numpy as np
+
+from ._kernels import cupy
+
+
+# Packed single-rover record for compact snapshots of many rovers (see
+# RoverStateArrays.to_records). Floats are stored as float32: half the
+# bytes of a float64 and plenty for sensor-grade values. Time is kept
+# exact in clock_us; mission_time/local_time are convenience copies.
+ROVER_DTYPE = np.dtype([
+    ('x', 'f4'), ('y', 'f4'), ('z', 'f4'),
+    ('roll', 'f4'), ('pitch', 'f4'), ('heading', 'f4'), ('velocity', 'f4'),
+    ('battery_voltage', 'f4'), ('battery_current', 'f4'), ('battery_soc', 'f4'),
+    ('solar_panel_voltage', 'f4'), ('solar_panel_current', 'f4'),
+    ('cpu_temp', 'f4'), ('battery_temp', 'f4'), ('motor_temp', 'f4'), ('chassis_temp', 'f4'),
+    ('mission_time', 'f4'), ('local_time', 'f4'),
+    ('clock_us', 'i8'), ('sol', 'i4'),
+    ('is_moving', '?'), ('is_charging', '?'), ('heater_active', '?'), ('science_active', '?'),
+])
+
 
 class RoverState:
     """
@@ -72,6 +93,17 @@ class RoverState:
     detailed inline documentation of each state variable.
     """
 
+    # Every field, declared up front: instances store them in fixed slots
+    # instead of a per-instance __dict__ (smaller, faster attribute reads)
+    __slots__ = (
+        'x', 'y', 'z', 'roll', 'pitch', 'heading', 'velocity',
+        'battery_voltage', 'battery_current', 'battery_soc',
+        'solar_panel_voltage', 'solar_panel_current',
+        'cpu_temp', 'battery_temp', 'motor_temp', 'chassis_temp',
+        'clock_us', 'mission_time', 'sol', 'local_time',
+        'is_moving', 'is_charging', 'heater_active', 'science_active',
+    )
+
     def __init__(self):
         """
         Initialize rover state with default values representing a healthy rover
@@ -114,6 +146,10 @@ class RoverState:
         # ═══════════════════════════════════════════════════════════
         # TIME & MISSION CONTEXT
         # ═══════════════════════════════════════════════════════════
+        # clock_us is the source of truth: an exact integer count of
+        # microseconds, so millions of small steps never drift. The three
+        # fields below are derived from it each tick by the Environment.
+        self.clock_us = 0                # Microseconds since mission start
         self.mission_time = 0.0          # Seconds since mission start
         self.sol = 0                     # Martian day number (1 sol ≈ 24.6 hours)
         self.local_time = 0.0            # Time of sol in seconds (0-88775)
@@ -139,17 +175,36 @@ class RoverState:
             f"moving={self.is_moving})"
         )
 
+    # __getstate__ / __setstate__ are generated below the class from
+    # __slots__ (see _compile_state_methods)
+
+    def to_dict(self) -> dict:
+        """
+        Serialize state to a dictionary for storage/transmission.
+
+        Returns:
+            Dictionary with one key per field, in __slots__ order
+        """
+        return dict(zip(self.__slots__, self.__getstate__()))
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'RoverState':
+        """
+        Restore state from a dictionary made by to_dict().
+
+        Args:
+            data: Dictionary with every RoverState field
+
+        Returns:
+            New RoverState with those values
+        """
+        state = cls.__new__(cls)
+        state.__setstate__(tuple(data[name] for name in cls.__slots__))
+        return state
+
     # ═══════════════════════════════════════════════════════════════
     # FUTURE EXTENSION IDEAS
     # ═══════════════════════════════════════════════════════════════
-    # def to_dict(self) -> dict:
-    #     """Serialize state to dictionary for storage/transmission."""
-    #     pass
-    #
-    # def from_dict(cls, data: dict) -> 'RoverState':
-    #     """Restore state from serialized dictionary."""
-    #     pass
-    #
     # def validate(self) -> list:
     #     """Check state for physically impossible values, return warnings."""
     #     pass
@@ -157,3 +212,189 @@ class RoverState:
     # def update_derived_values(self):
     #     """Compute derived quantities like power consumption, thermal balance."""
     #     pass
+
+
+def _compile_state_methods(cls):
+    """
+    Generate cls.__getstate__ / __setstate__ as straight-line code over
+    cls.__slots__.
+
+    Teaching Note:
+        A snapshot is just every field in a fixed order. Written as a loop
+        (getattr per name) that costs a Python-level call per field;
+        written out as 'return (self.x, self.y, ...)' it is one tuple
+        build. Rather than maintain 24 names by hand in two places, we
+        generate that source from __slots__ once at import and exec() it,
+        the same trick Environment.compile_for() uses for the tick. pickle
+        and copy use these methods too, so checkpoints get the fast path.
+    """
+    targets = ', '.join(f'self.{name}' for name in cls.__slots__)
+    source = (
+        f"def __getstate__(self):\n"
+        f"    return ({targets},)\n"
+        f"def __setstate__(self, state):\n"
+        f"    ({targets},) = state\n"
+    )
+    namespace = {}
+    exec(source, namespace)
+    cls.__getstate__ = namespace['__getstate__']
+    cls.__setstate__ = namespace['__setstate__']
+
+
+_compile_state_methods(RoverState)
+
+
+class RoverStateArrays:
+    """
+    State of many rovers (or many Monte-Carlo runs) as Struct-of-Arrays.
+
+    Same fields as RoverState, but each field is a numpy array with one
+    element per rover, so Environment.update_batch() can advance all of
+    them with a handful of array operations instead of a Python loop.
+
+    Teaching Note:
+        RoverState is an "array of structures" when you hold a list of
+        them: rover 0's fields, then rover 1's fields, ... Here it is the
+        other way round - every battery_soc together, every cpu_temp
+        together - which is exactly the layout vectorized math wants.
+    """
+
+    # Field names by storage type
+    FLOAT_FIELDS = (
+        'x', 'y', 'z', 'roll', 'pitch', 'heading', 'velocity',
+        'battery_voltage', 'battery_current', 'battery_soc',
+        'solar_panel_voltage', 'solar_panel_current',
+        'cpu_temp', 'battery_temp', 'motor_temp', 'chassis_temp',
+        'mission_time', 'local_time',
+    )
+    INT_FIELDS = ('clock_us', 'sol')
+    BOOL_FIELDS = ('is_moving', 'is_charging', 'heater_active', 'science_active')
+
+    # Thermal masses, stored together as the rows of one (4, n) block
+    TEMP_FIELDS = ('cpu_temp', 'battery_temp', 'motor_temp', 'chassis_temp')
+
+    def __init__(self, n: int):
+        """
+        Create n rovers, each with RoverState's default values.
+
+        Args:
+            n: Number of rovers
+        """
+        self.n = n
+        defaults = RoverState()
+        for name in self.FLOAT_FIELDS:
+            setattr(self, name, np.full(n, getattr(defaults, name), dtype=np.float64))
+        for name in self.INT_FIELDS:
+            setattr(self, name, np.full(n, getattr(defaults, name), dtype=np.int64))
+        for name in self.BOOL_FIELDS:
+            setattr(self, name, np.full(n, getattr(defaults, name), dtype=bool))
+        self._pack_temps(np)
+
+    def _pack_temps(self, xp):
+        """
+        Gather the four temperature arrays into self.temps and rebind
+        each name to its row, so both spellings share memory.
+
+        Teaching Note:
+            All four temperatures follow the same first-order law toward
+            ambient, so update_batch() relaxes the whole block with one
+            array expression rather than four.
+        """
+        self.temps = xp.stack([getattr(self, name) for name in self.TEMP_FIELDS])
+        for row, name in enumerate(self.TEMP_FIELDS):
+            setattr(self, name, self.temps[row])
+
+    @classmethod
+    def from_states(cls, states: List[RoverState]) -> 'RoverStateArrays':
+        """
+        Pack a list of RoverState objects into arrays.
+
+        Args:
+            states: Rover states, one per array element
+
+        Returns:
+            New RoverStateArrays
+        """
+        arrays = cls(len(states))
+        for name in cls.FLOAT_FIELDS + cls.INT_FIELDS + cls.BOOL_FIELDS:
+            getattr(arrays, name)[:] = [getattr(state, name) for state in states]
+        return arrays
+
+    def to_state(self, i: int) -> RoverState:
+        """
+        Unpack one rover into a RoverState object.
+
+        Args:
+            i: Rover index
+
+        Returns:
+            New RoverState with plain Python field values
+        """
+        state = RoverState()
+        for name in self.FLOAT_FIELDS + self.INT_FIELDS + self.BOOL_FIELDS:
+            setattr(state, name, getattr(self, name)[i].item())
+        return state
+
+    def to_records(self) -> np.ndarray:
+        """
+        Pack all rovers into one compact structured array.
+
+        Returns:
+            Array of ROVER_DTYPE records, one per rover
+
+        Teaching Note:
+            A RoverState holds ~25 boxed Python objects; a ROVER_DTYPE
+            record is 88 bytes in one contiguous block. Snapshots of large
+            fleets or long histories take a fraction of the memory and
+            can be saved with np.save in a single call.
+        """
+        records = np.empty(self.n, dtype=ROVER_DTYPE)
+        for name in ROVER_DTYPE.names:
+            records[name] = getattr(self, name)
+        return records
+
+    @classmethod
+    def from_records(cls, records: np.ndarray) -> 'RoverStateArrays':
+        """
+        Unpack ROVER_DTYPE records (see to_records) into working arrays.
+
+        Args:
+            records: Structured array of ROVER_DTYPE
+
+        Returns:
+            New RoverStateArrays (float fields widened back to float64)
+        """
+        arrays = cls(len(records))
+        for name in ROVER_DTYPE.names:
+            getattr(arrays, name)[:] = records[name]
+        return arrays
+
+    def to_device(self) -> 'RoverStateArrays':
+        """
+        Move every field array into GPU memory, for update_batch_cuda().
+
+        Returns:
+            self, now holding cupy arrays
+
+        Raises:
+            ImportError: If cupy is not installed
+        """
+        if cupy is None:
+            raise ImportError("RoverStateArrays.to_device requires cupy")
+        for name in self.FLOAT_FIELDS + self.INT_FIELDS + self.BOOL_FIELDS:
+            setattr(self, name, cupy.asarray(getattr(self, name)))
+        self._pack_temps(cupy)
+        return self
+
+    def to_host(self) -> 'RoverStateArrays':
+        """
+        Move every field array back to numpy (no-op if already there).
+
+        Returns:
+            self, now holding numpy arrays
+        """
+        if cupy is not None:
+            for name in self.FLOAT_FIELDS + self.INT_FIELDS + self.BOOL_FIELDS:
+                setattr(self, name, cupy.asnumpy(getattr(self, name)))
+            self._pack_temps(np)
+        return self
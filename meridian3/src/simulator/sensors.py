@@ -74,14 +74,72 @@ FUTURE EXTENSIONS:
     - Implement sensor health degradation over mission lifetime
 """
 
+import math
 import random
-from typing import Dict, Any
-import sys
-import os
+from typing import Dict, Any, NamedTuple, Optional
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from utils.math_helpers import add_gaussian_noise, random_walk_drift, clamp
+import numpy as np
+
+# meridian3/src is on sys.path for every entry point (tests, examples,
+# Streamlit pages), so utils is importable as a top-level package
+from utils.math_helpers import random_walk_drift, clamp
+from ._kernels import NoisePool
+
+
+# Normal draws buffered per sensor (see NoisePool)
+SENSOR_NOISE_CHUNK = 4096
+
+# IMU gyro drift: a 0.01°/hour random walk, advanced once per suite read,
+# with READ_INTERVAL seconds assumed between reads
+IMU_DRIFT_RATE = 0.01 / 3600
+READ_INTERVAL = 1.0
+_IMU_DRIFT_STEP = IMU_DRIFT_RATE * math.sqrt(READ_INTERVAL)
+
+
+class TelemetryFrame(NamedTuple):
+    """
+    One telemetry frame as a flat immutable record: every sensor reading
+    for one tick plus the metadata SimulationGenerator attaches.
+
+    Field order matches the key order of the frame dicts the generator
+    yields, so as_dict() reproduces them exactly. env_info is either the
+    env_info dict or the environment's EnvTick record, which as_dict()
+    expands only when a dict is actually asked for.
+    """
+    timestamp: float
+    roll: float
+    pitch: float
+    heading: float
+    battery_voltage: float
+    battery_current: float
+    battery_soc: float
+    solar_voltage: float
+    solar_current: float
+    cpu_temp: float
+    battery_temp: float
+    motor_temp: float
+    chassis_temp: float
+    x: float
+    y: float
+    z: float
+    velocity: float
+    frame_id: int = 0
+    sol: int = 0
+    local_time: float = 0.0
+    env_info: Optional[Dict] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Convert to the telemetry frame dict the pipeline consumes.
+
+        Returns:
+            Dictionary with one key per field, in field order
+        """
+        frame = dict(zip(self._fields, self))
+        to_env_info = getattr(self.env_info, 'to_env_info', None)
+        if to_env_info is not None:
+            frame['env_info'] = to_env_info()
+        return frame
 
 
 class SensorBase:
@@ -97,6 +155,8 @@ class SensorBase:
     Derived classes implement read() method for specific sensor types.
     """
 
+    __slots__ = ('name', 'noise_stddev', 'bias', 'drift', '_noise')
+
     def __init__(self, name: str, noise_stddev: float = 0.0, bias: float = 0.0):
         """
         Initialize sensor with noise and bias parameters.
@@ -111,6 +171,10 @@ class SensorBase:
         self.bias = bias
         self.drift = 0.0  # Accumulated drift over time
 
+        # Gaussian draws, generated by numpy in blocks and seeded from the
+        # random module on first use (so random.seed() still governs them)
+        self._noise = NoisePool(SENSOR_NOISE_CHUNK)
+
     def apply_noise(self, true_value: float) -> float:
         """
         Apply noise, bias, and drift to a true state value.
@@ -126,12 +190,43 @@ class SensorBase:
             - Gaussian noise: Random fluctuations from electronics
             - Bias: Constant offset (calibration error)
             - Drift: Time-varying bias (thermal effects, aging)
+
+            The noise itself is the same Gaussian that add_gaussian_noise()
+            from math_helpers produces, but read from a pre-drawn block:
+            every frame needs a dozen of these, and one numpy call per
+            few thousand draws is far cheaper than a random.gauss() each.
         """
-        # Use math_helpers for consistent noise generation
-        noisy_value = add_gaussian_noise(true_value, self.noise_stddev)
+        noisy_value = true_value + self._noise.gauss(self.noise_stddev)
         measured = noisy_value + self.bias + self.drift
         return measured
 
+    def apply_noise_batch(self, true_values: np.ndarray, rng: np.random.Generator,
+                          drift: Optional[np.ndarray] = None,
+                          out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Array version of apply_noise(): one noisy reading per element.
+
+        Args:
+            true_values: Array of actual physical quantities
+            rng: numpy Generator supplying the noise
+            drift: Optional per-element drift (defaults to self.drift)
+            out: Optional array to write the readings into; its dtype
+                 (float32 or float64) sets the precision of the result
+
+        Returns:
+            Array of measured values (out itself, when given)
+        """
+        if drift is None:
+            drift = self.drift
+        if out is None:
+            out = np.empty(true_values.shape)
+        rng.standard_normal(out.shape, dtype=out.dtype, out=out)
+        out *= self.noise_stddev
+        out += true_values
+        out += self.bias
+        out += drift
+        return out
+
     def update_drift(self, dt: float, drift_rate: float):
         """
         Update sensor drift based on elapsed time.
@@ -172,6 +267,8 @@ class IMUSensor(SensorBase):
         - Update rate: 10 Hz
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(name="IMU", noise_stddev=0.1, bias=0.0)
 
@@ -202,6 +299,8 @@ class PowerSensor(SensorBase):
         - SoC: ±2% accuracy
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(name="PowerMonitor", noise_stddev=0.05, bias=0.0)
 
@@ -234,9 +333,20 @@ class ThermalSensor(SensorBase):
         - Update rate: 1 Hz
     """
 
+    __slots__ = ('_res', '_inv_res')
+
     def __init__(self):
         super().__init__(name="ThermalArray", noise_stddev=0.5, bias=0.0)
 
+        # 0.1°C resolution, with its reciprocal cached so quantizing is
+        # two multiplies instead of a division (see _quantize_thermal)
+        self._res = 0.1
+        self._inv_res = 10.0
+
+    def _quantize_thermal(self, value: float) -> float:
+        """quantize(value, self._res), with the division done as a multiply."""
+        return round(value * self._inv_res) * self._res
+
     def read(self, rover_state) -> Dict[str, float]:
         """
         Read temperature sensors with thermal noise.
@@ -247,11 +357,12 @@ class ThermalSensor(SensorBase):
         Returns:
             Dictionary with temperature measurements
         """
+        quantize, noise = self._quantize_thermal, self.apply_noise
         return {
-            'cpu_temp': self.quantize(self.apply_noise(rover_state.cpu_temp), 0.1),
-            'battery_temp': self.quantize(self.apply_noise(rover_state.battery_temp), 0.1),
-            'motor_temp': self.quantize(self.apply_noise(rover_state.motor_temp), 0.1),
-            'chassis_temp': self.quantize(self.apply_noise(rover_state.chassis_temp), 0.1),
+            'cpu_temp': quantize(noise(rover_state.cpu_temp)),
+            'battery_temp': quantize(noise(rover_state.battery_temp)),
+            'motor_temp': quantize(noise(rover_state.motor_temp)),
+            'chassis_temp': quantize(noise(rover_state.chassis_temp)),
         }
 
 
@@ -262,12 +373,17 @@ class SensorSuite:
     Provides a single interface to read all telemetry at once.
     """
 
+    __slots__ = ('imu', 'power', 'thermal', '_batch_rng')
+
     def __init__(self):
         """Initialize all sensors in the suite."""
         self.imu = IMUSensor()
         self.power = PowerSensor()
         self.thermal = ThermalSensor()
 
+        # numpy Generator for read_all_batch(), seeded on first use
+        self._batch_rng = None
+
     def read_all(self, rover_state, mission_time: float) -> Dict[str, Any]:
         """
         Read all sensors and compile into a single telemetry frame.
@@ -279,9 +395,9 @@ class SensorSuite:
         Returns:
             Complete telemetry frame with all sensor readings
         """
-        # Update sensor drift based on elapsed time
-        dt = 1.0  # Assume 1 second between readings (will be parameterized later)
-        self.imu.update_drift(dt, drift_rate=0.01 / 3600)  # 0.01°/hour
+        # Update sensor drift based on elapsed time. Only the IMU drifts:
+        # the update_drift() random walk, with its step size precomputed
+        self.imu.drift += random.gauss(0, _IMU_DRIFT_STEP)
 
         # Compile frame from all sensors
         frame = {
@@ -298,6 +414,124 @@ class SensorSuite:
 
         return frame
 
+    def read_frame(self, rover_state, mission_time: float, frame_id: int = 0,
+                   sol: int = 0, local_time: float = 0.0,
+                   env_info: Optional[Dict] = None) -> TelemetryFrame:
+        """
+        Read all sensors into a TelemetryFrame, metadata included.
+
+        Args:
+            rover_state: Current RoverState object
+            mission_time: Current mission elapsed time (seconds)
+            frame_id, sol, local_time, env_info: Frame metadata, stored as-is
+
+        Returns:
+            TelemetryFrame with the same readings read_all() would give
+
+        Teaching Note:
+            read_all() builds a dict per sensor and merges them, and the
+            generator then grows the merged dict with its metadata keys -
+            several hash tables per tick. Here each reading goes straight
+            into one tuple. Noise is drawn in the same order as read_all(),
+            so a seeded run produces the same numbers either way.
+        """
+        imu, power, thermal = self.imu, self.power, self.thermal
+        quantize = thermal._quantize_thermal
+        imu.drift += random.gauss(0, _IMU_DRIFT_STEP)  # as in read_all()
+        return TelemetryFrame(
+            mission_time,
+            imu.apply_noise(rover_state.roll),
+            imu.apply_noise(rover_state.pitch),
+            imu.apply_noise(rover_state.heading),
+            power.apply_noise(rover_state.battery_voltage),
+            power.apply_noise(rover_state.battery_current),
+            power.apply_noise(rover_state.battery_soc),
+            power.apply_noise(rover_state.solar_panel_voltage),
+            power.apply_noise(rover_state.solar_panel_current),
+            quantize(thermal.apply_noise(rover_state.cpu_temp)),
+            quantize(thermal.apply_noise(rover_state.battery_temp)),
+            quantize(thermal.apply_noise(rover_state.motor_temp)),
+            quantize(thermal.apply_noise(rover_state.chassis_temp)),
+            rover_state.x,
+            rover_state.y,
+            rover_state.z,
+            rover_state.velocity,
+            frame_id,
+            sol,
+            local_time,
+            env_info,
+        )
+
+    def read_all_batch(self, states: Dict[str, np.ndarray], timestamps: np.ndarray,
+                       dtype=np.float64) -> Dict[str, np.ndarray]:
+        """
+        Read all sensors for a whole run of ticks at once.
+
+        Args:
+            states: True rover state per tick, keyed by RoverState field
+                    name (roll, pitch, heading, battery_voltage, ...,
+                    x, y, z, velocity), one array element per tick
+            timestamps: Mission time of each tick (seconds)
+            dtype: Precision of the returned readings (np.float32 halves
+                   their size). Timestamps are returned unchanged.
+
+        Returns:
+            Dictionary of arrays with the same keys as read_all()'s frame
+
+        Teaching Note:
+            Sensor noise does not depend on earlier readings, so it can
+            be drawn for every tick in one numpy call. IMU drift does -
+            it is a random walk - but a random walk is just a running sum
+            of independent steps, which np.cumsum computes in one pass.
+            The noise comes from numpy's generator rather than the random
+            module, so values differ from read_all() called tick by tick,
+            while the statistics are the same.
+        """
+        if self._batch_rng is None:
+            self._batch_rng = np.random.default_rng(random.getrandbits(64))
+        rng = self._batch_rng
+        n = len(timestamps)
+
+        # Drift as read_all() would have it on each tick
+        steps = rng.normal(0.0, _IMU_DRIFT_STEP, n)
+        drift = self.imu.drift + np.cumsum(steps)
+        if n:
+            self.imu.drift = float(drift[-1])
+
+        def read(sensor, name, drift=None):
+            return sensor.apply_noise_batch(states[name], rng, drift,
+                                            out=np.empty(n, dtype=dtype))
+
+        def read_quantized(sensor, name):
+            # Round to the thermistors' resolution, in place (the array
+            # form of ThermalSensor._quantize_thermal)
+            values = read(sensor, name)
+            values *= sensor._inv_res
+            np.rint(values, out=values)
+            values *= sensor._res
+            return values
+
+        imu, power, thermal = self.imu, self.power, self.thermal
+        return {
+            'timestamp': timestamps,
+            'roll': read(imu, 'roll', drift),
+            'pitch': read(imu, 'pitch', drift),
+            'heading': read(imu, 'heading', drift),
+            'battery_voltage': read(power, 'battery_voltage'),
+            'battery_current': read(power, 'battery_current'),
+            'battery_soc': read(power, 'battery_soc'),
+            'solar_voltage': read(power, 'solar_panel_voltage'),
+            'solar_current': read(power, 'solar_panel_current'),
+            'cpu_temp': read_quantized(thermal, 'cpu_temp'),
+            'battery_temp': read_quantized(thermal, 'battery_temp'),
+            'motor_temp': read_quantized(thermal, 'motor_temp'),
+            'chassis_temp': read_quantized(thermal, 'chassis_temp'),
+            'x': states['x'].astype(dtype, copy=False),
+            'y': states['y'].astype(dtype, copy=False),
+            'z': states['z'].astype(dtype, copy=False),
+            'velocity': states['velocity'].astype(dtype, copy=False),
+        }
+
 
 # ═══════════════════════════════════════════════════════════════
 # FUTURE EXTENSION IDEAS
@@ -0,0 +1,731 @@
+"""
+Unit tests for the Environment system.
+
+Tests cover:
+    - Hazard event generation and reproducibility
+    - Orbital mechanics (solar angle, solar power)
+    - Terrain effects on power consumption
+    - Environment.update() effects on rover state
+"""
+
+import json
+import math
+import numpy as np
+import pytest
+import random
+import sys
+from pathlib import Path
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / 'meridian3' / 'src'))
+
+from simulator.environment import (
+    Environment, HazardEvent, HazardSystem, OrbitalMechanics, TerrainGrid,
+    TerrainModel, TerrainTileCache,
+)
+from simulator.rover_state import RoverState, RoverStateArrays
+from simulator import _kernels
+
+
+def run_hazards(hazards, rover, ticks, dt=1.0):
+    """Step a HazardSystem and collect every event it emits."""
+    events = []
+    for _ in range(ticks):
+        events.extend(hazards.update(dt, rover))
+    return events
+
+
+class TestHazardSystem:
+    """Test hazard event generation."""
+
+    def test_same_seed_same_events(self):
+        """Seeding the random module should make hazards reproducible."""
+        runs = []
+        for _ in range(2):
+            hazards = HazardSystem()
+            random.seed(7)  # seeding after construction must still count
+            hazards.dust_devil_mtbe = 50.0
+            runs.append(run_hazards(hazards, RoverState(), 1000))
+
+        assert runs[0] == runs[1]
+        assert len(runs[0]) > 0
+
+    def test_event_rate_matches_mtbe(self):
+        """Events should arrive at roughly dt / mtbe per tick."""
+        random.seed(3)
+        hazards = HazardSystem()
+        hazards.dust_devil_mtbe = 100.0
+
+        events = run_hazards(hazards, RoverState(), 20000)
+        dust = [e for e in events if e.type == 'dust_devil']
+
+        assert 150 <= len(dust) <= 250
+
+    def test_event_parameters_in_range(self):
+        """Severity and duration should stay within each hazard's bounds."""
+        random.seed(5)
+        hazards = HazardSystem()
+        hazards.dust_devil_mtbe = 10.0
+        hazards.radiation_spike_mtbe = 10.0
+        rover = RoverState()
+        rover.is_moving = True
+        hazards.slip_event_mtbe = 10.0
+
+        bounds = {
+            'dust_devil': ((0.3, 1.0), (60.0, 300.0)),
+            'radiation_spike': ((0.5, 1.0), (10.0, 60.0)),
+            'slip': ((0.2, 0.8), (1.0, 1.0)),
+        }
+        for event in run_hazards(hazards, rover, 2000):
+            (sev_lo, sev_hi), (dur_lo, dur_hi) = bounds[event.type]
+            assert sev_lo <= event.severity <= sev_hi
+            assert dur_lo <= event.duration <= dur_hi
+
+    def test_draws_consumed_only_by_events(self):
+        """Quiet ticks should use no randomness: 3 to schedule, then per event."""
+        random.seed(17)
+        hazards = HazardSystem()
+        hazards.dust_devil_mtbe = 500.0
+        hazards.radiation_spike_mtbe = 500.0
+        hazards.slip_event_mtbe = 500.0
+        rover = RoverState()
+        rover.is_moving = True
+
+        events = run_hazards(hazards, rover, 5000)
+        per_event = {'dust_devil': 3, 'radiation_spike': 3, 'slip': 2}
+
+        assert len(events) > 0
+        assert hazards._draw_index == 3 + sum(per_event[e.type] for e in events)
+
+    def test_effects_dispatched_by_type(self):
+        """Each hazard type should reach its own handler; unknown types do nothing."""
+        hazards = HazardSystem()
+        rover = RoverState()
+        cpu_before, soc_before = rover.cpu_temp, rover.battery_soc
+
+        hazards.apply_hazard_effects(HazardEvent('radiation_spike', 0.5, 10.0), rover)
+        assert rover.cpu_temp == cpu_before + 5.0
+        assert rover.battery_soc == pytest.approx(soc_before - 0.05)
+
+        before = TestCompileFor.snapshot(rover)
+        hazards.apply_hazard_effects(HazardEvent('meteor', 1.0, 1.0), rover)
+        assert TestCompileFor.snapshot(rover) == before
+
+    def test_effects_accept_hazard_dicts(self):
+        """The original {'type', 'severity', 'duration'} dict should still apply."""
+        hazards = HazardSystem()
+        rover = RoverState()
+        cpu_before = rover.cpu_temp
+
+        hazards.apply_hazard_effects(
+            {'type': 'radiation_spike', 'severity': 0.5, 'duration': 10.0}, rover
+        )
+        assert rover.cpu_temp == cpu_before + 5.0
+
+    def test_slip_clock_runs_only_while_moving(self):
+        """Time spent parked should not bring the next slip closer."""
+        random.seed(13)
+        hazards = HazardSystem()
+        hazards.slip_event_mtbe = 100.0
+        rover = RoverState()
+
+        run_hazards(hazards, rover, 1000)
+        assert hazards._moving_clock == 0.0
+
+        rover.is_moving = True
+        slips = [e for e in run_hazards(hazards, rover, 20000) if e.type == 'slip']
+        assert 150 <= len(slips) <= 250
+
+    def test_active_hazards_expire(self):
+        """Spawned hazards stay active for their duration, then drop out."""
+        hazards = HazardSystem()
+        hazards.reschedule()
+        hazards.spawn_events(_kernels.HAZARD_RADIATION | _kernels.HAZARD_SLIP)
+
+        active = hazards.active_hazards
+        assert sorted(active['type'].tolist()) == [1, 2]
+
+        hazards._age_active(1.0)  # slip lasts exactly one second
+        assert hazards.active_hazards['type'].tolist() == [1]
+
+        hazards._age_active(60.0)
+        assert len(hazards.active_hazards) == 0
+
+    def test_active_buffer_grows_when_full(self):
+        """More simultaneous hazards than the initial capacity is fine."""
+        hazards = HazardSystem()
+        for _ in range(100):
+            hazards._add_active(0, 0.5, 100.0)
+
+        assert len(hazards.active_hazards) == 100
+
+    def test_no_slip_when_stationary(self):
+        """Slip events require the rover to be moving."""
+        random.seed(11)
+        hazards = HazardSystem()
+        hazards.slip_event_mtbe = 1.0
+
+        events = run_hazards(hazards, RoverState(), 500)
+        assert not [e for e in events if e.type == 'slip']
+
+
+class TestTerrainModel:
+    """Test terrain power multipliers."""
+
+    def test_power_multiplier_by_surface(self):
+        """Surface type should scale drive power."""
+        terrain = TerrainModel()
+        assert terrain.calculate_power_multiplier(0.0, 'firm') == 1.0
+        assert terrain.calculate_power_multiplier(0.0, 'rocky') == pytest.approx(1.4)
+        assert terrain.calculate_power_multiplier(10.0, 'loose') == pytest.approx(1.5 * 1.3)
+        assert terrain.calculate_power_multiplier(0.0, 'lava') == 1.0
+
+    def test_surface_code_follows_surface_type(self):
+        """Setting surface_type should keep the integer code in sync."""
+        terrain = TerrainModel()
+        terrain.surface_type = 'icy'
+
+        assert terrain.surface_code == _kernels.SURFACE_ICY
+        assert terrain.get_terrain_at(0.0, 0.0)['surface_type'] == 'icy'
+        assert terrain.calculate_power_multiplier(0.0, terrain.surface_code) == pytest.approx(0.9)
+
+    def test_surface_type_accepts_enum(self):
+        """Assigning a Surface member should set both the name and the code."""
+        terrain = TerrainModel()
+        terrain.surface_type = _kernels.Surface.ROCKY
+
+        assert terrain.surface_type == 'rocky'
+        assert terrain.surface_code is _kernels.Surface.ROCKY
+        assert terrain.calculate_power_multiplier(10.0) == pytest.approx(1.5 * 1.4)
+
+    def test_multiplier_cached_on_assignment(self):
+        """Omitting the surface should use the cached multiplier."""
+        terrain = TerrainModel()
+        terrain.surface_type = 'loose'
+
+        assert terrain.surface_multiplier == pytest.approx(1.3)
+        assert terrain.calculate_power_multiplier(10.0) == pytest.approx(1.5 * 1.3)
+
+    def test_sample_view_reused_until_changed(self):
+        """Uniform terrain should hand back one cached tuple until edited."""
+        terrain = TerrainModel()
+        first = terrain.sample(0.0, 0.0)
+
+        assert terrain.sample(50.0, -20.0) is first
+
+        terrain.dust_level = 0.4
+        terrain.surface_type = 'dusty'
+        assert terrain.sample(0.0, 0.0) == (0.0, _kernels.SURFACE_DUSTY, 0.0, 0.4)
+
+    def test_batch_matches_scalar(self):
+        """The grid form should agree with the scalar method cell by cell."""
+        terrain = TerrainModel()
+        surfaces = list(_kernels.SURFACE_CODES)
+        slopes = np.linspace(-25.0, 25.0, 40).reshape(8, 5)
+        codes = np.arange(40).reshape(8, 5) % len(surfaces)
+
+        grid = TerrainModel.power_multiplier_batch(slopes, codes)
+
+        assert grid.shape == (8, 5)
+        for (r, c), value in np.ndenumerate(grid):
+            expected = terrain.calculate_power_multiplier(slopes[r, c], surfaces[codes[r, c]])
+            assert value == pytest.approx(expected)
+
+
+class TestTerrainGrid:
+    """Test Struct-of-Arrays terrain sampling."""
+
+    @pytest.fixture
+    def grid(self):
+        """A 4x6 grid of 2 m cells with a distinct slope per cell."""
+        grid = TerrainGrid((4, 6), cell_size=2.0)
+        grid.slope[:] = np.arange(24, dtype=np.float32).reshape(4, 6)
+        grid.surface_code[2, 3] = _kernels.SURFACE_ROCKY
+        return grid
+
+    def test_sample_maps_world_to_cell(self, grid):
+        """x selects the column and y the row."""
+        slope, code, roughness, dust = grid.sample(7.0, 5.0)  # row 2, col 3
+
+        assert slope == 15.0
+        assert code == _kernels.SURFACE_ROCKY
+        assert type(slope) is float and type(code) is int
+
+    def test_sample_clamps_outside_grid(self, grid):
+        """Positions off the map use the nearest edge cell."""
+        assert grid.sample(-50.0, -50.0)[0] == 0.0
+        assert grid.sample(500.0, 500.0)[0] == 23.0
+
+    def test_sample_many_matches_sample(self, grid):
+        """The batched lookup should agree with scalar sampling."""
+        xs = np.array([0.5, 7.0, 11.9, 30.0])
+        ys = np.array([0.5, 5.0, 7.9, -3.0])
+        slopes, codes, _, _ = grid.sample_many(xs, ys)
+
+        for k in range(len(xs)):
+            slope, code, _, _ = grid.sample(xs[k], ys[k])
+            assert slopes[k] == slope
+            assert codes[k] == code
+
+    def test_power_multiplier_grid(self, grid):
+        """The whole-grid power map should match per-cell calculation."""
+        terrain = TerrainModel()
+        terrain.grid = grid
+        costs = terrain.power_multiplier_grid()
+
+        assert costs.shape == (4, 6)
+        assert costs[2, 3] == pytest.approx(
+            terrain.calculate_power_multiplier(15.0, _kernels.SURFACE_ROCKY))
+        assert costs[0, 0] == 1.0
+
+    def test_power_multiplier_grid_requires_grid(self):
+        """Uniform terrain has no grid to map."""
+        with pytest.raises(ValueError):
+            TerrainModel().power_multiplier_grid()
+
+    def test_terrain_model_uses_grid(self, grid):
+        """Attaching a grid should make terrain vary with position."""
+        terrain = TerrainModel()
+        terrain.grid = grid
+
+        info = terrain.get_terrain_at(7.0, 5.0)
+        assert info['slope_angle'] == 15.0
+        assert info['surface_type'] == 'rocky'
+
+
+class TestTerrainTileCache:
+    """Test LRU tile streaming of terrain."""
+
+    @staticmethod
+    def make_loader(calls):
+        """Tile loader whose slope encodes the tile and cell coordinates."""
+        def load_tile(tx, ty):
+            calls.append((tx, ty))
+            tile = TerrainGrid((8, 8))
+            rows, cols = np.mgrid[0:8, 0:8]
+            tile.slope[:] = tx * 1000 + ty * 100 + rows * 8 + cols
+            return tile
+        return load_tile
+
+    def test_sample_resolves_tile_and_cell(self):
+        """World position should map to the right tile and cell."""
+        cache = TerrainTileCache(self.make_loader([]), tile_size=8)
+
+        assert cache.sample(19.0, 10.0)[0] == 2 * 1000 + 1 * 100 + 2 * 8 + 3
+        assert cache.sample(-1.0, 0.0)[0] == -1000 + 7
+
+    def test_tiles_loaded_once(self):
+        """Repeated lookups in one tile should hit the cache."""
+        calls = []
+        cache = TerrainTileCache(self.make_loader(calls), tile_size=8)
+        for step in range(100):
+            cache.sample(step * 0.05, 3.0)
+
+        assert calls == [(0, 0)]
+        assert cache.cache_info().hits == 99
+
+    def test_least_recently_used_tile_evicted(self):
+        """Only max_tiles tiles stay resident."""
+        calls = []
+        cache = TerrainTileCache(self.make_loader(calls), tile_size=8, max_tiles=2)
+        for x in (0.0, 8.0, 16.0, 0.0):
+            cache.sample(x, 0.0)
+
+        assert calls == [(0, 0), (1, 0), (2, 0), (0, 0)]
+
+    def test_sample_many_matches_sample(self):
+        """Batched lookups spanning tiles should agree with scalar sampling."""
+        cache = TerrainTileCache(self.make_loader([]), tile_size=8)
+        xs = np.array([0.5, 9.0, 30.2, -4.0, 9.5])
+        ys = np.array([0.5, 2.0, 17.0, 3.0, 2.5])
+
+        slopes = cache.sample_many(xs, ys)[0]
+        for k in range(len(xs)):
+            assert slopes[k] == cache.sample(xs[k], ys[k])[0]
+
+
+class TestOrbitalMechanics:
+    """Test the solar lookup tables against the closed-form model."""
+
+    def test_solar_angle_matches_formula(self):
+        """Interpolated solar angle should track the sinusoid at bucket starts."""
+        orbit = OrbitalMechanics()
+        for i in range(2000):
+            t = i * 40.0
+            exact = max(0.0, math.sin(t / orbit.mars_sol_length * 2 * math.pi) * 90)
+            assert orbit.get_solar_angle(t) == pytest.approx(exact, abs=1e-4)
+
+    def test_lookup_tables_shared(self):
+        """Every instance should reuse the module's tables, even with a custom sol."""
+        first, second = OrbitalMechanics(), OrbitalMechanics()
+        second.mars_sol_length = 1000.0
+
+        assert first._angle_table is second._angle_table
+        assert second.get_solar_angle(250.0) == pytest.approx(90.0, abs=1e-3)
+
+    def test_solar_angle_wraps_past_sol_end(self):
+        """Times past one sol should map back onto the same curve."""
+        orbit = OrbitalMechanics()
+        t = 20000.0
+        assert orbit.get_solar_angle(t + orbit.mars_sol_length) == pytest.approx(
+            orbit.get_solar_angle(t), abs=0.1)
+
+    def test_solar_angle_constant_within_bucket(self):
+        """Ticks inside one resolution bucket share the same angle."""
+        orbit = OrbitalMechanics()
+        first = orbit.get_solar_angle(10000.0)
+
+        assert orbit.get_solar_angle(10009.9) == first
+        assert orbit.get_solar_angle(10010.0) != first
+        # Independent of which tick reached the bucket first
+        assert OrbitalMechanics().get_solar_angle(10005.0) == first
+
+    def test_series_match_scalar_methods(self):
+        """Array forms should agree with the per-tick methods."""
+        orbit = OrbitalMechanics()
+        times = np.arange(0.0, orbit.mars_sol_length, 500.0)
+        dusts = np.linspace(0.0, 1.0, times.size)
+
+        angles = orbit.solar_angle_series(times)
+        powers = orbit.calculate_solar_power_series(angles, dusts)
+
+        for k in range(0, times.size, 7):
+            assert angles[k] == pytest.approx(orbit.get_solar_angle(times[k]), abs=1e-4)
+            assert powers[k] == pytest.approx(
+                orbit.calculate_solar_power(angles[k], dusts[k]), abs=1e-4)
+
+    def test_sin_elevation_matches_power_model(self):
+        """The memoized sin should give the same power as calculate_solar_power."""
+        orbit = OrbitalMechanics()
+        for t in (0.0, 1234.0, 22190.0, 44000.0, 60000.0):
+            angle = orbit.get_solar_angle(t)
+            assert 100.0 * orbit.get_sin_solar_elevation(t) == pytest.approx(
+                orbit.calculate_solar_power(angle, 0.0))
+
+    def test_daylight_mask(self):
+        """The first half of the sol is day, the second half night."""
+        orbit = OrbitalMechanics()
+        mask = orbit.daylight_mask(np.array([100.0, 30000.0, 50000.0, 80000.0]))
+
+        assert mask.tolist() == [True, True, False, False]
+
+    def test_solar_power_matches_formula(self):
+        """Interpolated panel efficiency should track sin(angle) closely."""
+        orbit = OrbitalMechanics()
+        for i in range(901):
+            angle = i * 0.1
+            exact = 100.0 * math.sin(math.radians(angle)) * 0.75
+            assert orbit.calculate_solar_power(angle, 0.5) == pytest.approx(exact, abs=1e-4)
+
+
+class TestKernels:
+    """Test the per-tick kernels (compiled or pure-Python)."""
+
+    def test_power_thermal_tick(self):
+        """Kernel power figures should follow the terrain model; heater kicks in when cold."""
+        terrain = TerrainModel()
+        total, net, current, soc, voltage, cpu, bat, mot, chs, heater = (
+            _kernels.power_thermal_tick(
+                0.01, 1.0, 30.0, 12.0, _kernels.SURFACE_ROCKY, -60.0,
+                True, False, True, 50.0, 32.0, 0.0, -12.0, 0.0, 0.0,
+            )
+        )
+
+        expected = 15.0 + 40.0 * terrain.calculate_power_multiplier(12.0, 'rocky') + 25.0
+        assert total == pytest.approx(expected)
+        assert net == pytest.approx(30.0 - expected)
+        assert current == pytest.approx(net / 32.0)
+        assert soc == 0.0  # clamped
+        assert voltage == 28.0
+        assert bat == pytest.approx(-12.0 + 0.01 * (-60.0 + 12.0))
+        assert heater is True
+
+    def test_motion_tick(self):
+        """Kernel should drive along the heading, decay speed and set science flags."""
+        x, y, velocity, moving, science = _kernels.motion_tick(
+            2.0, 45.0, 0.0, 0.0, 90.0, 0.5, 80.0, True)
+        assert x == pytest.approx(0.0, abs=1e-12)
+        assert y == pytest.approx(1.0)
+        assert velocity == pytest.approx(0.49)
+        assert moving is True
+        assert science is False  # busy driving
+
+        # Low battery stops the rover, which frees it for daytime science
+        x, y, velocity, moving, science = _kernels.motion_tick(
+            1.0, 45.0, 3.0, 4.0, 0.0, 0.5, 10.0, True)
+        assert (x, y, velocity, moving, science) == (3.0, 4.0, 0.5, False, True)
+
+    def test_noise_pool_seeded_and_scaled(self):
+        """Noise should follow random.seed and have the requested sigma."""
+        samples = []
+        for _ in range(2):
+            pool = _kernels.NoisePool(chunk_size=1000)
+            random.seed(21)
+            samples.append([pool.gauss(2.0) for _ in range(5000)])
+
+        assert samples[0] == samples[1]
+        assert np.std(samples[0]) == pytest.approx(2.0, rel=0.05)
+
+    def test_spawn_events_from_mask(self):
+        """spawn_events should build one event per flagged hazard."""
+        hazards = HazardSystem()
+        hazards.reschedule()
+        before = hazards._next_slip
+        events = hazards.spawn_events(_kernels.HAZARD_RADIATION | _kernels.HAZARD_SLIP)
+
+        assert [e.type for e in events] == ['radiation_spike', 'slip']
+        assert hazards._next_slip > before
+
+
+class TestEnvironmentUpdate:
+    """Test a full environment tick."""
+
+    def test_update_advances_time(self, environment, rover_state):
+        """update() should advance mission and local time by dt."""
+        environment.update(1.0, rover_state)
+
+        assert rover_state.mission_time == 1.0
+        assert rover_state.local_time == 1.0
+
+    def test_clock_does_not_drift(self, environment, rover_state):
+        """Many small steps should add up exactly."""
+        for _ in range(1000):
+            environment.step(0.1, rover_state)
+
+        assert rover_state.clock_us == 100_000_000
+        assert rover_state.mission_time == 100.0
+        assert rover_state.local_time == 100.0
+
+    def test_sol_rollover(self, environment, rover_state):
+        """Crossing the end of a sol should bump sol and wrap local time."""
+        rover_state.clock_us = 88_774_500_000  # 0.5 s before the end of sol 0
+        environment.step(1.0, rover_state)
+
+        assert rover_state.sol == 1
+        assert rover_state.local_time == pytest.approx(0.5)
+        assert rover_state.mission_time == pytest.approx(88775.5)
+
+    def test_tilt_clamped_on_steep_slopes(self, environment, rover_state):
+        """Roll and pitch should never leave ±30° however long the rover climbs."""
+        random.seed(9)
+        environment.terrain.slope_angle = 30.0
+        rover_state.is_moving = True
+        rover_state.roll = rover_state.pitch = 29.9
+
+        for _ in range(500):
+            environment.step(1.0, rover_state)
+            assert -30.0 <= rover_state.roll <= 30.0
+            assert -30.0 <= rover_state.pitch <= 30.0
+        assert isinstance(rover_state.roll, float)
+
+    def test_timestep_constants_follow_dt(self, environment, rover_state):
+        """Changing dt between steps should refresh the cached constants."""
+        environment.step(1.0, rover_state)
+        environment.step(0.5, rover_state)
+
+        assert rover_state.clock_us == 1_500_000
+        assert environment._thermal_alpha == pytest.approx(-math.expm1(-0.5 / 300.0))
+
+    def test_thermal_step_independent_of_dt(self, environment, rover_state):
+        """One long tick should cool a part exactly as much as many short ones."""
+        def battery_temp_after(dt, ticks):
+            environment._set_timestep(dt)
+            temp = 20.0
+            for _ in range(ticks):
+                temp = _kernels.power_thermal_tick(
+                    environment._thermal_alpha, 0.0, 0.0, 0.0, 0, -60.0,
+                    False, False, False, 50.0, 32.0, 0.0, temp, 0.0, 0.0,
+                )[6]
+            return temp
+
+        assert battery_temp_after(600.0, 1) == pytest.approx(battery_temp_after(1.0, 600))
+        assert battery_temp_after(600.0, 1) == pytest.approx(-60.0 + 80.0 * math.exp(-2.0))
+
+    def test_env_info_refilled_in_place(self, environment, rover_state):
+        """update(out=...) should reuse the given dicts and match a fresh env_info."""
+        random.seed(12)
+        out = {}
+        refilled = []
+        for _ in range(3):
+            assert environment.update(1.0, rover_state, out=out) is out
+            refilled.append(json.loads(json.dumps(out)))
+        terrain = out['terrain']
+        environment.update(1.0, rover_state, out=out)
+        assert out['terrain'] is terrain
+
+        random.seed(12)
+        fresh_env, fresh_rover = Environment(), RoverState()
+        fresh = [fresh_env.update(1.0, fresh_rover) for _ in range(3)]
+        assert refilled == fresh
+
+    def test_env_info_hazards_are_json_dicts(self, environment, rover_state):
+        """Hazards in env_info should be plain dicts so frames serialize."""
+        environment.hazards.dust_devil_mtbe = 1.0
+        info = environment.update(5.0, rover_state)
+
+        assert info['new_hazards'][0]['type'] == 'dust_devil'
+        json.dumps(info)
+
+    def test_update_returns_env_info(self, environment, rover_state):
+        """update() should report solar and power figures for telemetry."""
+        info = environment.update(1.0, rover_state)
+
+        for key in ('terrain', 'solar_angle', 'available_solar',
+                    'power_consumption', 'net_power', 'ambient_temp', 'new_hazards'):
+            assert key in info
+
+    def test_step_returns_env_tick(self, environment, rover_state):
+        """step() should return a flat record matching update()'s dict."""
+        environment.terrain.surface_type = 'rocky'
+        tick = environment.step(1.0, rover_state)
+
+        assert tick.surface_type == 'rocky'
+        info = tick.to_env_info()
+        assert info['terrain']['surface_code'] == tick.surface_code
+        assert info['solar_angle'] == tick.solar_angle
+        assert info['new_hazards'] == [h._asdict() for h in tick.new_hazards]
+
+
+class TestCompileFor:
+    """Test the fixed-dt specialized step function."""
+
+    @staticmethod
+    def snapshot(rover):
+        """All rover fields, for exact comparison."""
+        return {name: getattr(rover, name) for name in RoverState.__slots__}
+
+    def test_matches_step_exactly(self):
+        """The generated function should reproduce step() tick for tick."""
+        results = []
+        for compiled in (False, True):
+            random.seed(21)
+            env = Environment()
+            env.terrain.slope_angle = 12.0
+            env.terrain.surface_type = 'loose'
+            env.hazards.dust_devil_mtbe = 300.0
+            env.hazards.slip_event_mtbe = 200.0
+            rover = RoverState()
+            rover.is_moving = True
+            rover.clock_us = 40_000_000_000  # spans sunset
+
+            step = env.compile_for(2.5) if compiled else None
+            ticks = []
+            for _ in range(3000):
+                tick = step(rover) if compiled else env.step(2.5, rover)
+                ticks.append(tick)
+            results.append((ticks, self.snapshot(rover)))
+
+        assert results[0][0] == results[1][0]
+        assert results[0][1] == results[1][1]
+        assert any(tick.new_hazards for tick in results[0][0])
+        assert any(tick.solar_angle == 0 for tick in results[0][0])
+
+    def test_solar_figures_follow_orbital_model(self):
+        """step() and compile_for() should use the same solar model, numba or not."""
+        reference = OrbitalMechanics()
+        env = Environment()
+        step = env.compile_for(7.0)
+        rovers = [RoverState(), RoverState()]
+        for rover in rovers:
+            rover.clock_us = 20_000_000_000
+
+        for _ in range(500):
+            ticks = [env.step(7.0, rovers[0]), step(rovers[1])]
+            for tick, rover in zip(ticks, rovers):
+                local_time = rover.local_time
+                assert tick.solar_angle == reference.get_solar_angle(local_time)
+                assert tick.available_solar == (
+                    100.0 * reference.get_sin_solar_elevation(local_time)
+                    * (1.0 - tick.dust_level * 0.5)
+                )
+
+
+class TestUpdateBatch:
+    """Test the Struct-of-Arrays multi-rover update."""
+
+    def test_deterministic_fields_match_step(self):
+        """Time, solar and power figures should agree with the scalar path."""
+        random.seed(4)
+        batch_env, env = Environment(), Environment()
+        rovers = [RoverState() for _ in range(3)]
+        for k, rover in enumerate(rovers):
+            rover.clock_us = (10_000 + 15_000 * k) * 1_000_000
+            rover.science_active = bool(k % 2)
+        states = RoverStateArrays.from_states(rovers)
+
+        result = batch_env.update_batch(1.0, states)
+
+        for k, rover in enumerate(rovers):
+            tick = env.step(1.0, rover)
+            assert states.clock_us[k] == rover.clock_us
+            assert states.local_time[k] == rover.local_time
+            assert result['solar_angle'][k] == pytest.approx(tick.solar_angle, abs=0.1)
+            assert result['power_consumption'][k] == tick.power_consumption
+            assert states.battery_soc[k] == pytest.approx(rover.battery_soc, abs=1e-3)
+
+    def test_cuda_path_falls_back_for_host_arrays(self):
+        """update_batch_cuda() on numpy-backed states should match update_batch()."""
+        results = []
+        for method in ('update_batch', 'update_batch_cuda'):
+            random.seed(6)
+            env = Environment()
+            states = RoverStateArrays(8)
+            results.append((getattr(env, method)(1.0, states), states))
+
+        (first, states_a), (second, states_b) = results
+        for name in first:
+            assert np.array_equal(first[name], second[name])
+        assert np.array_equal(states_a.battery_soc, states_b.battery_soc)
+
+    def test_night_ambient_statistics(self):
+        """Vectorized ambient noise should follow the scalar model's distribution."""
+        random.seed(8)
+        env = Environment()
+        states = RoverStateArrays(20000)
+        states.clock_us[:] = 60_000 * 1_000_000  # night
+
+        ambient = env.update_batch(1.0, states)['ambient_temp']
+
+        assert ambient.mean() == pytest.approx(-80.0, abs=0.2)
+        assert ambient.std() == pytest.approx(5.0, abs=0.2)
+
+
+class TestSimulate:
+    """Test the vectorized horizon simulation."""
+
+    def test_solar_matches_scalar_model(self, environment):
+        """Vectorized solar figures should match the per-tick methods."""
+        result = environment.simulate(88775.0, 600.0)
+        orbit = environment.orbit
+
+        for t, angle, power in zip(result['time'][::10], result['solar_angle'][::10],
+                                   result['available_solar'][::10]):
+            assert angle == pytest.approx(orbit.get_solar_angle(t), abs=1e-4)
+            assert power == pytest.approx(orbit.calculate_solar_power(angle, 0.0), abs=1e-4)
+
+    def test_hazard_table_sorted_and_bounded(self, environment):
+        """Hazard events should be time-ordered and inside the horizon."""
+        random.seed(1)
+        environment.hazards.dust_devil_mtbe = 600.0
+        result = environment.simulate(86400.0, 1.0, is_moving=True)
+        hazards = result['hazards']
+
+        assert len(hazards) > 100
+        assert (hazards['time'][1:] >= hazards['time'][:-1]).all()
+        assert hazards['time'].max() < 86400.0
+        assert set(hazards['type']) <= {'dust_devil', 'radiation_spike', 'slip'}
+
+    def test_simulate_is_reproducible(self, environment):
+        """Seeding the random module should fix the hazard schedule."""
+        random.seed(9)
+        first = environment.simulate(3600.0 * 72, 10.0)['hazards']
+        random.seed(9)
+        second = environment.simulate(3600.0 * 72, 10.0)['hazards']
+
+        assert (first == second).all()
+
+    def test_simulate_leaves_rover_untouched(self, environment, rover_state):
+        """simulate() is read-only with respect to rover state."""
+        environment.simulate(3600.0, 1.0)
+        assert rover_state.mission_time == 0.0
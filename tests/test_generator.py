@@ -0,0 +1,100 @@
+"""
+Unit tests for SimulationGenerator.
+
+Tests cover:
+    - Batched frame generation
+    - TelemetryFrame records
+    - Whole-mission record arrays
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / 'meridian3' / 'src'))
+
+from simulator.generator import SimulationGenerator
+
+
+class TestGenerateFramesBatched:
+    """Test generate_frames_batched()."""
+
+    def test_chunks_cover_the_mission(self):
+        """Chunks should hold every frame, the last one possibly short."""
+        sim = SimulationGenerator(timestep=1.0, max_duration=250.0, random_seed=3)
+        chunks = list(sim.generate_frames_batched(chunk=100))
+
+        assert [len(c['timestamp']) for c in chunks] == [100, 100, 50]
+        frame_ids = np.concatenate([c['frame_id'] for c in chunks])
+        assert np.array_equal(frame_ids, np.arange(250))
+        assert sim.frame_count == 250
+
+    def test_same_trajectory_as_generate_frames(self):
+        """Noise-free fields should match the per-frame generator exactly."""
+        frames = list(SimulationGenerator(
+            timestep=1.0, max_duration=300.0, random_seed=11
+        ).generate_frames())
+        chunks = list(SimulationGenerator(
+            timestep=1.0, max_duration=300.0, random_seed=11
+        ).generate_frames_batched(chunk=64, dtype=np.float64))
+
+        for key in ('timestamp', 'local_time', 'sol', 'x', 'y', 'velocity'):
+            batched = np.concatenate([c[key] for c in chunks])
+            assert np.array_equal(batched, [f[key] for f in frames])
+
+    def test_has_same_telemetry_fields(self):
+        """Each chunk should carry every numeric field of a frame."""
+        sim = SimulationGenerator(timestep=1.0, max_duration=5.0, random_seed=1)
+        frame = next(sim.generate_frames())
+        sim.reset()
+        chunk = next(sim.generate_frames_batched())
+
+        assert set(chunk) == set(frame) - {'env_info'}
+
+    def test_float32_readings_float64_timestamps(self):
+        """Readings default to float32; timestamps stay float64."""
+        sim = SimulationGenerator(timestep=0.1, max_duration=10.0, random_seed=2)
+        chunk = next(sim.generate_frames_batched())
+
+        assert chunk['battery_soc'].dtype == np.float32
+        assert chunk['cpu_temp'].dtype == np.float32
+        assert chunk['local_time'].dtype == np.float32
+        assert chunk['timestamp'].dtype == np.float64
+        assert chunk['frame_id'].dtype == np.int64
+
+
+class TestGenerateFrames:
+    """Test generate_frames()."""
+
+    def test_records_match_dict_frames(self):
+        """TelemetryFrame records should hold exactly the dict frames' values."""
+        frames = list(SimulationGenerator(
+            timestep=1.0, max_duration=50.0, random_seed=4
+        ).generate_frames())
+        records = list(SimulationGenerator(
+            timestep=1.0, max_duration=50.0, random_seed=4
+        ).generate_frames(records=True))
+
+        assert [record.as_dict() for record in records] == frames
+        assert list(frames[0]) == list(records[0]._fields)
+        assert records[-1].frame_id == 49
+        assert records[0].env_info.solar_angle == frames[0]['env_info']['solar_angle']
+
+
+class TestRunMissionArrays:
+    """Test run_mission_arrays()."""
+
+    def test_one_row_per_frame(self):
+        """Rows should follow frame order with the frames' field names."""
+        sim = SimulationGenerator(timestep=0.5, max_duration=10.0, random_seed=8)
+        mission = sim.run_mission_arrays(duration=20.0)
+
+        assert len(mission) == 40
+        assert np.array_equal(mission.frame_id, np.arange(40))
+        assert mission.timestamp[-1] == pytest.approx(19.5)
+        assert mission.dtype['battery_soc'] == np.float32
+        assert sim.max_duration == 10.0  # restored
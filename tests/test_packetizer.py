@@ -187,6 +187,15 @@ class TestChecksumCalculation:
 
         assert packetizer.verify_checksum(packet) is False
 
+    def test_verify_checksum_corrupted_packet_size(self, sample_frame):
+        """A tampered packet_size should fail the length sanity check."""
+        packetizer = Packetizer()
+        packet = packetizer.encode_frame(sample_frame)
+
+        packet['header']['packet_size'] += 1
+
+        assert packetizer.verify_checksum(packet) is False
+
 
 class TestPriorityAssignment:
     """Test packet priority calculation."""
@@ -16,7 +16,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / 'meridian3' / 'src'))
 
-from simulator.rover_state import RoverState
+from simulator.rover_state import ROVER_DTYPE, RoverState, RoverStateArrays
 
 
 class TestRoverStateInitialization:
@@ -83,6 +83,13 @@ class TestRoverStateInitialization:
         assert isinstance(rover.heater_active, bool)
         assert isinstance(rover.science_active, bool)
 
+    def test_every_slot_is_initialized(self):
+        """All declared slots should be set, and there is no instance __dict__."""
+        rover = RoverState()
+        for name in RoverState.__slots__:
+            getattr(rover, name)
+        assert not hasattr(rover, '__dict__')
+
 
 class TestRoverStateRepresentation:
     """Test RoverState string representation."""
@@ -213,6 +220,43 @@ class TestRoverStateModification:
         assert rover.is_charging != original_charging
 
 
+class TestRoverStateSerialization:
+    """Test to_dict/from_dict and pickle/copy support."""
+
+    def test_dict_round_trip(self):
+        """from_dict(to_dict()) should reproduce every field."""
+        rover = RoverState()
+        rover.x = 12.5
+        rover.battery_soc = 42.0
+        rover.is_moving = True
+
+        data = rover.to_dict()
+        assert list(data) == list(RoverState.__slots__)
+
+        restored = RoverState.from_dict(data)
+        assert restored.to_dict() == data
+
+    def test_from_dict_requires_every_field(self):
+        """A dict missing a field should be rejected."""
+        data = RoverState().to_dict()
+        del data['heading']
+        with pytest.raises(KeyError):
+            RoverState.from_dict(data)
+
+    def test_pickle_and_copy_round_trip(self):
+        """pickle and copy should go through __getstate__/__setstate__."""
+        import copy
+        import pickle
+
+        rover = RoverState()
+        rover.heading = 270.0
+        rover.motor_temp = 55.0
+
+        for clone in (pickle.loads(pickle.dumps(rover)), copy.copy(rover)):
+            assert clone is not rover
+            assert clone.__getstate__() == rover.__getstate__()
+
+
 class TestRoverStateEdgeCases:
     """Test edge cases and boundary conditions."""
 
@@ -259,3 +303,52 @@ class TestRoverStateEdgeCases:
         # Note: RoverState doesn't enforce wraparound, that's Environment's job
         rover.heading = 370.0
         assert rover.heading == 370.0
+
+
+class TestRoverStateArrays:
+    """Test the Struct-of-Arrays fleet container."""
+
+    def test_defaults_match_rover_state(self):
+        """Fresh arrays should hold RoverState's default values."""
+        states = RoverStateArrays(4)
+        rover = RoverState()
+
+        assert states.n == 4
+        assert (states.battery_soc == rover.battery_soc).all()
+        assert (states.heater_active == rover.heater_active).all()
+
+    def test_round_trip_through_arrays(self):
+        """Packing and unpacking should preserve every field."""
+        rover = RoverState()
+        rover.x, rover.sol, rover.heater_active = 12.5, 3, True
+
+        back = RoverStateArrays.from_states([RoverState(), rover]).to_state(1)
+
+        for name in RoverState.__slots__:
+            assert getattr(back, name) == getattr(rover, name)
+
+    def test_records_round_trip(self):
+        """Packed float32 records should restore every field to float32 precision."""
+        states = RoverStateArrays(3)
+        states.battery_soc[:] = [10.5, 55.25, 99.0]
+        states.clock_us[:] = 123_456_789_012
+        states.is_moving[1] = True
+
+        records = states.to_records()
+        back = RoverStateArrays.from_records(records)
+
+        assert records.dtype == ROVER_DTYPE
+        assert records.dtype.itemsize == 88
+        assert list(back.battery_soc) == [10.5, 55.25, 99.0]
+        assert (back.clock_us == states.clock_us).all()
+        assert list(back.is_moving) == [False, True, False]
+
+    def test_temps_block_shares_memory(self):
+        """Writes through temps or the named fields should be seen by both."""
+        states = RoverStateArrays(2)
+        states.temps[1] = -40.0
+        states.cpu_temp[0] = 55.0
+
+        assert list(states.battery_temp) == [-40.0, -40.0]
+        assert states.temps[0, 0] == 55.0
+        assert RoverStateArrays.from_states([RoverState()]).temps.shape == (4, 1)
@@ -14,6 +14,8 @@ import random
 import sys
 from pathlib import Path
 
+import numpy as np
+
 # Add src to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / 'meridian3' / 'src'))
@@ -63,6 +65,15 @@ class TestSensorBase:
         reading = sensor.apply_noise(true_value)
         assert reading == true_value
 
+    def test_apply_noise_follows_random_seed(self):
+        """Noise should repeat exactly after re-seeding the random module."""
+        runs = []
+        for _ in range(2):
+            random.seed(7)
+            sensor = SensorBase(name="Test", noise_stddev=1.0)
+            runs.append([sensor.apply_noise(0.0) for _ in range(10)])
+        assert runs[0] == runs[1]
+
     def test_apply_noise_with_bias(self):
         """Bias should add constant offset."""
         sensor = SensorBase(name="Test", noise_stddev=0.0, bias=5.0)
@@ -311,6 +322,31 @@ class TestSensorSuite:
         # Noise should make readings different
         assert frame1['roll'] != frame2['roll']
 
+    def test_read_all_batch_matches_read_all_fields(self):
+        """read_all_batch should return one array per read_all field."""
+        random.seed(5)
+        rover = RoverState()
+        suite = SensorSuite()
+        frame = suite.read_all(rover, 0.0)
+
+        n = 2000
+        states = {
+            name: np.full(n, getattr(rover, name))
+            for name in ('roll', 'pitch', 'heading', 'battery_voltage',
+                         'battery_current', 'battery_soc', 'solar_panel_voltage',
+                         'solar_panel_current', 'cpu_temp', 'battery_temp',
+                         'motor_temp', 'chassis_temp', 'x', 'y', 'z', 'velocity')
+        }
+        batch = suite.read_all_batch(states, np.arange(n, dtype=float))
+
+        assert set(batch) == set(frame)
+        assert all(len(values) == n for values in batch.values())
+        # Same noise level as the scalar sensors
+        assert abs(batch['battery_soc'].std() - 0.05) < 0.005
+        assert np.allclose(batch['cpu_temp'] * 10, np.round(batch['cpu_temp'] * 10))
+        # Drift carried over to the next read
+        assert suite.imu.drift != 0.0
+
 
 class TestSensorEdgeCases:
     """Test edge cases and unusual conditions."""
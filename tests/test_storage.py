@@ -0,0 +1,544 @@
+"""
+Unit tests for MissionStorage class.
+
+Tests cover:
+    - Single-frame and batched inserts
+    - Deferred commits and durability on close
+    - Time-range and latest-frame queries
+    - Anomaly queries
+"""
+
+import json
+import pytest
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / 'meridian3' / 'src'))
+
+from pipeline.storage import MissionStorage
+
+
+def make_frame(i, anomalies=None):
+    """Build a labeled frame like the AnomalyDetector produces."""
+    return {
+        'timestamp': float(i),
+        'frame_id': i,
+        'data': {
+            'battery_soc': 75.0 - i * 0.5,
+            'battery_temp': 20.0 + i * 0.1,
+        },
+        'metadata': {
+            'quality': 'high',
+            'anomalies': anomalies or [],
+        }
+    }
+
+
+def critical_anomaly(description='Battery critically low'):
+    """Build a single critical anomaly record."""
+    return {
+        'field': 'battery_soc',
+        'type': 'threshold',
+        'severity': 'critical',
+        'description': description,
+    }
+
+
+class TestStoreFrame:
+    """Test single-frame storage."""
+
+    def test_stored_frames_are_queryable(self, storage):
+        """Frames should be visible to queries before an explicit flush."""
+        for i in range(5):
+            storage.store_frame(make_frame(i))
+
+        frames = storage.query_frames(0.0, 10.0)
+        assert [f['frame_id'] for f in frames] == [0, 1, 2, 3, 4]
+
+    def test_close_flushes_pending_frames(self, temp_db_path):
+        """Frames written between commits should survive close()."""
+        storage = MissionStorage(temp_db_path, flush_interval=1000, flush_seconds=3600)
+        for i in range(3):
+            storage.store_frame(make_frame(i))
+        storage.close()
+
+        conn = sqlite3.connect(temp_db_path)
+        count = conn.execute("SELECT COUNT(*) FROM telemetry").fetchone()[0]
+        conn.close()
+        assert count == 3
+
+    def test_statistics_track_frames(self, storage):
+        """frames_stored and total_bytes_written should advance."""
+        storage.store_frame(make_frame(0))
+
+        stats = storage.get_statistics()
+        assert stats['frames_stored'] == 1
+        assert stats['total_bytes_written'] > 0
+
+    def test_bytes_written_matches_stored_blobs(self, storage):
+        """total_bytes_written should count the frame_data actually stored."""
+        storage.store_frames([make_frame(i) for i in range(5)])
+        storage.store_frame(make_frame(5, anomalies=[critical_anomaly()]))
+
+        stored = storage.conn.execute(
+            "SELECT SUM(LENGTH(frame_data)) FROM telemetry"
+        ).fetchone()[0]
+        assert storage.get_statistics()['total_bytes_written'] == stored
+
+
+class TestStoreFrames:
+    """Test batched storage."""
+
+    def test_store_frames_inserts_all(self, storage):
+        """store_frames should insert every frame in the batch."""
+        storage.store_frames([make_frame(i) for i in range(20)])
+
+        frames = storage.query_frames(0.0, 100.0)
+        assert len(frames) == 20
+        assert storage.get_statistics()['frames_stored'] == 20
+
+    def test_store_frames_links_anomalies(self, storage):
+        """Anomalies should reference the frame they were stored with."""
+        frames = [make_frame(i) for i in range(10)]
+        frames[7] = make_frame(7, anomalies=[critical_anomaly()])
+        storage.store_frames(frames)
+
+        anomalies = storage.get_anomalies(severity='critical')
+        assert len(anomalies) == 1
+        assert anomalies[0]['frame_id'] == 7
+
+    def test_ids_continue_across_reopen(self, temp_db_path):
+        """Row ids should not collide after reopening an existing database."""
+        storage = MissionStorage(temp_db_path)
+        storage.store_frames([make_frame(i) for i in range(3)])
+        storage.close()
+
+        storage = MissionStorage(temp_db_path)
+        storage.store_frame(make_frame(3, anomalies=[critical_anomaly()]))
+        anomalies = storage.get_anomalies()
+        storage.close()
+
+        assert anomalies[0]['frame_id'] == 3
+
+    def test_two_writers_share_a_database(self, temp_db_path):
+        """Ids should be assigned under the write lock, not cached per instance."""
+        a = MissionStorage(temp_db_path)
+        b = MissionStorage(temp_db_path)
+
+        a.store_frame(make_frame(0, anomalies=[critical_anomaly('From a')]))
+        a.flush()
+        b.store_frame(make_frame(1, anomalies=[critical_anomaly('From b')]))
+        b.flush()
+        a.store_frames([make_frame(2), make_frame(3, anomalies=[critical_anomaly('From a again')])])
+
+        anomalies = {x['description']: x['frame_id'] for x in b.get_anomalies()}
+        a.close()
+        b.close()
+
+        assert anomalies == {'From a': 0, 'From b': 1, 'From a again': 3}
+
+
+class TestConnectionTuning:
+    """Test PRAGMA configuration."""
+
+    def test_pragmas_follow_constructor_arguments(self, temp_db_path):
+        """Tuning kwargs should be applied to the connection."""
+        storage = MissionStorage(temp_db_path, busy_timeout_ms=1234, page_cache_kib=2048)
+        cursor = storage.conn.cursor()
+
+        assert cursor.execute("PRAGMA busy_timeout").fetchone()[0] == 1234
+        assert cursor.execute("PRAGMA cache_size").fetchone()[0] == -2048
+        assert cursor.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+        storage.close()
+
+
+class TestFrameEncoding:
+    """Test frame_data serialization."""
+
+    def test_compressed_frames_round_trip(self, temp_db_path):
+        """Frames stored with compression should read back unchanged."""
+        storage = MissionStorage(temp_db_path, frame_compression=1)
+        frame = make_frame(3)
+        storage.store_frame(frame)
+
+        assert storage.query_frames(0.0, 10.0) == [frame]
+        storage.close()
+
+    def test_legacy_text_rows_are_readable(self, storage):
+        """Rows written as plain JSON text should still decode."""
+        storage.conn.execute(
+            "INSERT INTO telemetry (mission_id, timestamp, frame_id, frame_data, created_at) "
+            "VALUES ('default', 1.0, 1, ?, 0.0)",
+            ('{"timestamp": 1.0, "frame_id": 1}',)
+        )
+
+        assert storage.query_frames(0.0, 10.0) == [{'timestamp': 1.0, 'frame_id': 1}]
+
+
+class TestTypedColumns:
+    """Test queries over the typed telemetry columns."""
+
+    def test_query_fields_returns_selected_columns(self, storage):
+        """query_fields should return only the requested fields."""
+        storage.store_frames([make_frame(i) for i in range(5)])
+
+        rows = storage.query_fields(['battery_soc'], 1.0, 2.0)
+        assert rows == [
+            {'timestamp': 1.0, 'battery_soc': 74.5},
+            {'timestamp': 2.0, 'battery_soc': 74.0},
+        ]
+
+    def test_get_latest_fields(self, storage):
+        """get_latest_fields should return the newest rows first."""
+        storage.store_frames([make_frame(i) for i in range(5)])
+
+        assert storage.get_latest_fields(['battery_soc'], n=2) == [
+            {'timestamp': 4.0, 'battery_soc': 73.0},
+            {'timestamp': 3.0, 'battery_soc': 73.5},
+        ]
+
+    def test_get_field_average(self, storage):
+        """get_field_average should aggregate in SQL."""
+        storage.store_frames([make_frame(i) for i in range(5)])
+
+        assert storage.get_field_average('battery_temp', 0.0, 4.0) == pytest.approx(20.2)
+
+    def test_unknown_field_rejected(self, storage):
+        """Field names outside the typed columns should raise ValueError."""
+        with pytest.raises(ValueError):
+            storage.query_fields(['frame_data; DROP TABLE telemetry'], 0.0, 1.0)
+
+    def test_non_numeric_values_stored_as_null(self, storage):
+        """Corrupted (non-numeric) values should not break the insert."""
+        frame = make_frame(0)
+        frame['data']['battery_soc'] = 'CORRUPTED'
+        storage.store_frame(frame)
+
+        assert storage.query_fields(['battery_soc'], 0.0, 0.0) == [
+            {'timestamp': 0.0, 'battery_soc': None}
+        ]
+
+
+class TestQueryPlans:
+    """Test that hot queries are served by an index."""
+
+    def _plan(self, storage, sql, params):
+        rows = storage.conn.execute("EXPLAIN QUERY PLAN " + sql, params).fetchall()
+        return " | ".join(row[3] for row in rows)
+
+    def test_get_latest_uses_descending_index(self, storage):
+        """get_latest's ORDER BY should not need a temporary sort."""
+        plan = self._plan(storage, """
+            SELECT frame_data FROM telemetry
+            WHERE mission_id = ?
+            ORDER BY timestamp DESC
+            LIMIT ?
+        """, ('default', 10))
+
+        assert 'idx_telemetry_latest_cover' in plan
+        assert 'TEMP B-TREE' not in plan
+
+    def test_latest_fields_use_covering_index(self, storage):
+        """Typed-column reads of the newest rows should skip the table."""
+        plan = self._plan(storage, """
+            SELECT timestamp, battery_soc, battery_temp FROM telemetry
+            WHERE mission_id = ?
+            ORDER BY timestamp DESC
+            LIMIT ?
+        """, ('default', 10))
+
+        assert 'COVERING INDEX idx_telemetry_latest_cover' in plan
+        assert 'TEMP B-TREE' not in plan
+
+    def test_get_anomalies_walks_newest_first(self, storage):
+        """Anomaly queries should read the timestamp index, not sort."""
+        plan = self._plan(storage, MissionStorage._SELECT_ANOMALIES_SQL,
+                          ('default', 'critical', 'critical', 10))
+
+        assert 'idx_anomalies_ts_desc' in plan
+        assert 'TEMP B-TREE' not in plan
+
+
+class TestGetLatest:
+    """Test latest-frame queries."""
+
+    def test_cache_hit_returns_newest_first(self, storage):
+        """Cached frames should come back newest first."""
+        for i in range(5):
+            storage.store_frame(make_frame(i))
+
+        assert [f['frame_id'] for f in storage.get_latest(3)] == [4, 3, 2]
+        assert storage.stats['cache_hits'] == 1
+
+
+class TestExportMission:
+    """Test streaming mission export."""
+
+    def test_export_is_valid_json(self, temp_db_path, tmp_path):
+        """Exported file should parse back to the stored frames in order."""
+        storage = MissionStorage(temp_db_path, frame_compression=1)
+        frames = [make_frame(i) for i in range(5)]
+        storage.store_frames(frames, mission_id='sol_1')
+        storage.store_frame(make_frame(99), mission_id='other')
+
+        output = tmp_path / 'export.json'
+        storage.export_mission(str(output), mission_id='sol_1')
+        storage.close()
+
+        exported = json.loads(output.read_text())
+        assert exported == {'mission_id': 'sol_1', 'frame_count': 5, 'frames': frames}
+
+    def test_export_empty_mission(self, storage, tmp_path):
+        """A mission with no frames should export an empty list."""
+        output = tmp_path / 'empty.json'
+        storage.export_mission(str(output), mission_id='missing')
+
+        exported = json.loads(output.read_text())
+        assert exported['frame_count'] == 0
+        assert exported['frames'] == []
+
+
+class TestTimestampCache:
+    """Test query_frames served from the recent-frame cache."""
+
+    def test_covered_range_served_from_cache(self, storage):
+        """Ranges inside the cached window should skip the database."""
+        for i in range(10):
+            storage.store_frame(make_frame(i))
+
+        frames = storage.query_frames(3.0, 6.0)
+        assert [f['frame_id'] for f in frames] == [3, 4, 5, 6]
+        assert storage.stats['cache_hits'] == 1
+
+    def test_range_outside_cache_uses_database(self, temp_db_path):
+        """Evicted frames should still be returned via SQL."""
+        storage = MissionStorage(temp_db_path, cache_size=3)
+        for i in range(10):
+            storage.store_frame(make_frame(i))
+
+        frames = storage.query_frames(0.0, 9.0)
+        assert [f['frame_id'] for f in frames] == list(range(10))
+        assert storage.stats['cache_hits'] == 0
+        storage.close()
+
+    def test_other_mission_not_served_from_cache(self, storage):
+        """The cache only answers queries for the mission it holds."""
+        for i in range(5):
+            storage.store_frame(make_frame(i), mission_id='a')
+        storage.store_frame(make_frame(2), mission_id='b')
+
+        assert storage.query_frames(1.0, 3.0, mission_id='a') == [
+            make_frame(1), make_frame(2), make_frame(3)
+        ]
+        assert storage.stats['cache_hits'] == 0
+
+    def test_existing_later_rows_disable_cache(self, temp_db_path):
+        """After reopening, rows not seen by this instance must not be skipped."""
+        storage = MissionStorage(temp_db_path)
+        storage.store_frames([make_frame(i) for i in range(5, 10)])
+        storage.close()
+
+        storage = MissionStorage(temp_db_path)
+        for i in range(3):
+            storage.store_frame(make_frame(i))
+        storage.store_frame(make_frame(7))
+
+        frames = storage.query_frames(0.0, 7.0)
+        assert [f['frame_id'] for f in frames] == [0, 1, 2, 5, 6, 7, 7]
+        storage.close()
+
+
+class TestBackgroundWrites:
+    """Test the optional writer thread."""
+
+    def test_queued_frames_visible_to_queries(self, temp_db_path):
+        """Queries should see every frame stored before them."""
+        storage = MissionStorage(temp_db_path, background_writes=True, cache_size=5)
+        for i in range(50):
+            storage.store_frame(make_frame(i, anomalies=[critical_anomaly()] if i == 20 else None))
+
+        assert len(storage.query_frames(0.0, 100.0)) == 50
+        assert storage.get_anomalies()[0]['frame_id'] == 20
+        storage.close()
+
+    def test_close_commits_queued_frames(self, temp_db_path):
+        """close() should drain the queue before returning."""
+        storage = MissionStorage(temp_db_path, background_writes=True)
+        storage.store_frames([make_frame(i) for i in range(100)])
+        storage.store_frame(make_frame(100))
+        storage.close()
+
+        conn = sqlite3.connect(temp_db_path)
+        count = conn.execute("SELECT COUNT(*) FROM telemetry").fetchone()[0]
+        conn.close()
+        assert count == 101
+
+    def test_writer_errors_surface_on_flush(self, temp_db_path):
+        """A failed background write should raise from flush()."""
+        storage = MissionStorage(temp_db_path, background_writes=True)
+        bad_anomaly = dict(critical_anomaly(), field=None)  # violates NOT NULL
+        storage.store_frame(make_frame(0, anomalies=[bad_anomaly]))
+
+        with pytest.raises(sqlite3.IntegrityError):
+            storage.flush()
+        storage.close()
+
+    def test_writer_death_surfaces_instead_of_hanging(self, temp_db_path, monkeypatch):
+        """If the writer thread dies, flush()/close() should raise, not block."""
+        configure = MissionStorage._configure_connection
+
+        def fail_in_writer(self, conn):
+            if threading.current_thread().name == 'mission-storage-writer':
+                raise sqlite3.OperationalError("database is locked")
+            configure(self, conn)
+
+        monkeypatch.setattr(MissionStorage, '_configure_connection', fail_in_writer)
+        storage = MissionStorage(temp_db_path, background_writes=True)
+        storage._writer_thread.join(timeout=5)
+
+        with pytest.raises(RuntimeError) as excinfo:
+            storage.store_frame(make_frame(0))
+        assert isinstance(excinfo.value.__cause__, sqlite3.OperationalError)
+
+        with pytest.raises(RuntimeError):
+            storage.flush()
+
+        # close() should still release the main connection
+        with pytest.raises(RuntimeError):
+            storage.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            storage.conn.execute("SELECT 1")
+
+
+class TestQueryFramesIter:
+    """Test the streaming query API."""
+
+    def test_iter_matches_query_frames(self, storage):
+        """query_frames_iter should yield the same frames as query_frames."""
+        storage.store_frames([make_frame(i) for i in range(30)])
+
+        assert list(storage.query_frames_iter(5.0, 25.0)) == storage.query_frames(5.0, 25.0)
+
+    def test_iter_survives_interleaved_queries(self, storage):
+        """Other queries made mid-iteration should not cut the scan short."""
+        storage.store_frames([make_frame(i) for i in range(10)])
+
+        seen = []
+        for frame in storage.query_frames_iter(0.0, 100.0):
+            storage.get_anomalies()
+            seen.append(frame['frame_id'])
+
+        assert seen == list(range(10))
+
+
+class TestGetAnomalies:
+    """Test anomaly queries."""
+
+    def test_severity_filter(self, storage):
+        """Only the requested severity should be returned; None means all."""
+        warning = dict(critical_anomaly(), severity='warning')
+        storage.store_frames([
+            make_frame(0, anomalies=[warning]),
+            make_frame(1, anomalies=[critical_anomaly()]),
+        ])
+
+        assert [a['severity'] for a in storage.get_anomalies(severity='warning')] == ['warning']
+        assert [a['severity'] for a in storage.get_anomalies()] == ['critical', 'warning']
+
+
+class TestAnomalyCache:
+    """Test get_anomalies served from the recent-anomaly cache."""
+
+    def test_recent_anomalies_served_from_cache(self, storage):
+        """Enough cached matches should skip the database."""
+        for i in range(10):
+            storage.store_frame(make_frame(i, anomalies=[critical_anomaly(f'low {i}')]))
+
+        anomalies = storage.get_anomalies(severity='critical', limit=3)
+        assert [a['frame_id'] for a in anomalies] == [9, 8, 7]
+        assert anomalies[0]['description'] == 'low 9'
+        assert storage.stats['cache_hits'] == 1
+
+    def test_too_few_cached_matches_fall_back_to_sql(self, storage):
+        """A short cache result may be missing older rows, so SQL answers."""
+        storage.store_frame(make_frame(0, anomalies=[critical_anomaly()]))
+
+        assert len(storage.get_anomalies(limit=10)) == 1
+        assert storage.stats['cache_hits'] == 0
+        assert storage.stats['cache_misses'] == 1
+
+    def test_cache_matches_sql(self, storage):
+        """Cached and SQL answers should agree."""
+        warning = dict(critical_anomaly(), severity='warning')
+        for i in range(20):
+            storage.store_frame(make_frame(i, anomalies=[warning, critical_anomaly()]))
+
+        cached = storage.get_anomalies(severity='warning', limit=5)
+        storage._ts_cache_mission = None  # force the SQL path
+        assert storage.get_anomalies(severity='warning', limit=5) == cached
+
+
+class TestSearchAnomalies:
+    """Test full-text search over anomaly descriptions."""
+
+    def test_search_matches_words(self, storage):
+        """Only anomalies whose description contains the word should match."""
+        storage.store_frames([
+            make_frame(0, anomalies=[critical_anomaly('Battery voltage low')]),
+            make_frame(1, anomalies=[critical_anomaly('Motor overheating')]),
+            make_frame(2, anomalies=[critical_anomaly('Voltage spike on bus')]),
+        ])
+
+        results = storage.search_anomalies('voltage')
+        assert [a['frame_id'] for a in results] == [2, 0]
+
+    @pytest.mark.parametrize('use_fts', [True, False])
+    def test_punctuated_queries_are_plain_words(self, storage, use_fts):
+        """Hyphens, quotes and operators should not be parsed as FTS5 syntax."""
+        storage.store_frames([
+            make_frame(0, anomalies=[critical_anomaly('Battery low')]),
+            make_frame(1, anomalies=[critical_anomaly('Motor overheat AND stall')]),
+        ])
+        storage._anomaly_fts = storage._anomaly_fts and use_fts
+
+        assert [a['frame_id'] for a in storage.search_anomalies('battery-low')] == [0]
+        assert [a['frame_id'] for a in storage.search_anomalies('"battery')] == [0]
+        assert [a['frame_id'] for a in storage.search_anomalies('motor AND overheat')] == [1]
+        assert storage.search_anomalies('motor OR battery') == []
+
+    def test_existing_anomalies_indexed_on_upgrade(self, temp_db_path):
+        """Anomalies stored before the search table existed should be found."""
+        storage = MissionStorage(temp_db_path)
+        storage.store_frame(make_frame(0, anomalies=[critical_anomaly('Dust storm')]))
+        storage.conn.execute("DROP TABLE anomalies_fts")
+        storage.close()
+
+        storage = MissionStorage(temp_db_path)
+        assert len(storage.search_anomalies('dust')) == 1
+        storage.close()
+
+
+class TestBackup:
+    """Test database snapshots."""
+
+    def test_backup_contains_pending_frames(self, temp_db_path, tmp_path):
+        """Frames not yet committed should still be in the snapshot."""
+        storage = MissionStorage(temp_db_path, flush_interval=1000, flush_seconds=3600)
+        for i in range(5):
+            storage.store_frame(make_frame(i, anomalies=[critical_anomaly()] if i == 3 else None))
+
+        snapshot_path = str(tmp_path / 'snapshots' / 'mission.db')
+        storage.backup(snapshot_path)
+        storage.close()
+
+        snapshot = MissionStorage(snapshot_path)
+        assert snapshot.query_frames(0.0, 10.0) == [
+            make_frame(i, anomalies=[critical_anomaly()] if i == 3 else None)
+            for i in range(5)
+        ]
+        assert snapshot.search_anomalies('critically')[0]['frame_id'] == 3
+        snapshot.close()